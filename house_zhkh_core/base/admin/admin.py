@@ -1,15 +1,64 @@
-from django.contrib import admin
+from datetime import date
+from typing import Dict, Iterable, Set, Tuple
 
+from django.conf import settings
+from django.contrib import admin, messages
+
+from base.admin.paginators import EstimatedCountPaginator
+from base.controllers.payment_controllers.billing_scope.billing_scope import BillingScope
+from base.controllers.payment_controllers.payment_processor.payment_processor import PaymentProcessor
+from base.controllers.payment_controllers.reading_change_log.reading_change_log import ReadingChangeLog
 from base.models.building import Building
 from base.models.counter import Counter, CounterHistory
 from base.models.flat import Flat
 from base.models.inhabitant import Inhabitant
+from base.models.payment import Payment
+from base.models.tariff import Tariff
+from base.models.water_meter import WaterMeter
+from base.tasks import CalculatePaymentsTask
+
+def enqueue_recalculation (
+    flat_months: Iterable[Tuple[date, int]],
+) -> int:
+    
+    """
+    Enqueue `CalculatePaymentsTask` runs for the given apartments, one per month and batch.
+
+    The apartments of each month are split into batches of `settings.BILLING_RECALCULATION_BATCH_SIZE`,
+    so selecting every row of a large changelist never produces an unbounded task message.
+
+    Args:
+        flat_months (Iterable[Tuple[date, int]]): `(month, flat id)` pairs to bill again.
+
+    Returns:
+        int: The number of enqueued tasks.
+    """
+    
+    months: Dict[date, Set[int]] = {}
+    for month, flat_id in flat_months:
+        months.setdefault(month, set()).add(flat_id)
+
+    batch_size = settings.BILLING_RECALCULATION_BATCH_SIZE
+    tasks = 0
+    
+    for month, flat_ids in months.items():
+        flat_ids = sorted(flat_ids)
+        for start in range(0, len(flat_ids), batch_size):
+            CalculatePaymentsTask.delay (
+                month.strftime('%Y-%m-01'),
+                scope=BillingScope(flat_ids=flat_ids[start:start + batch_size]).to_dict(),
+            )
+            tasks += 1
+
+    return tasks
+
 
 @admin.register(Building)
 class BuildingAdmin(admin.ModelAdmin):
     list_display = (
         'id', 
         'address',
+        'region',
     )
     search_fields = (
         'address',
@@ -26,12 +75,35 @@ class FlatAdmin(admin.ModelAdmin):
         'square',
     )
     list_filter = (
-        'building', 
         'flat_floor',
     )
+    list_select_related = (
+        'building',
+    )
     search_fields = (
-        'flat_number',
+        'building__address',
     )
+    autocomplete_fields = (
+        'building',
+    )
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_search_results (
+        self, 
+        request, 
+        queryset, 
+        search_term,
+    ):
+        
+        """
+        Search numeric terms by flat number and anything else by building address.
+        """
+        
+        if search_term.strip().isdigit():
+            return queryset.filter(flat_number=int(search_term)), False
+        
+        return super().get_search_results(request, queryset, search_term)
 
 
 @admin.register(Counter)
@@ -45,6 +117,14 @@ class CounterAdmin(admin.ModelAdmin):
     list_filter = (
         'counter_type',
     )
+    list_select_related = (
+        'flat__building',
+    )
+    raw_id_fields = (
+        'flat',
+    )
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(CounterHistory)
@@ -58,6 +138,14 @@ class CounterHistoryAdmin(admin.ModelAdmin):
     list_filter = (
         'date',
     )
+    list_select_related = (
+        'counter__flat__building',
+    )
+    raw_id_fields = (
+        'counter',
+    )
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
 
 
 @admin.register(Inhabitant)
@@ -68,6 +156,133 @@ class InhabitantAdmin(admin.ModelAdmin):
         'full_name', 
         'age',
     )
+    list_select_related = (
+        'flat__building',
+    )
+    raw_id_fields = (
+        'flat',
+    )
     search_fields = (
         'full_name',
     )
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
+@admin.register(Tariff)
+class TariffAdmin(admin.ModelAdmin):
+    list_display = (
+        'id', 
+        'tariff_type', 
+        'building', 
+        'region', 
+        'rate', 
+        'valid_from', 
+        'valid_to',
+    )
+    list_filter = (
+        'tariff_type', 
+        'region',
+    )
+    list_select_related = (
+        'building',
+    )
+    autocomplete_fields = (
+        'building',
+    )
+
+
+@admin.register(Payment)
+class PaymentAdmin(admin.ModelAdmin):
+    list_display = (
+        'id', 
+        'flat', 
+        'month', 
+        'water_fee', 
+        'common_area_fee', 
+        'total_fee',
+    )
+    list_select_related = (
+        'flat__building',
+    )
+    raw_id_fields = (
+        'flat',
+    )
+    date_hierarchy = 'month'
+    actions = (
+        'recalculate_payments', 
+        'void_payments',
+    )
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    @admin.action(description="Recalculate selected flats' payments")
+    def recalculate_payments (
+        self, 
+        request, 
+        queryset,
+    ) -> None:
+        
+        """
+        Enqueue billing of the selected payments' flats, in batches per month.
+        """
+        
+        tasks = enqueue_recalculation(queryset.values_list('month', 'flat_id'))
+        self.message_user(request, f'Enqueued {tasks} billing task(s).', messages.SUCCESS)
+
+    @admin.action(description='Void selected payments')
+    def void_payments (
+        self, 
+        request, 
+        queryset,
+    ) -> None:
+        
+        """
+        Delete the selected payments and credit their charges back to the balances.
+        """
+        
+        voided = PaymentProcessor().void_payments(queryset)
+        self.message_user(request, f'Voided {voided} payment(s).', messages.SUCCESS)
+
+
+@admin.register(WaterMeter)
+class WaterMeterAdmin(admin.ModelAdmin):
+    list_display = (
+        'id', 
+        'flat', 
+        'month', 
+        'reading', 
+        'updated_at',
+    )
+    list_select_related = (
+        'flat__building',
+    )
+    raw_id_fields = (
+        'flat',
+    )
+    date_hierarchy = 'month'
+    actions = (
+        'recalculate_payments',
+    )
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    @admin.action(description="Recalculate selected flats' payments")
+    def recalculate_payments (
+        self, 
+        request, 
+        queryset,
+    ) -> None:
+        
+        """
+        Enqueue billing of the selected readings' flats for the reading month and the
+        following month, whose consumption also depends on the reading.
+        """
+        
+        flat_months = [
+            (billed_month, flat_id)
+            for month, flat_id in queryset.values_list('month', 'flat_id')
+            for billed_month in (ReadingChangeLog.month_start(month), ReadingChangeLog.next_month(month))
+        ]
+        tasks = enqueue_recalculation(flat_months)
+        self.message_user(request, f'Enqueued {tasks} billing task(s).', messages.SUCCESS)
@@ -0,0 +1,48 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+class EstimatedCountPaginator(Paginator):
+    
+    """
+    Paginator that uses the planner's row estimate instead of `COUNT(*)` for large tables.
+
+    On PostgreSQL, an unfiltered changelist of a table (or of a partitioned table, summing
+    its partitions) with more than `ESTIMATE_THRESHOLD` estimated rows reports the estimate
+    from `pg_class.reltuples`. Filtered lists, small tables and other backends fall back to
+    an exact count.
+    """
+
+    ESTIMATE_THRESHOLD = 100000
+
+    @cached_property
+    def count (
+        self,
+    ) -> int:
+        
+        """
+        Return the estimated or exact number of objects.
+        """
+        
+        query = getattr(self.object_list, 'query', None)
+        if query is None or query.where:
+            return super().count
+
+        connection = connections[self.object_list.db]
+        if connection.vendor != 'postgresql':
+            return super().count
+
+        table = self.object_list.model._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute (
+                'SELECT COALESCE(SUM(GREATEST(c.reltuples, 0)), 0)::bigint FROM pg_class c '
+                'WHERE c.oid = %s::regclass '
+                'OR c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = %s::regclass)',
+                [table, table],
+            )
+            estimate = cursor.fetchone()[0]
+
+        if estimate < self.ESTIMATE_THRESHOLD:
+            return super().count
+
+        return estimate
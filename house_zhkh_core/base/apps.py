@@ -3,3 +3,16 @@ from django.apps import AppConfig
 class BaseConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'base'
+
+    def ready (
+        self,
+    ) -> None:
+        
+        """
+        Connect the meter reading signals that feed the billing change log, and register
+        the admin pages (`base.admin` is a namespace package, so admin autodiscovery does
+        not reach `base.admin.admin`).
+        """
+        
+        import base.admin.admin  # noqa: F401
+        import base.signals.signals  # noqa: F401
@@ -0,0 +1,113 @@
+from datetime import date
+from typing import Dict, List, Optional
+
+from django.db import connection, transaction
+
+class ReadingPartitioner:
+    
+    """
+    Maintains the yearly range partitions of the meter reading tables.
+
+    `CounterHistory` and `WaterMeter` are natively partitioned by year on PostgreSQL
+    (see migration 0005), so queries bounded by date only scan the partitions of the
+    requested period. Rows outside every yearly partition land in a DEFAULT partition;
+    `ensure_partitions` creates the partitions of the upcoming years and moves any such
+    rows out of the DEFAULT partition, so it is safe to run at any time (e.g. from cron).
+    """
+
+    TABLES: Dict[str, str] = {
+        'base_counterhistory': 'date',
+        'base_watermeter': 'month',
+    }
+
+    @staticmethod
+    def partition_name (
+        table: str, 
+        year: int,
+    ) -> str:
+        
+        """
+        Build the name of the yearly partition of a table.
+
+        Args:
+            table (str): The partitioned table.
+            year (int): The year covered by the partition.
+
+        Returns:
+            str: The partition table name.
+        """
+        
+        return f'{table}_y{year}'
+
+    @classmethod
+    def ensure_partitions (
+        cls, 
+        years_ahead: int = 1,
+        today: Optional[date] = None,
+    ) -> List[str]:
+        
+        """
+        Create the missing yearly partitions from the current year up to `years_ahead` years ahead.
+
+        Args:
+            years_ahead (int): How many years past the current one to prepare.
+            today (date, optional): The reference date. Defaults to today.
+
+        Returns:
+            List[str]: The names of the partitions that were created.
+
+        Raises:
+            ValueError: If the database is not PostgreSQL or `years_ahead` is negative.
+        """
+        
+        if connection.vendor != 'postgresql':
+            raise ValueError('Reading partitions require PostgreSQL.')
+        if years_ahead < 0:
+            raise ValueError('years_ahead must not be negative.')
+
+        current_year = (today or date.today()).year
+        created = []
+
+        for table, column in cls.TABLES.items():
+            for year in range(current_year, current_year + years_ahead + 1):
+                partition = cls.partition_name(table, year)
+                if cls._create_partition(table, column, partition, year):
+                    created.append(partition)
+
+        return created
+
+    @staticmethod
+    def _create_partition (
+        table: str, 
+        column: str, 
+        partition: str, 
+        year: int,
+    ) -> bool:
+        
+        """
+        Create and attach one yearly partition, moving its rows out of the DEFAULT partition.
+
+        Returns:
+            bool: True if the partition was created, False if it already existed.
+        """
+        
+        lower, upper = f'{year}-01-01', f'{year + 1}-01-01'
+
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute('SELECT to_regclass(%s)', [partition])
+            if cursor.fetchone()[0] is not None:
+                return False
+
+            cursor.execute(f'CREATE TABLE {partition} (LIKE {table} INCLUDING DEFAULTS)')
+            cursor.execute (
+                f'WITH moved AS ('
+                f'DELETE FROM {table}_default WHERE {column} >= %s AND {column} < %s RETURNING *'
+                f') INSERT INTO {partition} SELECT * FROM moved',
+                [lower, upper],
+            )
+            cursor.execute (
+                f"ALTER TABLE {table} ATTACH PARTITION {partition} "
+                f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+            )
+
+        return True
@@ -0,0 +1,198 @@
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, List
+
+from django.db import connection
+from django.db.models import Sum
+
+from base.models.balance_ledger_entry import BalanceLedgerEntry
+from base.models.flat import FlatHcsBalance
+from base.models.payment import Payment
+
+class BalanceLedger:
+    
+    """
+    Posts billing charges to `FlatHcsBalance` through an append-only `BalanceLedgerEntry` log.
+
+    The ledger is the source of truth for what has been charged: for each apartment and
+    month, billing posts only the difference between the new payment total and the sum of
+    the entries already posted, so re-billing a month never charges twice. Balances are
+    changed with one set-based `UPDATE ... SET balance = balance - amount FROM (VALUES ...)`
+    per batch, never by reading and writing back a value. Amounts are kept as `Decimal`
+    rounded to `CENT`; payment totals are converted when they are posted.
+
+    All methods must run inside the caller's transaction, together with the payment upsert.
+    `lock_balances` serializes concurrent billing workers on the balance rows of the batch.
+    """
+
+    CENT = Decimal('0.01')
+
+    @staticmethod
+    def lock_balances (
+        flat_ids: Iterable[int], 
+        month: date,
+    ) -> Dict[int, Decimal]:
+        
+        """
+        Lock the balances of a batch of apartments and return what was already charged for a month.
+
+        Missing balance rows are created first, so every apartment of the batch has a row to
+        lock. Rows are locked in id order, so concurrent workers cannot deadlock.
+
+        Args:
+            flat_ids (Iterable[int]): The apartments of the batch.
+            month (date): The billing month.
+
+        Returns:
+            Dict[int, Decimal]: The sum of the posted ledger entries keyed by flat id.
+                              Apartments without entries are absent.
+        """
+        
+        flat_ids = sorted(set(flat_ids))
+
+        FlatHcsBalance.objects.bulk_create (
+            [FlatHcsBalance(flat_id=flat_id) for flat_id in flat_ids],
+            ignore_conflicts=True,
+        )
+        list (
+            FlatHcsBalance.objects.select_for_update()
+            .filter(flat_id__in=flat_ids)
+            .order_by('flat_id')
+            .values_list('id', flat=True)
+        )
+
+        return dict (
+            BalanceLedgerEntry.objects.filter (
+                flat_id__in=flat_ids, 
+                month=month,
+            ).values('flat_id').annotate(posted=Sum('amount')).values_list('flat_id', 'posted')
+        )
+
+    @classmethod
+    def post_charges (
+        cls, 
+        payments: Iterable[Payment], 
+        posted: Dict[int, Decimal],
+    ) -> List[BalanceLedgerEntry]:
+        
+        """
+        Post the difference between each payment and the amount already charged for its month.
+
+        Args:
+            payments (Iterable[Payment]): The stored payments of the batch.
+            posted (Dict[int, Decimal]): The amounts already charged, as returned by `lock_balances`.
+
+        Returns:
+            List[BalanceLedgerEntry]: The posted entries (apartments whose charge did not change
+                                      get none).
+        """
+        
+        entries = []
+        
+        for payment in payments:
+            amount = cls.to_amount(payment.total_fee) - posted.get(payment.flat_id, 0)
+            if amount:
+                entries.append (
+                    BalanceLedgerEntry (
+                        flat_id=payment.flat_id,
+                        month=payment.month,
+                        payment_id=payment.pk,
+                        kind=BalanceLedgerEntry.Kind.CHARGE,
+                        amount=amount,
+                    )
+                )
+
+        cls.post(entries)
+        
+        return entries
+
+    @classmethod
+    def to_amount (
+        cls, 
+        value: float,
+    ) -> Decimal:
+        
+        """
+        Convert a fee to a ledger amount, rounded to the cent.
+
+        Args:
+            value (float): The fee, as stored on a `Payment`.
+
+        Returns:
+            Decimal: The amount.
+        """
+        
+        return Decimal(str(value)).quantize(cls.CENT)
+
+    @classmethod
+    def reverse (
+        cls, 
+        flat_ids: Iterable[int], 
+        month: date,
+    ) -> List[BalanceLedgerEntry]:
+        
+        """
+        Credit back everything charged to a set of apartments for a month.
+
+        Args:
+            flat_ids (Iterable[int]): The apartments whose charges are reversed.
+            month (date): The billing month.
+
+        Returns:
+            List[BalanceLedgerEntry]: The posted reversal entries.
+        """
+        
+        posted = cls.lock_balances(flat_ids, month)
+        entries = [
+            BalanceLedgerEntry (
+                flat_id=flat_id,
+                month=month,
+                kind=BalanceLedgerEntry.Kind.REVERSAL,
+                amount=-amount,
+            )
+            for flat_id, amount in posted.items() if amount
+        ]
+
+        cls.post(entries)
+        
+        return entries
+
+    @classmethod
+    def post (
+        cls, 
+        entries: List[BalanceLedgerEntry],
+    ) -> None:
+        
+        """
+        Append ledger entries and apply them to the balances in one statement.
+
+        Args:
+            entries (List[BalanceLedgerEntry]): The unsaved entries to post.
+        """
+        
+        if not entries:
+            return
+
+        BalanceLedgerEntry.objects.bulk_create(entries)
+
+        amounts: Dict[int, Decimal] = {}
+        for entry in entries:
+            amounts[entry.flat_id] = amounts.get(entry.flat_id, 0) + entry.amount
+
+        table = FlatHcsBalance._meta.db_table
+
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                values = ', '.join(['(%s, %s)'] * len(amounts))
+                cursor.execute (
+                    f'UPDATE {table} AS b '
+                    f'SET balance = b.balance - v.amount '
+                    f'FROM (VALUES {values}) AS v (flat_id, amount) '
+                    f'WHERE b.flat_id = v.flat_id',
+                    [value for item in amounts.items() for value in item],
+                )
+            else:
+                cursor.executemany (
+                    f'UPDATE {table} SET balance = balance - %s WHERE flat_id = %s',
+                    [(amount, flat_id) for flat_id, amount in amounts.items()],
+                )
@@ -0,0 +1,139 @@
+from datetime import date, datetime
+from typing import Tuple, Union
+
+class BillingPeriod:
+    
+    """
+    The calendar month a billing run is for.
+
+    The period resolves its month keys once: `month` is the first day of the billed month
+    (the value stored in the `month` field of `WaterMeter`, `MonthlyConsumption`, `Payment`
+    and the other monthly models), `previous_month` the first day of the month whose
+    readings the consumption is measured against, and `next_month` the exclusive upper bound
+    of the month. The entry points parse the requested month into a period and pass it on,
+    so every query of a run filters by the same keys, and readings of both months are loaded
+    with one range query over `reading_range`.
+    """
+
+    MONTH_FORMATS = ('%Y-%m', '%Y-%m-01')
+
+    def __init__ (
+        self, 
+        value: date,
+    ) -> None:
+        
+        """
+        Initialize the period of the month containing a date.
+
+        Args:
+            value (date): Any date or datetime within the month.
+        """
+        
+        if isinstance(value, datetime):
+            value = value.date()
+            
+        self.month: date = value.replace(day=1)
+        self.previous_month: date = (
+            self.month.replace(year=self.month.year - 1, month=12)
+            if self.month.month == 1
+            else self.month.replace(month=self.month.month - 1)
+        )
+        self.next_month: date = (
+            self.month.replace(year=self.month.year + 1, month=1)
+            if self.month.month == 12
+            else self.month.replace(month=self.month.month + 1)
+        )
+
+    @classmethod
+    def of (
+        cls, 
+        value: Union['BillingPeriod', date],
+    ) -> 'BillingPeriod':
+        
+        """
+        Return the period of a date, or the period itself.
+
+        Args:
+            value (BillingPeriod | date): A period, or any date or datetime within the month.
+
+        Returns:
+            BillingPeriod: The period of the month.
+        """
+        
+        if isinstance(value, cls):
+            return value
+        return cls(value)
+
+    @classmethod
+    def parse (
+        cls, 
+        value: str,
+    ) -> 'BillingPeriod':
+        
+        """
+        Parse a month sent as 'YYYY-MM' or 'YYYY-MM-01'.
+
+        Args:
+            value (str): The month.
+
+        Returns:
+            BillingPeriod: The period of the month.
+
+        Raises:
+            ValueError: If the value is not a month in one of the `MONTH_FORMATS`.
+        """
+        
+        for month_format in cls.MONTH_FORMATS:
+            try:
+                return cls(datetime.strptime(str(value), month_format))
+            except ValueError:
+                continue
+            
+        raise ValueError(f'Invalid month: {value!r}. Expected "YYYY-MM".')
+
+    @property
+    def key (
+        self,
+    ) -> str:
+        
+        """
+        The month as a 'YYYY-MM-01' string, as passed to `CalculatePaymentsTask`.
+
+        Returns:
+            str: The first day of the month in ISO format.
+        """
+        
+        return self.month.isoformat()
+
+    @property
+    def reading_range (
+        self,
+    ) -> Tuple[date, date]:
+        
+        """
+        The half-open date range of the readings the month's consumption is derived from.
+
+        Returns:
+            Tuple[date, date]: The first day of the previous month and of the next month.
+        """
+        
+        return self.previous_month, self.next_month
+
+    def __eq__ (
+        self, 
+        other: object,
+    ) -> bool:
+        
+        return isinstance(other, BillingPeriod) and self.month == other.month
+
+    def __hash__ (
+        self,
+    ) -> int:
+        
+        return hash(self.month)
+
+    def __repr__ (
+        self,
+    ) -> str:
+        
+        return f'BillingPeriod({self.key})'
@@ -0,0 +1,145 @@
+import cProfile
+import io
+import os
+import pstats
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from django.conf import settings
+
+from base.controllers.payment_controllers.request_flag.request_flag import RequestFlag
+
+class BillingProfiler:
+    
+    """
+    Captures cProfile statistics for billing runs.
+
+    Profiles are opt-in: a run is profiled only when the caller asks for it explicitly
+    or when the `BILLING_PROFILE` setting is enabled. Each profile is written as a
+    `.prof` file named after the run identifier (the Celery task id for asynchronous
+    runs), so it can later be inspected with `pstats`, `snakeviz` or the
+    `TaskProfileView` endpoint. Asynchronous runs are profiled on a Celery worker and
+    read back by the web service, so `BILLING_PROFILE_DIR` must point to storage shared
+    by both (the `billing_profiles` volume in docker-compose).
+    """
+
+    def __init__ (
+        self, 
+        profile_dir: Optional[str] = None,
+    ) -> None:
+        
+        """
+        Initialize the profiler with the directory where stats files are stored.
+
+        Args:
+            profile_dir (str, optional): Directory for `.prof` files. Defaults to
+                `settings.BILLING_PROFILE_DIR`.
+        """
+        
+        self.profile_dir = Path(profile_dir or settings.BILLING_PROFILE_DIR)
+
+    @staticmethod
+    def is_enabled (
+        requested: Any = False,
+    ) -> bool:
+        
+        """
+        Decide whether a billing run should be profiled.
+
+        Args:
+            requested (Any): The profiling flag supplied by the caller. Accepts booleans
+                as well as the string values sent in form or JSON payloads.
+
+        Returns:
+            bool: True if the caller requested profiling or it is enabled globally.
+        """
+        
+        return RequestFlag.parse(requested) or settings.BILLING_PROFILE
+
+    def stats_path (
+        self, 
+        run_id: str,
+    ) -> Path:
+        
+        """
+        Build the path of the stats file for the given run.
+
+        Args:
+            run_id (str): The identifier of the billing run.
+
+        Returns:
+            Path: The location of the `.prof` file.
+        """
+        
+        return self.profile_dir / f'{os.path.basename(run_id)}.prof'
+
+    @contextmanager
+    def profile (
+        self, 
+        run_id: str,
+    ) -> Iterator[cProfile.Profile]:
+        
+        """
+        Profile the enclosed block and dump the stats file on exit.
+
+        The stats are written even if the block raises, since failing runs are
+        usually the ones worth looking at.
+
+        Args:
+            run_id (str): The identifier used to name the stats file.
+
+        Yields:
+            cProfile.Profile: The active profiler.
+        """
+        
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield profiler
+        finally:
+            profiler.disable()
+            self.profile_dir.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(self.stats_path(run_id))
+
+    def top_functions (
+        self, 
+        run_id: str, 
+        limit: int = 20, 
+        sort_by: str = 'cumulative',
+    ) -> Optional[List[Dict[str, Any]]]:
+        
+        """
+        Return the most expensive functions recorded for a run.
+
+        Args:
+            run_id (str): The identifier of the profiled run.
+            limit (int): The maximum number of functions to return.
+            sort_by (str): The `pstats` sort key, e.g. 'cumulative' or 'tottime'.
+
+        Returns:
+            list: A list of dictionaries with the function location, call counts and
+                  timings, ordered by `sort_by`. Returns None if no profile exists.
+        """
+        
+        path = self.stats_path(run_id)
+        if not path.exists():
+            return None
+
+        stats = pstats.Stats(str(path), stream=io.StringIO())
+        stats.sort_stats(sort_by)
+
+        functions = []
+        for func in stats.fcn_list[:limit]:
+            primitive_calls, total_calls, total_time, cumulative_time, _ = stats.stats[func]
+            filename, line_number, function_name = func
+            functions.append (
+                {
+                    'function': f'{filename}:{line_number}({function_name})',
+                    'primitive_calls': primitive_calls,
+                    'total_calls': total_calls,
+                    'total_time': round(total_time, 6),
+                    'cumulative_time': round(cumulative_time, 6),
+                }
+            )
+        return functions
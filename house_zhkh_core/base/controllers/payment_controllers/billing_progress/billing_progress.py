@@ -0,0 +1,262 @@
+import json
+import time
+from typing import Any, Dict, Optional
+
+import redis
+from django.conf import settings
+
+class BillingProgressStore:
+    
+    """
+    Stores the progress of billing tasks in a compact Redis hash per task.
+
+    Each task owns a single hash (`billing:progress:<task_id>`) holding its state, the
+    processed and total flat counts, timestamps and, once finished, its JSON-encoded result.
+    Writes are pipelined and reads are a single `HGETALL`, so polling the status of a task
+    costs one round trip and never touches the Celery result backend.
+    """
+
+    KEY_PREFIX = 'billing:progress:'
+
+    def __init__ (
+        self, 
+        client: Optional[redis.Redis] = None,
+    ) -> None:
+        
+        """
+        Initialize the store.
+
+        Args:
+            client (redis.Redis, optional): The Redis client to use. Defaults to a client
+                for `settings.BILLING_PROGRESS_REDIS_URL`, created on first use.
+        """
+        
+        self._client = client
+        self.ttl = settings.BILLING_PROGRESS_TTL
+
+    @property
+    def client (
+        self,
+    ) -> redis.Redis:
+        
+        """
+        Return the Redis client, connecting lazily.
+
+        Returns:
+            redis.Redis: The Redis client.
+        """
+        
+        if self._client is None:
+            self._client = redis.Redis.from_url (
+                settings.BILLING_PROGRESS_REDIS_URL, 
+                decode_responses=True,
+            )
+        return self._client
+
+    def key (
+        self, 
+        task_id: str,
+    ) -> str:
+        
+        """
+        Build the Redis key of a task.
+
+        Args:
+            task_id (str): The Celery task id.
+
+        Returns:
+            str: The Redis hash key.
+        """
+        
+        return f'{self.KEY_PREFIX}{task_id}'
+
+    def _write (
+        self, 
+        task_id: str, 
+        fields: Dict[str, Any],
+    ) -> None:
+        
+        """
+        Write fields to the task hash and refresh its expiry in one round trip.
+
+        Args:
+            task_id (str): The Celery task id.
+            fields (dict): The hash fields to set.
+        """
+        
+        key = self.key(task_id)
+        pipeline = self.client.pipeline(transaction=False)
+        pipeline.hset(key, mapping=fields)
+        pipeline.expire(key, self.ttl)
+        pipeline.execute()
+
+    def start (
+        self, 
+        task_id: str,
+    ) -> None:
+        
+        """
+        Record that a task has started.
+
+        Args:
+            task_id (str): The Celery task id.
+        """
+        
+        now = time.time()
+        self._write (
+            task_id, 
+            {
+                'state': 'STARTED',
+                'current': 0,
+                'total': 0,
+                'started_at': now,
+                'updated_at': now,
+            },
+        )
+
+    def update (
+        self, 
+        task_id: str, 
+        current: int, 
+        total: int,
+    ) -> None:
+        
+        """
+        Record the progress of a running task.
+
+        Args:
+            task_id (str): The Celery task id.
+            current (int): The number of flats processed so far.
+            total (int): The total number of flats in the run.
+        """
+        
+        self._write (
+            task_id, 
+            {
+                'state': 'PROGRESS',
+                'current': current,
+                'total': total,
+                'updated_at': time.time(),
+            },
+        )
+
+    def finish (
+        self, 
+        task_id: str, 
+        state: str, 
+        result: Any = None,
+    ) -> None:
+        
+        """
+        Record the final state of a task.
+
+        Args:
+            task_id (str): The Celery task id.
+            state (str): The final state, 'SUCCESS' or 'FAILURE'.
+            result (Any): The JSON-serializable task result or error description.
+        """
+        
+        self._write (
+            task_id, 
+            {
+                'state': state,
+                'result': json.dumps(result),
+                'updated_at': time.time(),
+            },
+        )
+
+    def get (
+        self, 
+        task_id: str,
+    ) -> Optional[Dict[str, Any]]:
+        
+        """
+        Read the progress of a task, including its throughput and ETA.
+
+        Args:
+            task_id (str): The Celery task id.
+
+        Returns:
+            dict: The task progress with the keys 'state', 'current', 'total', 'result',
+                  'throughput' (flats per second) and 'eta' (seconds remaining, or None if
+                  unknown). Returns None if nothing is recorded for the task.
+        """
+        
+        fields = self.client.hgetall(self.key(task_id))
+        if not fields:
+            return None
+
+        current = int(fields.get('current', 0))
+        total = int(fields.get('total', 0))
+        started_at = float(fields.get('started_at', 0))
+        updated_at = float(fields.get('updated_at', started_at))
+        elapsed = updated_at - started_at
+
+        throughput = current / elapsed if elapsed > 0 else 0.0
+        eta = None
+        if fields['state'] == 'PROGRESS' and throughput > 0:
+            eta = round((total - current) / throughput, 1)
+
+        return {
+            'state': fields['state'],
+            'current': current,
+            'total': total,
+            'result': json.loads(fields['result']) if 'result' in fields else None,
+            'throughput': round(throughput, 2),
+            'eta': eta,
+        }
+
+
+class BillingProgressReporter:
+    
+    """
+    Progress callback that forwards billing progress to a `BillingProgressStore` at a bounded rate.
+
+    `PaymentProcessor` reports progress after every chunk of `PaymentProcessor.CHUNK_SIZE`
+    flats; the reporter only writes when at least `settings.BILLING_PROGRESS_INTERVAL` seconds
+    have passed since the previous write, plus once for the last chunk, so a run of any size
+    costs a bounded number of writes.
+    """
+
+    def __init__ (
+        self, 
+        store: BillingProgressStore, 
+        task_id: str, 
+        interval: Optional[float] = None,
+    ) -> None:
+        
+        """
+        Initialize the reporter.
+
+        Args:
+            store (BillingProgressStore): The store to write to.
+            task_id (str): The Celery task id.
+            interval (float, optional): The minimum number of seconds between writes.
+                Defaults to `settings.BILLING_PROGRESS_INTERVAL`.
+        """
+        
+        self.store = store
+        self.task_id = task_id
+        self.interval = settings.BILLING_PROGRESS_INTERVAL if interval is None else interval
+        self._last_write = 0.0
+
+    def __call__ (
+        self, 
+        current: int, 
+        total: int,
+    ) -> None:
+        
+        """
+        Report progress, writing to the store only if the interval has elapsed.
+
+        Args:
+            current (int): The number of flats processed so far.
+            total (int): The total number of flats in the run.
+        """
+        
+        now = time.monotonic()
+        if current < total and now - self._last_write < self.interval:
+            return
+
+        self._last_write = now
+        self.store.update(self.task_id, current, total)
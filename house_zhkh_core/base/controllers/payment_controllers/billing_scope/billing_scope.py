@@ -0,0 +1,225 @@
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.conf import settings
+from django.db.models import QuerySet
+
+from base.controllers.payment_controllers.reading_change_log.reading_change_log import ReadingChangeLog
+from base.controllers.payment_controllers.request_flag.request_flag import RequestFlag
+from base.models.billing_run import BillingRun
+from base.models.flat import Flat
+
+class BillingScope:
+    
+    """
+    Describes which flats a billing run should recalculate.
+
+    A scope is either the whole portfolio, an explicit set of buildings and/or flats, or
+    only the flats whose meter readings changed since the last successful portfolio run for
+    the month (incremental billing, as recorded by `ReadingChangeLog`). Scopes are passed
+    between the API views, the
+    `CalculatePaymentsTask` Celery task and `PaymentProcessor`, so they serialize to a
+    JSON-friendly dictionary.
+    """
+
+    def __init__ (
+        self, 
+        building_ids: Optional[Iterable[int]] = None, 
+        flat_ids: Optional[Iterable[int]] = None, 
+        changed_only: bool = False,
+    ) -> None:
+        
+        """
+        Initialize the scope.
+
+        Args:
+            building_ids (Iterable[int], optional): Restrict billing to flats of these buildings.
+            flat_ids (Iterable[int], optional): Restrict billing to these flats.
+            changed_only (bool): Restrict billing to flats marked dirty in the reading
+                change log since the last successful portfolio run for the month.
+        """
+        
+        self.building_ids: List[int] = sorted({int(i) for i in building_ids or ()})
+        self.flat_ids: List[int] = sorted({int(i) for i in flat_ids or ()})
+        self.changed_only = changed_only
+
+    @classmethod
+    def from_data (
+        cls, 
+        data: Optional[Dict[str, Any]],
+    ) -> 'BillingScope':
+        
+        """
+        Build a scope from a request payload or a serialized scope.
+
+        Accepts the keys 'building_id', 'building_ids', 'flat_id', 'flat_ids', 'changed_only'
+        and 'full'. Id lists may be given as lists or as comma-separated strings. Portfolio
+        runs are incremental unless 'full' is set or `settings.BILLING_INCREMENTAL` is disabled.
+
+        Args:
+            data (dict, optional): The request payload or the output of `to_dict`.
+
+        Returns:
+            BillingScope: The parsed scope.
+
+        Raises:
+            ValueError: If an id cannot be converted to an integer.
+        """
+        
+        data = data or {}
+        building_ids = cls._parse_ids(data, 'building_id', 'building_ids')
+        flat_ids = cls._parse_ids(data, 'flat_id', 'flat_ids')
+        
+        if 'changed_only' in data:
+            changed_only = RequestFlag.parse(data['changed_only'])
+        else:
+            changed_only = (
+                settings.BILLING_INCREMENTAL 
+                and not building_ids 
+                and not flat_ids 
+                and not RequestFlag.parse(data.get('full', False))
+            )
+
+        return cls (
+            building_ids=building_ids,
+            flat_ids=flat_ids,
+            changed_only=changed_only,
+        )
+
+    @staticmethod
+    def _parse_ids (
+        data: Dict[str, Any], 
+        single_key: str, 
+        list_key: str,
+    ) -> List[int]:
+        
+        """
+        Collect the ids given under a singular and a plural key.
+
+        Args:
+            data (dict): The request payload.
+            single_key (str): The key holding a single id.
+            list_key (str): The key holding a list of ids.
+
+        Returns:
+            List[int]: The ids found under both keys.
+        """
+        
+        values = []
+        for key in (single_key, list_key):
+            value = data.get(key)
+            if value in (None, ''):
+                continue
+            if isinstance(value, str):
+                value = value.split(',')
+            elif not isinstance(value, (list, tuple)):
+                value = [value]
+            values.extend(int(v) for v in value if str(v).strip())
+        return values
+
+    def to_dict (
+        self,
+    ) -> Dict[str, Any]:
+        
+        """
+        Serialize the scope for Celery task arguments and `BillingRun` records.
+
+        Returns:
+            dict: The scope as a JSON-serializable dictionary.
+        """
+        
+        return {
+            'building_ids': self.building_ids,
+            'flat_ids': self.flat_ids,
+            'changed_only': self.changed_only,
+        }
+
+    @property
+    def covers_portfolio (
+        self,
+    ) -> bool:
+        
+        """
+        Whether the scope considers every flat of the portfolio.
+
+        Returns:
+            bool: True for full and changed-only scopes.
+        """
+        
+        return not self.building_ids and not self.flat_ids
+
+    def is_small (
+        self,
+    ) -> bool:
+        
+        """
+        Whether the scope is small enough to be billed synchronously in a request.
+
+        A scope is small if it targets a single building, or no more than
+        `settings.BILLING_SYNC_MAX_FLATS` explicit flats.
+
+        Returns:
+            bool: True if the scope can be billed inside an HTTP request.
+        """
+        
+        if self.changed_only or self.covers_portfolio:
+            return False
+        if self.building_ids:
+            return len(self.building_ids) == 1 and not self.flat_ids
+        return len(self.flat_ids) <= settings.BILLING_SYNC_MAX_FLATS
+
+    def get_flats (
+        self, 
+        month_date: date,
+    ) -> QuerySet:
+        
+        """
+        Resolve the flats to bill for a month.
+
+        Args:
+            month_date (date): The billed month.
+
+        Returns:
+            QuerySet: The flats in scope.
+        """
+        
+        flats = Flat.objects.select_related('building')
+        
+        if self.building_ids:
+            flats = flats.filter(building_id__in=self.building_ids)
+        if self.flat_ids:
+            flats = flats.filter(id__in=self.flat_ids)
+        if self.changed_only:
+            flats = self._filter_changed(flats, month_date)
+            
+        return flats
+
+    @staticmethod
+    def _filter_changed (
+        flats: QuerySet, 
+        month_date: date,
+    ) -> QuerySet:
+        
+        """
+        Keep only flats marked dirty for the month in the reading change log.
+
+        If the month has never been billed successfully by a portfolio run, every flat is kept.
+
+        Args:
+            flats (QuerySet): The flats to filter.
+            month_date (date): The billed month.
+
+        Returns:
+            QuerySet: The flats with changed readings.
+        """
+        
+        last_run = BillingRun.objects.filter (
+            month=month_date, 
+            covers_portfolio=True, 
+            finished_at__isnull=False,
+        ).order_by('-started_at').first()
+        
+        if last_run is None:
+            return flats
+
+        return flats.filter(id__in=ReadingChangeLog.dirty_flat_ids(month_date))
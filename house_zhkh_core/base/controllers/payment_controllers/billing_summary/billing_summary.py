@@ -0,0 +1,78 @@
+from datetime import date
+from typing import Iterable, List
+
+from django.db.models import Count, Q, Sum
+
+from base.models.building_billing_summary import BuildingBillingSummary
+from base.models.flat import FlatHcsBalance
+from base.models.payment import Payment
+
+class BillingSummary:
+    
+    """
+    Maintains the `BuildingBillingSummary` table.
+
+    Summaries are refreshed incrementally: only the buildings touched by a billing run are
+    re-aggregated, with one grouped query over their payments of the month and one over
+    their balances, and the rows are upserted in a single statement.
+    """
+
+    @classmethod
+    def refresh (
+        cls, 
+        month: date, 
+        building_ids: Iterable[int],
+    ) -> List[BuildingBillingSummary]:
+        
+        """
+        Recompute the summaries of the given buildings for a month.
+
+        Args:
+            month (date): The billing month.
+            building_ids (Iterable[int]): The buildings to refresh.
+
+        Returns:
+            List[BuildingBillingSummary]: The refreshed summaries.
+        """
+        
+        building_ids = set(building_ids)
+        if not building_ids:
+            return []
+
+        totals = {
+            row['flat__building_id']: row
+            for row in Payment.objects.filter (
+                flat__building_id__in=building_ids, 
+                month=month,
+            ).values('flat__building_id').annotate (
+                flats_billed=Count('id'),
+                **{field: Sum(field) for field in Payment.FEE_FIELDS},
+            )
+        }
+        debts = dict (
+            FlatHcsBalance.objects.filter (
+                flat__building_id__in=building_ids,
+            ).values('flat__building_id').annotate (
+                debt=Sum('balance', filter=Q(balance__lt=0)),
+            ).values_list('flat__building_id', 'debt')
+        )
+
+        summaries = []
+        for building_id in building_ids:
+            row = totals.get(building_id, {})
+            summaries.append (
+                BuildingBillingSummary (
+                    building_id=building_id,
+                    month=month,
+                    flats_billed=row.get('flats_billed', 0),
+                    debt=-(debts.get(building_id) or 0),
+                    **{field: row.get(field) or 0 for field in Payment.FEE_FIELDS},
+                )
+            )
+
+        return BuildingBillingSummary.objects.bulk_create (
+            summaries,
+            update_conflicts=True,
+            unique_fields=['building', 'month'],
+            update_fields=['flats_billed', 'debt', 'refreshed_at', *Payment.FEE_FIELDS],
+        )
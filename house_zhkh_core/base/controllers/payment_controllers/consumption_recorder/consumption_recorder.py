@@ -0,0 +1,193 @@
+from datetime import date
+from typing import Dict, Iterable, Union
+
+from django.db import connection, router
+from django.db.models import QuerySet
+
+from base.controllers.payment_controllers.billing_period.billing_period import BillingPeriod
+from base.models.counter import Counter, CounterHistory
+from base.models.monthly_consumption import MonthlyConsumption
+from base.models.water_meter import WaterMeter
+
+class ConsumptionRecorder:
+    
+    """
+    Maintains the denormalized `MonthlyConsumption` table from `WaterMeter` readings.
+
+    A reading affects the consumption of its own month and of the following month, so
+    both rows are recomputed whenever a reading is recorded, corrected or removed. The
+    history can be rebuilt in one statement with `backfill`, which pairs readings with
+    `LAG` over the month.
+    """
+
+    BACKFILL_SQL = """
+        INSERT INTO base_monthlyconsumption (flat_id, month, reading, previous_reading, consumption)
+        SELECT flat_id, month, reading, previous_reading, reading - previous_reading
+        FROM (
+            SELECT
+                flat_id, month, reading,
+                LAG(reading) OVER w AS previous_reading,
+                LAG(month) OVER w AS previous_month
+            FROM (
+                SELECT DISTINCT ON (flat_id, month) flat_id, month, reading
+                FROM base_watermeter
+                ORDER BY flat_id, month, updated_at DESC
+            ) AS latest_readings
+            WINDOW w AS (PARTITION BY flat_id ORDER BY month)
+        ) AS readings
+        WHERE previous_month = (month - INTERVAL '1 month')::date
+        ON CONFLICT (month, flat_id) DO UPDATE SET
+            reading = EXCLUDED.reading,
+            previous_reading = EXCLUDED.previous_reading,
+            consumption = EXCLUDED.consumption
+    """
+
+    @staticmethod
+    def record (
+        flat_id: int, 
+        month: date,
+    ) -> None:
+        
+        """
+        Recompute the consumption rows affected by a reading of an apartment.
+
+        Loads the readings of the previous, current and next month in one query and
+        upserts (or removes, if a reading is missing) the rows of the current and next month.
+        The readings are read from the database they are written to rather than a replica,
+        as the reading that triggered the update may not have replicated yet.
+
+        Args:
+            flat_id (int): The apartment whose reading changed.
+            month (date): The month of the changed reading.
+        """
+        
+        period = BillingPeriod.of(month)
+        previous_month, month, next_month = period.previous_month, period.month, period.next_month
+
+        readings = dict (
+            WaterMeter.objects.using(router.db_for_write(WaterMeter)).filter (
+                flat_id=flat_id, 
+                month__range=(previous_month, next_month),
+            ).order_by('month', 'updated_at').values_list('month', 'reading')
+        )
+
+        for target_month, reference_month in ((month, previous_month), (next_month, month)):
+            reading = readings.get(target_month)
+            previous_reading = readings.get(reference_month)
+            
+            if reading is None or previous_reading is None:
+                MonthlyConsumption.objects.filter (
+                    flat_id=flat_id, 
+                    month=target_month,
+                ).delete()
+                continue
+
+            MonthlyConsumption.objects.update_or_create (
+                flat_id=flat_id,
+                month=target_month,
+                defaults={
+                    'reading': reading,
+                    'previous_reading': previous_reading,
+                    'consumption': reading - previous_reading,
+                },
+            )
+
+    @staticmethod
+    def consumption_for (
+        flats: Union[QuerySet, Iterable[int]], 
+        month: Union[BillingPeriod, date],
+    ) -> Dict[int, float]:
+        
+        """
+        Batch-load the consumption of a month for a set of apartments.
+
+        Args:
+            flats (QuerySet | Iterable[int]): The apartments (or their ids) to load.
+            month (BillingPeriod | date): The billing month.
+
+        Returns:
+            Dict[int, float]: The consumption keyed by flat id. Apartments without a
+                              consumption row for the month are absent.
+        """
+        
+        return dict (
+            MonthlyConsumption.objects.filter (
+                month=BillingPeriod.of(month).month, 
+                flat__in=flats,
+            ).values_list('flat_id', 'consumption')
+        )
+
+    @staticmethod
+    def counter_consumption_for (
+        flats: Union[QuerySet, Iterable[int]], 
+        month: Union[BillingPeriod, date],
+    ) -> Dict[int, Dict[int, float]]:
+        
+        """
+        Batch-load the gas, electricity and heat consumption of a month for a set of apartments.
+
+        The latest `CounterHistory` reading of each counter in the month is compared with its
+        latest reading in the previous month. Both months are read with a single date range
+        query, which only touches the matching partitions of the history table.
+
+        Args:
+            flats (QuerySet | Iterable[int]): The apartments (or their ids) to load.
+            month (BillingPeriod | date): The billing month.
+
+        Returns:
+            Dict[int, Dict[int, float]]: The consumption keyed by flat id and counter type.
+                Counters without a reading in either month are absent.
+        """
+        
+        period = BillingPeriod.of(month)
+        range_start, range_end = period.reading_range
+
+        readings = CounterHistory.objects.filter (
+            counter__flat__in=flats,
+            date__gte=range_start,
+            date__lt=range_end,
+        ).exclude (
+            counter__counter_type=Counter.CounterType.WATER,
+        ).order_by('date', 'id').values_list (
+            'counter_id', 
+            'counter__flat_id', 
+            'counter__counter_type', 
+            'date', 
+            'reading',
+        )
+
+        latest = {}
+        for counter_id, flat_id, counter_type, reading_date, reading in readings:
+            key = (counter_id, reading_date >= period.month)
+            latest[key] = (flat_id, counter_type, reading)
+
+        consumption: Dict[int, Dict[int, float]] = {}
+        for (counter_id, is_current), (flat_id, counter_type, reading) in latest.items():
+            if not is_current or (counter_id, False) not in latest:
+                continue
+            
+            flat_consumption = consumption.setdefault(flat_id, {})
+            flat_consumption[counter_type] = (
+                flat_consumption.get(counter_type, 0) + reading - latest[(counter_id, False)][2]
+            )
+
+        return consumption
+
+    @classmethod
+    def backfill (
+        cls,
+    ) -> int:
+        
+        """
+        Rebuild the consumption of every month from the full reading history.
+
+        Pairs each month's latest reading with the reading of the previous calendar month
+        using the `LAG` window function. Requires PostgreSQL.
+
+        Returns:
+            int: The number of rows inserted or updated.
+        """
+        
+        with connection.cursor() as cursor:
+            cursor.execute(cls.BACKFILL_SQL)
+            return cursor.rowcount
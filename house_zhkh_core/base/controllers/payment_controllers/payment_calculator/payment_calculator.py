@@ -1,83 +1,118 @@
-from datetime import datetime
+from typing import Dict, Optional
 
+from base.controllers.payment_controllers.tariff_table.tariff_table import TariffTable
 from base.models.flat import Flat
-from base.models.water_meter import WaterMeter
+from base.models.tariff import Tariff
 
 class PaymentCalculator:
     
     """
-    Responsible for calculating fees for a single apartment based on water consumption.
-    
-    This class computes water fees, common area fees, and total fees for a given apartment
-    by comparing water meter readings from the current and previous month. It uses the provided
-    water and common area rates to calculate the fees.
+    Responsible for calculating fees for a single apartment from its monthly consumption.
+
+    This class computes the water, gas, electricity, heat, common area and total fees of a
+    given apartment from the apartment's precomputed monthly consumption (see
+    `ConsumptionRecorder`). Rates are resolved from a `TariffTable` loaded once per billing
+    run; a utility without an applicable tariff is not charged.
     """
+    
+    # Metered utilities billed from counter readings, keyed by `Tariff.TariffType`.
+    COUNTER_FEES: Dict[int, str] = {
+        Tariff.TariffType.GAS: 'gas_fee',
+        Tariff.TariffType.ELECTRICITY: 'electricity_fee',
+        Tariff.TariffType.HEAT: 'heat_fee',
+    }
 
     def __init__ (
         self, 
-        water_rate: float, 
-        common_area_rate: float,
+        tariffs: TariffTable,
     ) -> None:
         
         """
-        Initialize the PaymentCalculator with specified rates.
+        Initialize the PaymentCalculator with the tariffs of the billed month.
 
         Args:
-            water_rate (float): The cost per unit of water consumption.
-            common_area_rate (float): The cost per unit area for common areas.
+            tariffs (TariffTable): The tariffs valid for the billed month.
         """
         
-        self.water_rate = water_rate
-        self.common_area_rate = common_area_rate
+        self.tariffs = tariffs
 
     def calculate_fees (
         self, 
         apartment: Flat, 
-        month_date: datetime, 
-        prev_month_date: datetime,
+        water_consumption: Optional[float], 
+        counter_consumption: Optional[Dict[int, float]] = None,
     ) -> dict:
         
         """
-        Calculate water, common area, and total fees for the provided apartment.
+        Calculate the utility, common area, and total fees for the provided apartment.
 
-        This method retrieves the water meter readings for the current and previous month
-        for the given apartment. It computes the water consumption as the difference between
-        the current and previous readings. The water fee is calculated by multiplying the 
-        consumption by the water rate. The common area fee is calculated by multiplying the 
-        apartment's square footage by the common area rate. The total fee is the sum of both.
-        If either the current or previous water reading is missing, the method returns None.
+        The water consumption is the difference between the current and previous month's
+        readings, as maintained in `MonthlyConsumption`. Each utility fee is calculated by
+        multiplying the consumption by the utility's tariff; negative consumption is not
+        charged. The common area fee is calculated by multiplying the apartment's square
+        footage by the common area tariff. The total fee is the sum of all fees.
+        If the water consumption is unknown (a reading is missing), the method returns None.
 
         Args:
             apartment (Flat): The apartment for which to calculate fees.
-            month_date (datetime): The datetime object representing the current month.
-            prev_month_date (datetime): The datetime object representing the previous month.
+            water_consumption (float, optional): The apartment's water consumption for the month,
+                or None if either month's reading is missing.
+            counter_consumption (Dict[int, float], optional): The apartment's gas, electricity
+                and heat consumption for the month, keyed by counter type.
 
         Returns:
             dict: A dictionary containing:
                 - 'water_fee': Calculated fee for water consumption.
+                - 'gas_fee', 'electricity_fee', 'heat_fee': Calculated fees for metered utilities.
                 - 'common_area_fee': Calculated fee for common area usage.
-                - 'total_fee': Sum of water and common area fees.
-            If either the current or previous water reading is missing, returns None.
+                - 'total_fee': Sum of all fees.
+            If the water consumption is unknown, returns None.
         """
         
-        current_reading = WaterMeter.objects.filter (
-            apartment=apartment, month=month_date
-        ).first()
-        previous_reading = WaterMeter.objects.filter (
-            apartment=apartment, month=prev_month_date
-        ).first()
-
-        if not current_reading or not previous_reading:
+        if water_consumption is None:
             return None
 
-        water_consumption = current_reading.reading - previous_reading.reading
-        water_fee = self.water_rate * water_consumption if water_consumption > 0 else 0
-        common_area_fee = self.common_area_rate * apartment.square
-        total_fee = water_fee + common_area_fee
+        counter_consumption = counter_consumption or {}
 
-        return {
-            'water_fee': water_fee,
-            'common_area_fee': common_area_fee,
-            'total_fee': total_fee,
+        fees = {
+            'water_fee': self._fee(apartment, Tariff.TariffType.WATER, water_consumption),
         }
+        for tariff_type, fee_name in self.COUNTER_FEES.items():
+            fees[fee_name] = self._fee (
+                apartment, 
+                tariff_type, 
+                counter_consumption.get(tariff_type, 0),
+            )
+        fees['common_area_fee'] = self._fee (
+            apartment, 
+            Tariff.TariffType.COMMON_AREA, 
+            apartment.square,
+        )
+        fees['total_fee'] = sum(fees.values())
+
+        return fees
+
+    def _fee (
+        self, 
+        apartment: Flat, 
+        tariff_type: int, 
+        quantity: float,
+    ) -> float:
+        
+        """
+        Multiply a quantity by the apartment's tariff for a utility.
+
+        Returns:
+            float: The fee, or 0 if the quantity is not positive or no tariff applies.
+        """
+        
+        rate = self.tariffs.rate (
+            tariff_type, 
+            apartment.building_id, 
+            apartment.building.region,
+        )
+
+        if rate is None or quantity <= 0:
+            return 0
 
+        return rate * quantity
@@ -0,0 +1,121 @@
+import math
+
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from django.conf import settings
+from django.db.models import QuerySet
+
+from base.models.payment import Payment
+
+class PaymentDiff:
+    
+    """
+    In-memory comparison of freshly calculated payments with the stored payments of a month.
+
+    The stored fees of every apartment in scope are loaded with a single query at the start
+    of a billing run. Calculated payments are then compared field by field, so a run only
+    writes the payments whose fees actually changed, and a dry run can report the
+    differences without writing anything.
+    """
+
+    def __init__ (
+        self, 
+        stored: Optional[Dict[int, Tuple[float, ...]]] = None,
+    ) -> None:
+        
+        """
+        Initialize the diff.
+
+        Args:
+            stored (Dict[int, Tuple[float, ...]], optional): The stored fees of the month,
+                keyed by flat id, in the order of `Payment.FEE_FIELDS`.
+        """
+        
+        self.stored: Dict[int, Tuple[float, ...]] = stored or {}
+
+    @classmethod
+    def load (
+        cls, 
+        flats: Union[QuerySet, Iterable[int]], 
+        month: date,
+    ) -> 'PaymentDiff':
+        
+        """
+        Load the stored fees of a month for a set of apartments.
+
+        Args:
+            flats (QuerySet | Iterable[int]): The apartments (or their ids) in scope.
+            month (date): The first day of the billed month.
+
+        Returns:
+            PaymentDiff: The diff against the stored payments.
+        """
+        
+        rows = Payment.objects.filter (
+            month=month, 
+            flat__in=flats,
+        ).values_list('flat_id', *Payment.FEE_FIELDS)
+        
+        return cls({row[0]: tuple(row[1:]) for row in rows})
+
+    def changes (
+        self, 
+        payment: Payment,
+    ) -> Optional[Dict[str, Any]]:
+        
+        """
+        Compare a calculated payment with the stored payment of its apartment.
+
+        Args:
+            payment (Payment): The unsaved, calculated payment.
+
+        Returns:
+            dict: None if the stored fees are equal, otherwise a dictionary with:
+                - 'flat_id': The apartment of the payment.
+                - 'status': 'created' if the month has no stored payment yet, else 'updated'.
+                - 'changes': The differing fees, as {field: {'old': ..., 'new': ...}}.
+        """
+        
+        stored = self.stored.get(payment.flat_id)
+        changes = {}
+        
+        for index, field in enumerate(Payment.FEE_FIELDS):
+            old = stored[index] if stored is not None else None
+            new = getattr(payment, field)
+            if old is None or not math.isclose(old, new, rel_tol=0, abs_tol=1e-9):
+                changes[field] = {'old': old, 'new': new}
+
+        if not changes:
+            return None
+
+        return {
+            'flat_id': payment.flat_id,
+            'status': 'created' if stored is None else 'updated',
+            'changes': changes,
+        }
+
+    @staticmethod
+    def summarize (
+        changes: List[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        
+        """
+        Build the report of a dry run.
+
+        At most `settings.BILLING_DIFF_LIMIT` differences are listed, so the report of a
+        portfolio-wide tariff change stays small enough for the progress store and a response.
+
+        Args:
+            changes (List[dict]): The differences returned by `changes`.
+
+        Returns:
+            dict: A dictionary containing the number of changed payments ('changed'),
+                  the listed differences ('diff') and whether the list was cut ('truncated').
+        """
+        
+        return {
+            'changed': len(changes),
+            'diff': changes[:settings.BILLING_DIFF_LIMIT],
+            'truncated': len(changes) > settings.BILLING_DIFF_LIMIT,
+        }
@@ -1,80 +1,269 @@
-from datetime import datetime
+from datetime import date
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set, Union
 
+from django.db import transaction
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from base.models.billing_run import BillingRun
 from base.models.flat import Flat
 from base.models.payment import Payment
+from base.controllers.payment_controllers.balance_ledger.balance_ledger import BalanceLedger
+from base.controllers.payment_controllers.billing_period.billing_period import BillingPeriod
+from base.controllers.payment_controllers.billing_scope.billing_scope import BillingScope
+from base.controllers.payment_controllers.billing_summary.billing_summary import BillingSummary
+from base.controllers.payment_controllers.consumption_recorder.consumption_recorder import ConsumptionRecorder
 from base.controllers.payment_controllers.payment_calculator.payment_calculator import PaymentCalculator
+from base.controllers.payment_controllers.payment_diff.payment_diff import PaymentDiff
+from base.controllers.payment_controllers.reading_change_log.reading_change_log import ReadingChangeLog
+from base.controllers.payment_controllers.tariff_table.tariff_table import TariffTable
 
 class PaymentProcessor:
     
     """
-    Processes payment calculations for all apartments.
+    Processes payment calculations for the apartments of a billing scope.
 
-    This class retrieves all apartments from the database, calculates their respective 
-    fees using `PaymentCalculator`, and creates `Payment` records for the given month.
+    This class retrieves the apartments of a `BillingScope` (all apartments by default),
+    calculates their respective fees using `PaymentCalculator`, stores `Payment` records
+    for the given month and records the run as a `BillingRun`. Successful runs consume the
+    `ReadingChangeLog` marks of the apartments they billed. Rates come from the `Tariff`
+    table, loaded once per run into a `TariffTable`. Charges are posted to the apartments'
+    balances through the `BalanceLedger`, in the same transaction as the payments, and the
+    `BuildingBillingSummary` rows of the billed buildings are refreshed at the end of the run.
+    Only payments whose fees changed are written; `diff_payments` reports those changes
+    without writing anything. It is shared by the synchronous `PaymentCalculationView` fast path and the
+    `CalculatePaymentsTask` Celery task, so both entry points bill identically.
     """
 
-    def __init__ (
+    CHUNK_SIZE = 500
+
+    def process_payments (
         self, 
-        water_rate: float, 
-        common_area_rate: float,
-    ) -> None:
+        month_date: Union[BillingPeriod, date], 
+        scope: Optional[BillingScope] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> list:
         
         """
-        Initializes the payment processor with specified rates.
+        Iterates through the apartments in scope, calculates fees using `PaymentCalculator`,
+        and stores the `Payment` records that changed in the database.
+
+        The month is resolved to a `BillingPeriod` once, and every query of the run uses
+        its month keys. The tariffs of the month, the monthly water consumption (from `MonthlyConsumption`)
+        and the gas, electricity and heat consumption (from `CounterHistory`) of all apartments
+        in scope, and their stored payments for the month, are loaded up front, one query each.
+        For each apartment, this method:
+        1. Looks up the apartment's consumption for the month.
+        2. Calculates the utility and common area fees.
+        3. Compares them with the stored payment (see `PaymentDiff`) and skips the apartment
+           if they are equal, so re-running a month only touches the corrected payments.
+        4. Creates or updates the `Payment` record for the month, so re-running a month
+           does not duplicate payments.
+        5. Posts the change of its charge for the month to its balance.
+        6. Collects and returns a list of stored `Payment` objects.
+
+        Apartments are stored in chunks of `CHUNK_SIZE`; each chunk's payments and balance
+        postings are written in one transaction.
 
         Args:
-            water_rate (float): The cost per unit of water consumption.
-            common_area_rate (float): The cost per unit area for common area maintenance.
+            month_date (BillingPeriod | date): The billed month, as a period or any date within it.
+            scope (BillingScope, optional): The apartments to bill. Defaults to all apartments.
+            on_progress (Callable, optional): Called as `on_progress(current, total)` after
+                each chunk of apartments is stored.
+
+        Returns:
+            list: A list of the created or updated `Payment` objects.
+                  If no payments changed or could be calculated, an empty list is returned.
         """
         
-        self.calculator = PaymentCalculator (
-            water_rate, 
-            common_area_rate,
+        period = BillingPeriod.of(month_date)
+        month_date = period.month
+        scope = scope or BillingScope()
+        billing_run = BillingRun.objects.create (
+            month=month_date,
+            scope=scope.to_dict(),
+            covers_portfolio=scope.covers_portfolio,
         )
+        
+        flat_queryset = scope.get_flats(month_date)
+        flats = list(flat_queryset)
+        diff = PaymentDiff.load(flat_queryset, month_date)
+        stored_payments = []
+        
+        for payments in self._calculate_payments(period, flat_queryset, flats, on_progress):
+            payments = [payment for payment in payments if diff.changes(payment) is not None]
+            if payments:
+                stored_payments.extend(self._store_payments(payments, month_date))
 
-    def process_payments (
+        BillingSummary.refresh (
+            month_date, 
+            {apartment.building_id for apartment in flats},
+        )
+        ReadingChangeLog.clear (
+            month_date, 
+            billing_run.started_at, 
+            flat_ids=None if scope.covers_portfolio else [apartment.id for apartment in flats],
+        )
+        billing_run.finished_at = timezone.now()
+        billing_run.save(update_fields=['finished_at'])
+                
+        return stored_payments
+
+    def diff_payments (
         self, 
-        month_date: datetime, 
-        prev_month_date: datetime,
-    ) -> list:
+        month_date: Union[BillingPeriod, date], 
+        scope: Optional[BillingScope] = None,
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> List[Dict[str, Any]]:
         
         """
-        Iterates through all apartments, calculates fees using `PaymentCalculator`,
-        and creates `Payment` records in the database.
+        Calculates the payments of the apartments in scope without storing anything.
 
-        For each apartment, this method:
-        1. Retrieves water meter readings for the current and previous months.
-        2. Calculates water and common area fees.
-        3. Creates a `Payment` record in the database.
-        4. Collects and returns a list of created `Payment` objects.
+        Runs the same calculation as `process_payments` and compares the fees with the stored
+        payments of the month in memory. No payment, balance, summary, `BillingRun` or
+        `ReadingChangeLog` mark is written, so a dry run can be used to review the effect of
+        a tariff change before billing it.
 
         Args:
-            month_date (datetime): The current month as a datetime object.
-            prev_month_date (datetime): The previous month as a datetime object.
+            month_date (BillingPeriod | date): The billed month, as a period or any date within it.
+            scope (BillingScope, optional): The apartments to compare. Defaults to all apartments.
+            on_progress (Callable, optional): Called as `on_progress(current, total)` after
+                each chunk of apartments is compared.
 
         Returns:
-            list: A list of created `Payment` objects.
-                  If no payments are created due to missing data, an empty list is returned.
+            List[dict]: The differences of the payments that would be created or updated,
+                        as returned by `PaymentDiff.changes`.
+        """
+        
+        period = BillingPeriod.of(month_date)
+        scope = scope or BillingScope()
+        flat_queryset = scope.get_flats(period.month)
+        flats = list(flat_queryset)
+        diff = PaymentDiff.load(flat_queryset, period.month)
+        changes = []
+        
+        for payments in self._calculate_payments(period, flat_queryset, flats, on_progress):
+            for payment in payments:
+                change = diff.changes(payment)
+                if change is not None:
+                    changes.append(change)
+
+        return changes
+
+    def _calculate_payments (
+        self, 
+        period: BillingPeriod, 
+        flat_queryset: QuerySet, 
+        flats: List[Flat], 
+        on_progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Iterator[List[Payment]]:
+        
+        """
+        Calculate the unsaved payments of the apartments in scope, in chunks of `CHUNK_SIZE`.
+
+        Progress is reported once the caller has handled a chunk.
+
+        Args:
+            period (BillingPeriod): The billed month.
+            flat_queryset (QuerySet): The apartments in scope, used to batch-load their consumption.
+            flats (List[Flat]): The apartments in scope.
+            on_progress (Callable, optional): Called as `on_progress(current, total)` after
+                each chunk.
+
+        Yields:
+            List[Payment]: The calculated payments of a chunk. Apartments whose fees cannot
+                           be calculated are left out.
         """
         
-        flats = Flat.objects.all()
-        created_payments = []
+        total_flats = len(flats)
+        calculator = PaymentCalculator(TariffTable.load(period.month))
+        consumption = ConsumptionRecorder.consumption_for(flat_queryset, period)
+        counter_consumption = ConsumptionRecorder.counter_consumption_for(flat_queryset, period)
+        
+        for start in range(0, total_flats, self.CHUNK_SIZE):
+            chunk = flats[start:start + self.CHUNK_SIZE]
+            payments = []
+            
+            for apartment in chunk:
+                fees = calculator.calculate_fees (
+                    apartment, 
+                    consumption.get(apartment.id),
+                    counter_consumption.get(apartment.id),
+                )
+                if fees is not None:
+                    payments.append(Payment(flat=apartment, month=period.month, **fees))
+
+            yield payments
+
+            if on_progress:
+                on_progress(start + len(chunk), total_flats)
+
+    def _store_payments (
+        self, 
+        payments: List[Payment], 
+        month_date: date,
+    ) -> List[Payment]:
+        
+        """
+        Upsert a chunk of payments and post their charges, in one transaction.
+
+        Args:
+            payments (List[Payment]): The unsaved payments of the chunk.
+            month_date (date): The first day of the billed month.
+
+        Returns:
+            List[Payment]: The stored payments.
+        """
         
-        for apartment in flats:
-            fees = self.calculator.calculate_fees (
-                apartment, 
-                month_date, 
-                prev_month_date,
+        with transaction.atomic():
+            posted = BalanceLedger.lock_balances (
+                [payment.flat_id for payment in payments], 
+                month_date,
             )
-            if fees is None:
-                continue
-
-            payment = Payment.objects.create (
-                apartment=apartment,
-                month=month_date,
-                water_fee=fees['water_fee'],
-                common_area_fee=fees['common_area_fee'],
-                total_fee=fees['total_fee'],
+            payments = Payment.objects.bulk_create (
+                payments,
+                update_conflicts=True,
+                unique_fields=['flat', 'month'],
+                update_fields=Payment.FEE_FIELDS,
             )
-            created_payments.append(payment)
-        return created_payments
\ No newline at end of file
+            BalanceLedger.post_charges(payments, posted)
+
+        return payments
+
+    def void_payments (
+        self, 
+        payments: QuerySet,
+    ) -> int:
+        
+        """
+        Delete payments and credit their charges back to the apartments' balances.
+
+        Payments are voided per month in one transaction: the posted charges of the affected
+        apartments are reversed in the `BalanceLedger`, the payments are removed with a single
+        `DELETE`, and the summaries of the affected buildings are refreshed.
+
+        Args:
+            payments (QuerySet): The payments to void.
+
+        Returns:
+            int: The number of voided payments.
+        """
+        
+        months: Dict[date, Set[int]] = {}
+        buildings: Dict[date, Set[int]] = {}
+        
+        for month, flat_id, building_id in payments.values_list('month', 'flat_id', 'flat__building_id'):
+            months.setdefault(month, set()).add(flat_id)
+            buildings.setdefault(month, set()).add(building_id)
+
+        voided = 0
+        for month, flat_ids in months.items():
+            with transaction.atomic():
+                BalanceLedger.reverse(flat_ids, month)
+                voided += Payment.objects.filter (
+                    month=month, 
+                    flat_id__in=flat_ids,
+                ).delete()[1].get(Payment._meta.label, 0)
+                BillingSummary.refresh(month, buildings[month])
+
+        return voided
@@ -0,0 +1,135 @@
+from datetime import date, datetime
+from typing import Iterable, Optional
+
+from django.db.models import QuerySet
+from django.utils import timezone
+
+from base.controllers.payment_controllers.billing_period.billing_period import BillingPeriod
+from base.models.dirty_flat import DirtyFlat
+
+class ReadingChangeLog:
+    
+    """
+    Tracks which apartments need to be billed again because their meter readings changed.
+
+    The log is backed by the `DirtyFlat` table. Readings saved through the ORM are marked
+    automatically by the signals in `base.signals.signals`; bulk ingestion paths that bypass
+    model signals must call `mark` themselves.
+    """
+
+    @staticmethod
+    def mark (
+        flat_ids: Iterable[int], 
+        months: Iterable[date],
+    ) -> None:
+        
+        """
+        Mark apartments dirty for the given billing months.
+
+        Existing marks are refreshed rather than duplicated, so a change made while a billing
+        run is in progress is not lost when that run clears the marks it has consumed.
+
+        Args:
+            flat_ids (Iterable[int]): The apartments whose readings changed.
+            months (Iterable[date]): The billing months affected by the change.
+        """
+        
+        now = timezone.now()
+        months = {ReadingChangeLog.month_start(month) for month in months}
+        
+        DirtyFlat.objects.bulk_create (
+            [
+                DirtyFlat(flat_id=flat_id, month=month, marked_at=now)
+                for flat_id in set(flat_ids)
+                for month in months
+            ],
+            update_conflicts=True,
+            unique_fields=['flat', 'month'],
+            update_fields=['marked_at'],
+        )
+
+    @staticmethod
+    def dirty_flat_ids (
+        month: date,
+    ) -> QuerySet:
+        
+        """
+        Return the apartments marked dirty for a billing month.
+
+        Args:
+            month (date): The billing month.
+
+        Returns:
+            QuerySet: A values queryset of flat ids, usable as an `id__in` subquery.
+        """
+        
+        return DirtyFlat.objects.filter (
+            month=ReadingChangeLog.month_start(month),
+        ).values('flat_id')
+
+    @staticmethod
+    def clear (
+        month: date, 
+        until: datetime, 
+        flat_ids: Optional[Iterable[int]] = None,
+    ) -> int:
+        
+        """
+        Remove the marks consumed by a successful billing run.
+
+        Only marks made before the run started are removed; apartments changed while the
+        run was in progress stay dirty for the next run.
+
+        Args:
+            month (date): The billed month.
+            until (datetime): The start time of the billing run.
+            flat_ids (Iterable[int], optional): Restrict clearing to these apartments, for
+                runs that did not cover the whole portfolio.
+
+        Returns:
+            int: The number of marks removed.
+        """
+        
+        marks = DirtyFlat.objects.filter (
+            month=ReadingChangeLog.month_start(month), 
+            marked_at__lte=until,
+        )
+        if flat_ids is not None:
+            marks = marks.filter(flat_id__in=flat_ids)
+            
+        deleted, _ = marks.delete()
+        return deleted
+
+    @staticmethod
+    def month_start (
+        value: date,
+    ) -> date:
+        
+        """
+        Normalize a date or datetime to the first day of its month.
+
+        Args:
+            value (date): Any date or datetime within the month.
+
+        Returns:
+            date: The first day of the month.
+        """
+        
+        return BillingPeriod.of(value).month
+
+    @staticmethod
+    def next_month (
+        value: date,
+    ) -> date:
+        
+        """
+        Return the first day of the month following the given date.
+
+        Args:
+            value (date): Any date or datetime within the month.
+
+        Returns:
+            date: The first day of the next month.
+        """
+        
+        return BillingPeriod.of(value).next_month
@@ -0,0 +1,32 @@
+from typing import Any
+
+class RequestFlag:
+    
+    """
+    Interprets the boolean options of billing requests and task arguments.
+
+    Flags arrive as JSON booleans, as form strings or as Celery task arguments, so all
+    callers ('profile', 'dry_run', 'changed_only', 'full') share one parser.
+    """
+
+    TRUE_VALUES = ('1', 'true', 'yes', 'on')
+
+    @classmethod
+    def parse (
+        cls, 
+        value: Any,
+    ) -> bool:
+        
+        """
+        Interpret a boolean flag sent as a JSON boolean or a form string.
+
+        Args:
+            value (Any): The raw flag value.
+
+        Returns:
+            bool: The flag value.
+        """
+        
+        if isinstance(value, str):
+            return value.strip().lower() in cls.TRUE_VALUES
+        return bool(value)
@@ -0,0 +1,95 @@
+from datetime import date
+from typing import Dict, Iterable, Optional, Tuple
+
+from django.db.models import Q
+
+from base.models.tariff import Tariff
+
+class TariffTable:
+    
+    """
+    In-memory lookup of the tariffs valid for a billing month.
+
+    The table is loaded with a single query at the start of a billing run, so resolving
+    the rate of any utility for any apartment costs no further queries. Building-specific
+    tariffs take precedence over region-wide ones, which take precedence over global ones;
+    among tariffs of the same level, the one that started last wins.
+    """
+
+    def __init__ (
+        self, 
+        tariffs: Iterable[Tariff] = (),
+    ) -> None:
+        
+        """
+        Builds the lookup from tariffs valid for one month.
+
+        Args:
+            tariffs (Iterable[Tariff]): The tariffs valid for the month, ordered by `valid_from`.
+        """
+        
+        self.building_rates: Dict[Tuple[int, int], float] = {}
+        self.region_rates: Dict[Tuple[int, str], float] = {}
+        self.global_rates: Dict[int, float] = {}
+
+        for tariff in tariffs:
+            if tariff.building_id is not None:
+                self.building_rates[(tariff.tariff_type, tariff.building_id)] = tariff.rate
+            elif tariff.region:
+                self.region_rates[(tariff.tariff_type, tariff.region)] = tariff.rate
+            else:
+                self.global_rates[tariff.tariff_type] = tariff.rate
+
+    @classmethod
+    def load (
+        cls, 
+        month_date: date,
+    ) -> 'TariffTable':
+        
+        """
+        Load the tariffs valid for a billing month.
+
+        Args:
+            month_date (date): The billed month.
+
+        Returns:
+            TariffTable: The lookup for the month.
+        """
+        
+        tariffs = Tariff.objects.filter (
+            Q(valid_to__isnull=True) | Q(valid_to__gte=month_date),
+            valid_from__lte=month_date,
+        ).order_by('valid_from', 'id').only (
+            'tariff_type', 
+            'building_id', 
+            'region', 
+            'rate',
+        )
+        
+        return cls(tariffs)
+
+    def rate (
+        self, 
+        tariff_type: int, 
+        building_id: Optional[int] = None, 
+        region: str = '',
+    ) -> Optional[float]:
+        
+        """
+        Resolve the rate of a utility for a building.
+
+        Args:
+            tariff_type (int): The `Tariff.TariffType` to resolve.
+            building_id (int, optional): The building of the billed apartment.
+            region (str): The region of that building.
+
+        Returns:
+            float: The applicable rate, or None if no tariff applies.
+        """
+        
+        if (tariff_type, building_id) in self.building_rates:
+            return self.building_rates[(tariff_type, building_id)]
+        if region and (tariff_type, region) in self.region_rates:
+            return self.region_rates[(tariff_type, region)]
+        
+        return self.global_rates.get(tariff_type)
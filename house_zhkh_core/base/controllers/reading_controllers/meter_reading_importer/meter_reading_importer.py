@@ -0,0 +1,278 @@
+import csv
+import io
+import math
+from datetime import date
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from base.controllers.payment_controllers.reading_change_log.reading_change_log import ReadingChangeLog
+from base.models.counter import Counter, CounterHistory
+
+class MeterReadingImporter:
+    
+    """
+    Streams meter readings from a vendor CSV file into `CounterHistory` and `Counter`.
+
+    The file is read in chunks of `chunk_size` rows with a `counter_id,reading` layout
+    (a header row is skipped). Rows are validated against an in-memory map of the existing
+    counters, so validation costs no queries. Water counters are rejected: water is billed
+    from `WaterMeter` readings, which this file format cannot express. Each valid chunk is
+    written in one transaction: the readings are appended to `CounterHistory` with `COPY`,
+    and the counters are updated with a single set-based `UPDATE ... FROM (VALUES ...)` that
+    rolls `current_reading` into `last_reading`. Other database backends fall back to batched
+    inserts and updates.
+
+    Imports are idempotent: counters that already have a `CounterHistory` reading for the
+    reading date are skipped, so re-running a file, or resuming after a partial failure,
+    neither duplicates readings nor rolls the counters over twice.
+
+    Bulk writes bypass model signals, so the apartments of each chunk are marked in the
+    `ReadingChangeLog` explicitly.
+    """
+
+    DEFAULT_CHUNK_SIZE = 10000
+    MAX_REPORTED_ERRORS = 100
+
+    def __init__ (
+        self, 
+        reading_date: Optional[date] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        
+        """
+        Initializes the importer.
+
+        Args:
+            reading_date (date, optional): The date recorded for the readings. Defaults to today.
+            chunk_size (int): The number of rows written per transaction.
+
+        Raises:
+            ValueError: If `chunk_size` is not positive.
+        """
+        
+        if chunk_size < 1:
+            raise ValueError('chunk_size must be positive.')
+
+        self.reading_date = reading_date or timezone.localdate()
+        self.chunk_size = chunk_size
+
+    def import_file (
+        self, 
+        stream: TextIO,
+    ) -> Dict[str, Any]:
+        
+        """
+        Import all readings of a CSV stream.
+
+        Invalid rows (unknown or water counter, malformed or negative reading, counter repeated
+        in the file) are rejected and reported; valid rows are imported, unless their counter
+        already has a reading for the reading date.
+
+        Args:
+            stream (TextIO): The CSV file, opened in text mode.
+
+        Returns:
+            Dict[str, Any]: A report with:
+                - 'imported': The number of imported readings.
+                - 'skipped': The number of readings already imported for the reading date.
+                - 'rejected': The number of invalid rows.
+                - 'errors': Up to `MAX_REPORTED_ERRORS` `(line, message)` tuples.
+        """
+        
+        counters = {
+            counter_id: (flat_id, counter_type)
+            for counter_id, flat_id, counter_type in Counter.objects.values_list (
+                'id', 
+                'flat_id', 
+                'counter_type',
+            ).iterator()
+        }
+        seen_counters = set()
+        report = {
+            'imported': 0,
+            'skipped': 0,
+            'rejected': 0,
+            'errors': [],
+        }
+
+        for rows in self._chunks(csv.reader(stream)):
+            chunk = []
+            
+            for line, row in rows:
+                try:
+                    counter_id, reading = self._parse_row(row)
+                    if counter_id not in counters:
+                        raise ValueError(f'Unknown counter {counter_id}')
+                    if counters[counter_id][1] == Counter.CounterType.WATER:
+                        raise ValueError(f'Water counter {counter_id}; water is billed from WaterMeter readings')
+                    if counter_id in seen_counters:
+                        raise ValueError(f'Duplicate reading for counter {counter_id}')
+                except ValueError as e:
+                    report['rejected'] += 1
+                    if len(report['errors']) < self.MAX_REPORTED_ERRORS:
+                        report['errors'].append((line, str(e)))
+                    continue
+
+                seen_counters.add(counter_id)
+                chunk.append((counter_id, reading))
+
+            if chunk:
+                imported = self._write_chunk(chunk, counters)
+                report['imported'] += imported
+                report['skipped'] += len(chunk) - imported
+
+        return report
+
+    def _chunks (
+        self, 
+        reader: Iterable[List[str]],
+    ) -> Iterator[List[Tuple[int, List[str]]]]:
+        
+        """
+        Yield the CSV rows in chunks of `(line number, row)` pairs, skipping blank lines
+        and a leading header row.
+        """
+        
+        chunk = []
+        
+        for line, row in enumerate(reader, start=1):
+            if not row or (line == 1 and row[0].strip().lower() == 'counter_id'):
+                continue
+            
+            chunk.append((line, row))
+            if len(chunk) >= self.chunk_size:
+                yield chunk
+                chunk = []
+
+        if chunk:
+            yield chunk
+
+    @staticmethod
+    def _parse_row (
+        row: List[str],
+    ) -> Tuple[int, float]:
+        
+        """
+        Parse a `counter_id,reading` row.
+
+        Raises:
+            ValueError: If the row is malformed or the reading is negative or not finite.
+        """
+        
+        if len(row) != 2:
+            raise ValueError(f'Expected 2 columns, got {len(row)}')
+
+        try:
+            counter_id, reading = int(row[0]), float(row[1])
+        except ValueError:
+            raise ValueError(f'Malformed row {row!r}') from None
+
+        if not math.isfinite(reading) or reading < 0:
+            raise ValueError(f'Invalid reading {row[1]!r}')
+
+        return counter_id, reading
+
+    def _write_chunk (
+        self, 
+        chunk: List[Tuple[int, float]], 
+        counters: Dict[int, Tuple[int, int]],
+    ) -> int:
+        
+        """
+        Write one validated chunk and mark its apartments dirty, in one transaction.
+
+        The counters of the chunk are locked first, and those that already have a reading
+        for the reading date are left out, so concurrent or repeated imports of the same
+        readings write them once.
+
+        Returns:
+            int: The number of readings written.
+        """
+        
+        counter_ids = [counter_id for counter_id, _ in chunk]
+        
+        with transaction.atomic():
+            list(Counter.objects.select_for_update().filter(id__in=counter_ids).values_list('id'))
+            imported_counters = set (
+                CounterHistory.objects.filter (
+                    counter_id__in=counter_ids, 
+                    date=self.reading_date,
+                ).values_list('counter_id', flat=True)
+            )
+            chunk = [row for row in chunk if row[0] not in imported_counters]
+            if not chunk:
+                return 0
+
+            if connection.vendor == 'postgresql':
+                self._write_chunk_postgresql(chunk)
+            else:
+                self._write_chunk_generic(chunk)
+
+            ReadingChangeLog.mark (
+                {counters[counter_id][0] for counter_id, _ in chunk}, 
+                [self.reading_date, ReadingChangeLog.next_month(self.reading_date)],
+            )
+
+        return len(chunk)
+
+    def _write_chunk_postgresql (
+        self, 
+        chunk: List[Tuple[int, float]],
+    ) -> None:
+        
+        """
+        Append the readings with `COPY` and roll the counters over with one `UPDATE ... FROM`.
+        """
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for counter_id, reading in chunk:
+            writer.writerow((counter_id, self.reading_date.isoformat(), repr(reading)))
+        buffer.seek(0)
+
+        values = ', '.join(['(%s, %s)'] * len(chunk))
+        params = [value for row in chunk for value in row]
+
+        copy_sql = (
+            f'COPY {CounterHistory._meta.db_table} (counter_id, date, reading) '
+            f'FROM STDIN WITH (FORMAT csv)'
+        )
+
+        with connection.cursor() as cursor:
+            # Django uses psycopg 3 when it is installed and psycopg2 otherwise.
+            if hasattr(cursor.cursor, 'copy_expert'):
+                cursor.copy_expert(copy_sql, buffer)
+            else:
+                with cursor.copy(copy_sql) as copy:
+                    copy.write(buffer.getvalue())
+            cursor.execute (
+                f'UPDATE {Counter._meta.db_table} AS c '
+                f'SET last_reading = c.current_reading, current_reading = v.reading '
+                f'FROM (VALUES {values}) AS v (id, reading) '
+                f'WHERE c.id = v.id',
+                params,
+            )
+
+    def _write_chunk_generic (
+        self, 
+        chunk: List[Tuple[int, float]],
+    ) -> None:
+        
+        """
+        Append the readings and roll the counters over with batched statements.
+        """
+        
+        with connection.cursor() as cursor:
+            cursor.executemany (
+                f'INSERT INTO {CounterHistory._meta.db_table} (counter_id, date, reading) '
+                f'VALUES (%s, %s, %s)',
+                [(counter_id, self.reading_date, reading) for counter_id, reading in chunk],
+            )
+            cursor.executemany (
+                f'UPDATE {Counter._meta.db_table} '
+                f'SET last_reading = current_reading, current_reading = %s '
+                f'WHERE id = %s',
+                [(reading, counter_id) for counter_id, reading in chunk],
+            )
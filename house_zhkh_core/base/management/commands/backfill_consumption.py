@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from base.controllers.payment_controllers.consumption_recorder.consumption_recorder import ConsumptionRecorder
+
+class Command(BaseCommand):
+    
+    """
+    Rebuilds the `MonthlyConsumption` table from the `WaterMeter` reading history.
+    """
+    
+    help = 'Rebuild monthly water consumption from the WaterMeter reading history.'
+
+    def handle (
+        self, 
+        *args, 
+        **options,
+    ) -> None:
+        
+        """
+        Run the backfill and report the number of rows written.
+        """
+        
+        if connection.vendor != 'postgresql':
+            raise CommandError('The consumption backfill requires PostgreSQL.')
+
+        rows = ConsumptionRecorder.backfill()
+        self.stdout.write(self.style.SUCCESS(f'Backfilled {rows} monthly consumption rows.'))
@@ -0,0 +1,112 @@
+import time
+
+from wsgiref.util import setup_testing_defaults
+
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIHandler
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+class Command(BaseCommand):
+    
+    """
+    Measures the requests per second of a billing view with and without persistent connections.
+
+    The view is requested in-process through Django's WSGI handler, so the numbers isolate
+    the database connection handling from the web server while connections are opened and
+    closed around each request exactly as in production. Both runs go against the configured
+    database: first with `CONN_MAX_AGE = 0` (a new connection per request, the previous
+    default), then with the configured `CONN_MAX_AGE`. The number of connections opened in
+    each run is reported alongside the throughput.
+    """
+    
+    help = 'Benchmark a billing view with and without persistent database connections.'
+
+    def add_arguments (
+        self, 
+        parser,
+    ) -> None:
+        
+        """
+        Register the command line options.
+        """
+        
+        parser.add_argument (
+            'url', 
+            help='The path to request, e.g. /building_summary/1/2024-01/.',
+        )
+        parser.add_argument (
+            '--requests', 
+            type=int, 
+            default=500, 
+            help='How many requests to send per run (default: 500).',
+        )
+
+    def handle (
+        self, 
+        *args, 
+        **options,
+    ) -> None:
+        
+        """
+        Run the benchmark and report both runs.
+        """
+        
+        connection = connections['default']
+        configured_max_age = connection.settings_dict['CONN_MAX_AGE']
+        if not configured_max_age:
+            raise CommandError('Set DB_CONN_MAX_AGE to a non-zero value to compare against.')
+
+        handler = WSGIHandler()
+        opened = []
+        statuses = []
+
+        def start_response (
+            status, 
+            headers, 
+            exc_info=None,
+        ) -> None:
+            
+            statuses.append(int(status.split()[0]))
+
+        def count_connection (
+            sender, 
+            **kwargs,
+        ) -> None:
+            
+            opened.append(kwargs['connection'].alias)
+
+        connection_created.connect(count_connection)
+
+        try:
+            for max_age in (0, configured_max_age):
+                connection.close()
+                connection.settings_dict['CONN_MAX_AGE'] = max_age
+                opened.clear()
+
+                started = time.perf_counter()
+                for _ in range(options['requests']):
+                    environ = {
+                        'PATH_INFO': options['url'],
+                        'HTTP_HOST': settings.ALLOWED_HOSTS[0],
+                    }
+                    setup_testing_defaults(environ)
+
+                    response = handler(environ, start_response)
+                    b''.join(response)
+                    response.close()
+
+                    if statuses.pop() >= 500:
+                        raise CommandError(f'{options["url"]} failed with a server error.')
+                elapsed = time.perf_counter() - started
+
+                self.stdout.write (
+                    f'CONN_MAX_AGE={max_age}: '
+                    f'{options["requests"] / elapsed:.1f} requests/s, '
+                    f'{len(opened)} connections opened'
+                )
+        finally:
+            connection_created.disconnect(count_connection)
+            connection.settings_dict['CONN_MAX_AGE'] = configured_max_age
+            connection.close()
@@ -0,0 +1,49 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from base.controllers.partition_controllers.reading_partitioner.reading_partitioner import ReadingPartitioner
+
+class Command(BaseCommand):
+    
+    """
+    Creates the upcoming yearly partitions of the `CounterHistory` and `WaterMeter` tables.
+    """
+    
+    help = 'Create the upcoming yearly partitions of the meter reading tables.'
+
+    def add_arguments (
+        self, 
+        parser,
+    ) -> None:
+        
+        """
+        Register the command line options.
+        """
+        
+        parser.add_argument (
+            '--years-ahead', 
+            type=int, 
+            default=1,
+            help='How many years past the current one to prepare (default: 1).',
+        )
+
+    def handle (
+        self, 
+        *args, 
+        **options,
+    ) -> None:
+        
+        """
+        Create the missing partitions and report them.
+        """
+        
+        try:
+            created = ReadingPartitioner.ensure_partitions(options['years_ahead'])
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+
+        if not created:
+            self.stdout.write('All reading partitions already exist.')
+            return
+
+        for partition in created:
+            self.stdout.write(self.style.SUCCESS(f'Created partition {partition}.'))
@@ -0,0 +1,63 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from base.controllers.reading_controllers.meter_reading_importer.meter_reading_importer import MeterReadingImporter
+
+class Command(BaseCommand):
+    
+    """
+    Imports a vendor CSV file of meter readings (`counter_id,reading` rows).
+    """
+    
+    help = 'Import meter readings from a vendor CSV file with counter_id,reading rows.'
+
+    def add_arguments (
+        self, 
+        parser,
+    ) -> None:
+        
+        """
+        Register the command line options.
+        """
+        
+        parser.add_argument('path', help='The CSV file to import.')
+        parser.add_argument (
+            '--date', 
+            help='The reading date in YYYY-MM-DD format (default: today).',
+        )
+        parser.add_argument (
+            '--chunk-size', 
+            type=int, 
+            default=MeterReadingImporter.DEFAULT_CHUNK_SIZE,
+            help='The number of readings written per transaction.',
+        )
+
+    def handle (
+        self, 
+        *args, 
+        **options,
+    ) -> None:
+        
+        """
+        Run the import and report imported, skipped and rejected rows.
+        """
+        
+        try:
+            reading_date = datetime.strptime(options['date'], '%Y-%m-%d').date() if options['date'] else None
+            importer = MeterReadingImporter(reading_date, options['chunk_size'])
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+
+        try:
+            with open(options['path'], newline='', encoding='utf-8') as stream:
+                report = importer.import_file(stream)
+        except OSError as e:
+            raise CommandError(str(e)) from e
+
+        for line, message in report['errors']:
+            self.stderr.write(f'Line {line}: {message}')
+
+        self.stdout.write (
+            self.style.SUCCESS(f"Imported {report['imported']} readings, skipped {report['skipped']} already imported, rejected {report['rejected']}.")
+        )
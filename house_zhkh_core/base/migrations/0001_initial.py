@@ -0,0 +1,92 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:32
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Building',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('address', models.CharField(max_length=200)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Counter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('counter_type', models.IntegerField(choices=[(0, 'Gas Counter'), (1, 'Electricity Counter'), (2, 'Water Counter'), (3, 'Heat Counter')])),
+                ('last_reading', models.FloatField()),
+                ('current_reading', models.FloatField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name='CounterHistory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(auto_now_add=True)),
+                ('reading', models.FloatField()),
+                ('counter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='history', to='base.counter')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Flat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('flat_number', models.PositiveIntegerField()),
+                ('flat_floor', models.PositiveIntegerField()),
+                ('square', models.PositiveIntegerField()),
+                ('building', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='flats', to='base.building')),
+            ],
+        ),
+        migrations.AddField(
+            model_name='counter',
+            name='flat',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='counters', to='base.flat'),
+        ),
+        migrations.CreateModel(
+            name='FlatHcsBalance',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('balance', models.IntegerField(default=0)),
+                ('flat', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='balances', to='base.flat')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Inhabitant',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('full_name', models.CharField(max_length=200)),
+                ('age', models.PositiveIntegerField()),
+                ('flat', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='inhabitants', to='base.flat')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Payment',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('water_fee', models.FloatField()),
+                ('common_area_fee', models.FloatField()),
+                ('total_fee', models.FloatField()),
+                ('flat', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='base.flat')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='WaterMeter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('reading', models.FloatField()),
+                ('month', models.DateField()),
+                ('flat', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='base.flat')),
+            ],
+        ),
+    ]
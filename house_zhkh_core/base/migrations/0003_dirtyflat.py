@@ -0,0 +1,28 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:34
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0002_billingrun_watermeter_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DirtyFlat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('marked_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('flat', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='dirty_months', to='base.flat')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['month', 'marked_at'], name='base_dirtyf_month_a78a91_idx')],
+                'constraints': [models.UniqueConstraint(fields=('flat', 'month'), name='unique_dirty_flat_month')],
+            },
+        ),
+    ]
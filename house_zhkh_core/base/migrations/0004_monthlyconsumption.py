@@ -0,0 +1,53 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:37
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+BACKFILL_SQL = """
+    INSERT INTO base_monthlyconsumption (flat_id, month, reading, previous_reading, consumption)
+    SELECT flat_id, month, reading, previous_reading, reading - previous_reading
+    FROM (
+        SELECT
+            flat_id, month, reading,
+            LAG(reading) OVER w AS previous_reading,
+            LAG(month) OVER w AS previous_month
+        FROM (
+            SELECT DISTINCT ON (flat_id, month) flat_id, month, reading
+            FROM base_watermeter
+            ORDER BY flat_id, month, updated_at DESC
+        ) AS latest_readings
+        WINDOW w AS (PARTITION BY flat_id ORDER BY month)
+    ) AS readings
+    WHERE previous_month = (month - INTERVAL '1 month')::date
+    ON CONFLICT (month, flat_id) DO NOTHING
+"""
+
+
+def backfill_monthly_consumption(apps, schema_editor):
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute(BACKFILL_SQL)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0003_dirtyflat'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MonthlyConsumption',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('reading', models.FloatField()),
+                ('previous_reading', models.FloatField()),
+                ('consumption', models.FloatField()),
+                ('flat', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_consumptions', to='base.flat')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('month', 'flat'), name='unique_monthly_consumption')],
+            },
+        ),
+        migrations.RunPython(backfill_monthly_consumption, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,128 @@
+from datetime import date
+
+from django.db import migrations
+
+# Reading tables converted to native range partitioning, with their partition key.
+PARTITIONED_TABLES = {
+    'base_counterhistory': 'date',
+    'base_watermeter': 'month',
+}
+
+
+def partition_table(schema_editor, table, column):
+    legacy_table = f'{table}_unpartitioned'
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT indexdef FROM pg_indexes WHERE tablename = %s AND indexname <> %s',
+            [table, f'{table}_pkey'],
+        )
+        indexes = [row[0] for row in cursor.fetchall()]
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype = 'f'",
+            [table],
+        )
+        foreign_keys = cursor.fetchall()
+        cursor.execute(
+            f'SELECT EXTRACT(YEAR FROM MIN({column}))::int, EXTRACT(YEAR FROM MAX({column}))::int FROM {table}'
+        )
+        first_year, last_year = cursor.fetchone()
+
+    current_year = date.today().year
+    first_year = min(first_year or current_year, current_year)
+    last_year = max(last_year or current_year, current_year + 1)
+
+    schema_editor.execute(f'ALTER TABLE {table} RENAME TO {legacy_table}')
+    schema_editor.execute(
+        f'CREATE TABLE {table} (LIKE {legacy_table} INCLUDING DEFAULTS) PARTITION BY RANGE ({column})'
+    )
+    schema_editor.execute(f'ALTER TABLE {table} ADD PRIMARY KEY (id, {column})')
+
+    for year in range(first_year, last_year + 1):
+        schema_editor.execute(
+            f"CREATE TABLE {table}_y{year} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{year}-01-01') TO ('{year + 1}-01-01')"
+        )
+    schema_editor.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+
+    schema_editor.execute(f'INSERT INTO {table} SELECT * FROM {legacy_table}')
+    schema_editor.execute(f'DROP TABLE {legacy_table}')
+
+    # The identity sequence went away with the legacy table; partitioned tables take a plain sequence.
+    schema_editor.execute(f'CREATE SEQUENCE {table}_id_seq OWNED BY {table}.id')
+    schema_editor.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT nextval('{table}_id_seq')")
+    schema_editor.execute(
+        f"SELECT setval('{table}_id_seq', COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+    )
+
+    for indexdef in indexes:
+        schema_editor.execute(indexdef)
+    for name, definition in foreign_keys:
+        schema_editor.execute(f'ALTER TABLE {table} ADD CONSTRAINT {name} {definition}')
+
+
+def unpartition_table(schema_editor, table):
+    partitioned_table = f'{table}_partitioned'
+
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT indexdef FROM pg_indexes WHERE tablename = %s AND indexname NOT IN "
+            "(SELECT conname FROM pg_constraint WHERE conrelid = %s::regclass AND contype = 'p')",
+            [table, table],
+        )
+        # Indexes of a partitioned table are defined ON ONLY the parent; plain tables take plain indexes.
+        indexes = [row[0].replace(' ON ONLY ', ' ON ') for row in cursor.fetchall()]
+        cursor.execute(
+            "SELECT conname, pg_get_constraintdef(oid) FROM pg_constraint "
+            "WHERE conrelid = %s::regclass AND contype = 'f'",
+            [table],
+        )
+        foreign_keys = cursor.fetchall()
+
+    schema_editor.execute(f'ALTER TABLE {table} RENAME TO {partitioned_table}')
+    schema_editor.execute(f'CREATE TABLE {table} (LIKE {partitioned_table} INCLUDING DEFAULTS)')
+    schema_editor.execute(f'ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT')
+
+    schema_editor.execute(f'INSERT INTO {table} SELECT * FROM {partitioned_table}')
+    # Drops the yearly partitions and the plain id sequence owned by the partitioned table.
+    schema_editor.execute(f'DROP TABLE {partitioned_table}')
+
+    schema_editor.execute(f'ALTER TABLE {table} ADD PRIMARY KEY (id)')
+    schema_editor.execute(f'ALTER TABLE {table} ALTER COLUMN id ADD GENERATED BY DEFAULT AS IDENTITY')
+    schema_editor.execute(
+        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+        f"COALESCE((SELECT MAX(id) FROM {table}), 0) + 1, false)"
+    )
+
+    for indexdef in indexes:
+        schema_editor.execute(indexdef)
+    for name, definition in foreign_keys:
+        schema_editor.execute(f'ALTER TABLE {table} ADD CONSTRAINT {name} {definition}')
+
+
+def partition_readings(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for table, column in PARTITIONED_TABLES.items():
+        partition_table(schema_editor, table, column)
+
+
+def unpartition_readings(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+
+    for table in PARTITIONED_TABLES:
+        unpartition_table(schema_editor, table)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0004_monthlyconsumption'),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_readings, unpartition_readings),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0005_partition_readings'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='counterhistory',
+            index=models.Index(fields=['counter', '-date'], name='base_counte_counter_3f3191_idx'),
+        ),
+    ]
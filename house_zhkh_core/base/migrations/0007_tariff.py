@@ -0,0 +1,61 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:44
+
+import datetime
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def seed_default_tariffs(apps, schema_editor):
+    Tariff = apps.get_model('base', 'Tariff')
+    Tariff.objects.bulk_create([
+        # The rates previously hardcoded in PaymentCalculationView: water 10, common area 5.
+        Tariff(tariff_type=2, rate=10, valid_from=datetime.date(2000, 1, 1)),
+        Tariff(tariff_type=4, rate=5, valid_from=datetime.date(2000, 1, 1)),
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0006_counterhistory_counter_date_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='building',
+            name='region',
+            field=models.CharField(blank=True, default='', max_length=100),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='electricity_fee',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='gas_fee',
+            field=models.FloatField(default=0),
+        ),
+        migrations.AddField(
+            model_name='payment',
+            name='heat_fee',
+            field=models.FloatField(default=0),
+        ),
+        migrations.CreateModel(
+            name='Tariff',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tariff_type', models.IntegerField(choices=[(0, 'Gas'), (1, 'Electricity'), (2, 'Water'), (3, 'Heat'), (4, 'Common Area')])),
+                ('region', models.CharField(blank=True, default='', max_length=100)),
+                ('rate', models.FloatField()),
+                ('valid_from', models.DateField()),
+                ('valid_to', models.DateField(blank=True, null=True)),
+                ('building', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='tariffs', to='base.building')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['valid_from', 'valid_to'], name='base_tariff_valid_f_91d78a_idx')],
+            },
+        ),
+        migrations.RunPython(seed_default_tariffs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:45
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+# The number of duplicates of each kind listed when the migration refuses to run.
+DUPLICATES_REPORTED = 20
+
+
+def check_duplicates(apps, schema_editor):
+    # The unique constraints below need one payment per flat and month and one balance per flat.
+    # Duplicates are money records, so they are reported for manual reconciliation, never deleted.
+    Payment = apps.get_model('base', 'Payment')
+    FlatHcsBalance = apps.get_model('base', 'FlatHcsBalance')
+
+    duplicate_payments = list(
+        Payment.objects.values_list('flat_id', 'month')
+        .annotate(rows=Count('id'))
+        .filter(rows__gt=1)
+        .order_by('flat_id', 'month')[:DUPLICATES_REPORTED]
+    )
+    duplicate_balances = list(
+        FlatHcsBalance.objects.values_list('flat_id', flat=True)
+        .annotate(rows=Count('id'))
+        .filter(rows__gt=1)
+        .order_by('flat_id')[:DUPLICATES_REPORTED]
+    )
+
+    if duplicate_payments or duplicate_balances:
+        raise RuntimeError(
+            'Cannot add the unique payment and balance constraints: reconcile the duplicate '
+            f'payments (flat id, month, rows) {duplicate_payments} and the duplicate balances '
+            f'of flats {duplicate_balances} (at most {DUPLICATES_REPORTED} of each are listed), '
+            'then migrate again.'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0007_tariff'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_duplicates, migrations.RunPython.noop),
+        migrations.CreateModel(
+            name='BalanceLedgerEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('kind', models.IntegerField(choices=[(0, 'Charge'), (1, 'Reversal')], default=0)),
+                ('amount', models.DecimalField(decimal_places=2, max_digits=12)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='flathcsbalance',
+            name='balance',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=12),
+        ),
+        migrations.AddConstraint(
+            model_name='flathcsbalance',
+            constraint=models.UniqueConstraint(fields=('flat',), name='unique_flat_balance'),
+        ),
+        migrations.AddConstraint(
+            model_name='payment',
+            constraint=models.UniqueConstraint(fields=('flat', 'month'), name='unique_flat_month_payment'),
+        ),
+        migrations.AddField(
+            model_name='balanceledgerentry',
+            name='flat',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ledger_entries', to='base.flat'),
+        ),
+        migrations.AddField(
+            model_name='balanceledgerentry',
+            name='payment',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='ledger_entries', to='base.payment'),
+        ),
+        migrations.AddIndex(
+            model_name='balanceledgerentry',
+            index=models.Index(fields=['flat', 'month'], name='base_balanc_flat_id_a24c86_idx'),
+        ),
+    ]
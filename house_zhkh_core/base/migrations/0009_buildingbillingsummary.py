@@ -0,0 +1,34 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:46
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0008_balance_ledger'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BuildingBillingSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('flats_billed', models.PositiveIntegerField(default=0)),
+                ('water_fee', models.FloatField(default=0)),
+                ('gas_fee', models.FloatField(default=0)),
+                ('electricity_fee', models.FloatField(default=0)),
+                ('heat_fee', models.FloatField(default=0)),
+                ('common_area_fee', models.FloatField(default=0)),
+                ('total_fee', models.FloatField(default=0)),
+                ('debt', models.FloatField(default=0)),
+                ('refreshed_at', models.DateTimeField(auto_now=True)),
+                ('building', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='billing_summaries', to='base.building')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('building', 'month'), name='unique_building_billing_summary')],
+            },
+        ),
+    ]
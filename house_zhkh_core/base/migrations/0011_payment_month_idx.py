@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('base', '0010_admin_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['month'], name='base_paymen_month_9ccb9d_idx'),
+        ),
+    ]
@@ -0,0 +1,12 @@
+from base.models.balance_ledger_entry import BalanceLedgerEntry
+from base.models.billing_run import BillingRun
+from base.models.building import Building
+from base.models.building_billing_summary import BuildingBillingSummary
+from base.models.counter import Counter, CounterHistory
+from base.models.dirty_flat import DirtyFlat
+from base.models.flat import Flat, FlatHcsBalance
+from base.models.inhabitant import Inhabitant
+from base.models.monthly_consumption import MonthlyConsumption
+from base.models.payment import Payment
+from base.models.tariff import Tariff
+from base.models.water_meter import WaterMeter
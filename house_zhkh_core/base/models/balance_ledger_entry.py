@@ -0,0 +1,75 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from base.models.flat import Flat
+from base.models.payment import Payment
+
+class BalanceLedgerEntry(models.Model):
+    
+    """
+    An append-only record of a change posted to an apartment's `FlatHcsBalance`.
+
+    Every billing run posts one entry per apartment whose charge for the month changed,
+    with the difference to what was already posted, so the entries of an apartment always
+    sum up to what has been taken from its balance. Entries are never updated or deleted;
+    corrections are posted as new entries.
+
+    Attributes:
+        flat (Flat): The apartment whose balance changed.
+        month (date): The billing month the entry belongs to.
+        payment (Payment): The payment that caused the entry, if any.
+        kind (int): Whether the entry is a billing charge or a reversal.
+        amount (Decimal): The amount taken from the balance (negative amounts are credited).
+        created_at (datetime): When the entry was posted.
+    """
+
+    class Kind(models.IntegerChoices):
+        
+        """
+        Enum representing the origin of a ledger entry.
+
+        Values:
+            CHARGE (0): A charge (or charge correction) posted by billing.
+            REVERSAL (1): A reversal of previously posted charges.
+        """
+        
+        CHARGE = 0, _('Charge')
+        REVERSAL = 1, _('Reversal')
+
+    flat = models.ForeignKey (
+        Flat, 
+        on_delete=models.CASCADE, 
+        related_name='ledger_entries',
+    )
+    month = models.DateField()
+    payment = models.ForeignKey (
+        Payment, 
+        on_delete=models.SET_NULL, 
+        related_name='ledger_entries',
+        null=True, 
+        blank=True,
+    )
+    kind = models.IntegerField(choices=Kind.choices, default=Kind.CHARGE)
+    amount = models.DecimalField (
+        max_digits=12, 
+        decimal_places=2,
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['flat', 'month']),
+        ]
+
+    def __str__ (
+        self,
+    ) -> str:
+        
+        """
+        Returns a string representation of the BalanceLedgerEntry instance.
+
+        Returns:
+            str: A formatted string displaying the amount, apartment, and month.
+        """
+        
+        return f'{self.get_kind_display()} {self.amount} for {self.flat} ({self.month})'
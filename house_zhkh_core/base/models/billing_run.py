@@ -0,0 +1,39 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+class BillingRun(models.Model):
+    
+    """
+    Records a billing run for a month.
+
+    Portfolio runs (full or changed-only runs) are used as the reference point for
+    changed-only billing: only flats whose readings were updated after the start of
+    the last successful portfolio run need to be billed again.
+
+    Attributes:
+        month (date): The billed month.
+        scope (dict): The serialized `BillingScope` of the run.
+        covers_portfolio (bool): Whether the run considered every flat of the portfolio.
+        started_at (datetime): When the run started.
+        finished_at (datetime): When the run finished successfully, or None if it is
+            still running or has failed.
+    """
+
+    month = models.DateField(db_index=True)
+    scope = models.JSONField(default=dict)
+    covers_portfolio = models.BooleanField(default=True)
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__ (
+        self,
+    ) -> str:
+        
+        """
+        Returns a string representation of the BillingRun instance.
+
+        Returns:
+            str: A formatted string displaying the month and the start time of the run.
+        """
+        
+        return f'Billing run for {self.month} started at {self.started_at}'
@@ -8,9 +8,11 @@ class Building(models.Model):
 
     Attributes:
         address (str): The address of the building, stored as a character field (max length: 200).
+        region (str): The tariff region of the building (see `Tariff`).
     """
 
     address = models.CharField(max_length=200)
+    region = models.CharField(max_length=100, blank=True, default='')
 
     def __str__ (
         self,
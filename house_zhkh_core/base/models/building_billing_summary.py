@@ -0,0 +1,65 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from base.models.building import Building
+
+class BuildingBillingSummary(models.Model):
+    
+    """
+    Pre-aggregated billing totals of a building for a month.
+
+    Rows are refreshed at the end of every billing run for the buildings the run billed
+    (see `BillingSummary`), so building-level reports read a single row instead of
+    aggregating every `Payment` of the building.
+
+    Attributes:
+        building (Building): The summarized building.
+        month (date): The billing month.
+        flats_billed (int): The number of apartments with a payment for the month.
+        water_fee (float): The sum of the water fees.
+        gas_fee (float): The sum of the gas fees.
+        electricity_fee (float): The sum of the electricity fees.
+        heat_fee (float): The sum of the heat fees.
+        common_area_fee (float): The sum of the common area fees.
+        total_fee (float): The sum of the total fees.
+        debt (float): The total debt (negative balances) of the building's apartments when
+            the summary was refreshed.
+        refreshed_at (datetime): When the summary was last refreshed.
+    """
+
+    building = models.ForeignKey (
+        Building, 
+        on_delete=models.CASCADE, 
+        related_name='billing_summaries',
+    )
+    month = models.DateField()
+    flats_billed = models.PositiveIntegerField(default=0)
+    water_fee = models.FloatField(default=0)
+    gas_fee = models.FloatField(default=0)
+    electricity_fee = models.FloatField(default=0)
+    heat_fee = models.FloatField(default=0)
+    common_area_fee = models.FloatField(default=0)
+    total_fee = models.FloatField(default=0)
+    debt = models.FloatField(default=0)
+    refreshed_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint (
+                fields=['building', 'month'], 
+                name='unique_building_billing_summary',
+            ),
+        ]
+
+    def __str__ (
+        self,
+    ) -> str:
+        
+        """
+        Returns a string representation of the BuildingBillingSummary instance.
+
+        Returns:
+            str: A formatted string displaying the building, month, and total fee.
+        """
+        
+        return f'Billing summary for {self.building} ({self.month}): {self.total_fee}'
@@ -74,6 +74,11 @@ class CounterHistory(models.Model):
     date = models.DateField(auto_now_add=True)
     reading = models.FloatField()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['counter', '-date']),
+        ]
+
     def __str__ (
         self,
     ) -> str:
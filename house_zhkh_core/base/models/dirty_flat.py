@@ -0,0 +1,52 @@
+from django.db import models
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+from base.models.flat import Flat
+
+class DirtyFlat(models.Model):
+    
+    """
+    Marks an apartment whose meter readings changed after it was last billed for a month.
+
+    Rows are written by the reading signals (and by bulk ingestion paths that bypass them)
+    and consumed by successful billing runs, so incremental runs only recalculate the
+    `Payment` rows of flats that actually changed.
+
+    Attributes:
+        flat (Flat): The apartment whose readings changed.
+        month (date): The billing month affected by the change.
+        marked_at (datetime): When the apartment was last marked dirty for the month.
+    """
+
+    flat = models.ForeignKey (
+        Flat, 
+        on_delete=models.CASCADE, 
+        related_name='dirty_months',
+    )
+    month = models.DateField()
+    marked_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint (
+                fields=['flat', 'month'], 
+                name='unique_dirty_flat_month',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['month', 'marked_at']),
+        ]
+
+    def __str__ (
+        self,
+    ) -> str:
+        
+        """
+        Returns a string representation of the DirtyFlat instance.
+
+        Returns:
+            str: A formatted string displaying the apartment and the affected month.
+        """
+        
+        return f'Dirty {self.flat} ({self.month})'
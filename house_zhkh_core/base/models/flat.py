@@ -45,13 +45,26 @@ class FlatHcsBalance(models.Model):
 
     Attributes:
         flat (Flat): The apartment to which this balance belongs.
-        balance (int): The current balance amount (e.g., debt or credit).
+        balance (Decimal): The current balance amount (e.g., debt or credit). Billing charges
+            are posted to it through the `BalanceLedger`.
     """
 
     flat = models.ForeignKey (
         Flat, on_delete=models.CASCADE, related_name='balances'
     )
-    balance = models.IntegerField(default=0)
+    balance = models.DecimalField (
+        max_digits=12, 
+        decimal_places=2, 
+        default=0,
+    )
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint (
+                fields=['flat'], 
+                name='unique_flat_balance',
+            ),
+        ]
 
     def __str__ (
         self,
@@ -0,0 +1,53 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from base.models.flat import Flat
+
+class MonthlyConsumption(models.Model):
+    
+    """
+    Denormalized monthly water consumption of an apartment.
+
+    One row per apartment and month, derived from the `WaterMeter` readings of the month
+    and of the previous month. Rows are maintained when readings are recorded (see
+    `ConsumptionRecorder`), so billing reads a single precomputed row per apartment instead
+    of two readings.
+
+    Attributes:
+        flat (Flat): The apartment the consumption belongs to.
+        month (date): The billing month.
+        reading (float): The water meter reading of the month.
+        previous_reading (float): The water meter reading of the previous month.
+        consumption (float): The consumption of the month (reading - previous_reading).
+    """
+
+    flat = models.ForeignKey (
+        Flat, 
+        on_delete=models.CASCADE, 
+        related_name='monthly_consumptions',
+    )
+    month = models.DateField()
+    reading = models.FloatField()
+    previous_reading = models.FloatField()
+    consumption = models.FloatField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint (
+                fields=['month', 'flat'], 
+                name='unique_monthly_consumption',
+            ),
+        ]
+
+    def __str__ (
+        self,
+    ) -> str:
+        
+        """
+        Returns a string representation of the MonthlyConsumption instance.
+
+        Returns:
+            str: A formatted string with the consumption, apartment, and month.
+        """
+        
+        return f'Consumption {self.consumption} for {self.flat} ({self.month})'
@@ -12,19 +12,47 @@ class Payment(models.Model):
         flat (Flat): The apartment for which the payment is made.
         month (date): The billing month of the payment.
         water_fee (float): The fee for water consumption.
+        gas_fee (float): The fee for gas consumption.
+        electricity_fee (float): The fee for electricity consumption.
+        heat_fee (float): The fee for heat consumption.
         common_area_fee (float): The fee for common area maintenance.
         total_fee (float): The total amount due, including all fees.
+
+    The names of the fee fields are listed in `FEE_FIELDS`, in the order used by billing.
     """
 
+    FEE_FIELDS = [
+        'water_fee', 
+        'gas_fee', 
+        'electricity_fee', 
+        'heat_fee', 
+        'common_area_fee', 
+        'total_fee',
+    ]
+
     flat = models.ForeignKey (
         Flat, 
         on_delete=models.CASCADE,
     )
     month = models.DateField()
     water_fee = models.FloatField()
+    gas_fee = models.FloatField(default=0)
+    electricity_fee = models.FloatField(default=0)
+    heat_fee = models.FloatField(default=0)
     common_area_fee = models.FloatField()
     total_fee = models.FloatField()
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint (
+                fields=['flat', 'month'], 
+                name='unique_flat_month_payment',
+            ),
+        ]
+        indexes = [
+            models.Index(fields=['month']),
+        ]
+
     def __str__ (
         self,
     ) -> str:
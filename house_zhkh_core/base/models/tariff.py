@@ -0,0 +1,73 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from base.models.building import Building
+
+class Tariff(models.Model):
+    
+    """
+    A billing rate for one utility, valid over a date range.
+
+    A tariff applies either to a single building, to every building of a region, or
+    globally (neither building nor region set). The most specific tariff valid for the
+    billed month wins (see `TariffTable`).
+
+    Attributes:
+        tariff_type (int): The billed utility. Metered utilities share their values with
+            `Counter.CounterType`; common area maintenance is billed per square meter.
+        building (Building): The building the tariff applies to, if building-specific.
+        region (str): The region the tariff applies to, if region-wide.
+        rate (float): The price per unit of consumption (per square meter for common areas).
+        valid_from (date): The first day the tariff applies.
+        valid_to (date): The last day the tariff applies, or None if open-ended.
+    """
+
+    class TariffType(models.IntegerChoices):
+        
+        """
+        Enum representing the billed utilities.
+
+        Values:
+            GAS (0): Gas consumption.
+            ELECTRICITY (1): Electricity consumption.
+            WATER (2): Water consumption.
+            HEAT (3): Heat consumption.
+            COMMON_AREA (4): Common area maintenance, per square meter.
+        """
+        
+        GAS = 0, _('Gas')
+        ELECTRICITY = 1, _('Electricity')
+        WATER = 2, _('Water')
+        HEAT = 3, _('Heat')
+        COMMON_AREA = 4, _('Common Area')
+
+    tariff_type = models.IntegerField(choices=TariffType.choices)
+    building = models.ForeignKey (
+        Building, 
+        on_delete=models.CASCADE, 
+        related_name='tariffs',
+        null=True, 
+        blank=True,
+    )
+    region = models.CharField(max_length=100, blank=True, default='')
+    rate = models.FloatField()
+    valid_from = models.DateField()
+    valid_to = models.DateField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['valid_from', 'valid_to']),
+        ]
+
+    def __str__ (
+        self,
+    ) -> str:
+        
+        """
+        Returns a string representation of the Tariff instance.
+
+        Returns:
+            str: A formatted string displaying the utility, rate, and start date.
+        """
+        
+        return f'{self.get_tariff_type_display()} tariff {self.rate} from {self.valid_from}'
@@ -12,6 +12,7 @@ class WaterMeter(models.Model):
         flat (Flat): The apartment to which this water meter belongs.
         reading (float): The recorded water consumption in cubic meters.
         month (date): The month for which the reading is recorded.
+        updated_at (datetime): When the reading was last inserted or corrected.
     """
 
     flat = models.ForeignKey (
@@ -20,6 +21,12 @@ class WaterMeter(models.Model):
     )
     reading = models.FloatField()
     month = models.DateField()
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['month', 'updated_at']),
+        ]
 
     def __str__ (
         self,
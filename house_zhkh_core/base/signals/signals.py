@@ -0,0 +1,166 @@
+from typing import Any, Optional, Union
+
+from django.db.models import Model, QuerySet
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from base.controllers.payment_controllers.consumption_recorder.consumption_recorder import ConsumptionRecorder
+from base.controllers.payment_controllers.reading_change_log.reading_change_log import ReadingChangeLog
+from base.models.building import Building
+from base.models.counter import Counter, CounterHistory
+from base.models.flat import Flat
+from base.models.water_meter import WaterMeter
+
+COUNTER_READING_FIELDS = ('last_reading', 'current_reading')
+
+def _deleted_with_flat (
+    origin: Optional[Union[Model, QuerySet]],
+) -> bool:
+    
+    """
+    Tell whether a reading is being deleted together with its apartment.
+
+    The apartment has nothing left to bill then, and marking it would reference a row
+    deleted in the same transaction.
+    """
+    
+    if origin is None:
+        return False
+    
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return issubclass(model, (Flat, Building))
+
+
+@receiver(post_save, sender=WaterMeter)
+@receiver(post_delete, sender=WaterMeter)
+def mark_water_meter_change (
+    sender: type, 
+    instance: WaterMeter, 
+    origin: Optional[Union[Model, QuerySet]] = None, 
+    **kwargs: Any,
+) -> None:
+    
+    """
+    Mark the apartment dirty when a water meter reading is recorded, corrected or removed.
+
+    A reading is used both as the current reading of its month and as the previous reading
+    of the following month, so both billing months are marked.
+    """
+    
+    if _deleted_with_flat(origin):
+        return
+    
+    ReadingChangeLog.mark (
+        [instance.flat_id], 
+        [instance.month, ReadingChangeLog.next_month(instance.month)],
+    )
+
+
+@receiver(post_save, sender=WaterMeter)
+@receiver(post_delete, sender=WaterMeter)
+def update_monthly_consumption (
+    sender: type, 
+    instance: WaterMeter, 
+    origin: Optional[Union[Model, QuerySet]] = None, 
+    **kwargs: Any,
+) -> None:
+    
+    """
+    Keep the denormalized monthly consumption in sync with the water meter readings.
+    """
+    
+    if _deleted_with_flat(origin):
+        return
+    
+    ConsumptionRecorder.record(instance.flat_id, instance.month)
+
+
+@receiver(pre_save, sender=Counter)
+def track_counter_reading_change (
+    sender: type, 
+    instance: Counter, 
+    update_fields: Optional[frozenset] = None, 
+    **kwargs: Any,
+) -> None:
+    
+    """
+    Record on the instance whether the save changes the counter's readings, so that
+    `mark_counter_change` ignores saves that only edit metadata.
+    """
+    
+    if instance._state.adding:
+        instance._readings_changed = True
+    elif update_fields is not None and not update_fields & set(COUNTER_READING_FIELDS):
+        instance._readings_changed = False
+    else:
+        stored_readings = Counter.objects.filter (
+            pk=instance.pk,
+        ).values_list(*COUNTER_READING_FIELDS).first()
+        instance._readings_changed = stored_readings != tuple (
+            getattr(instance, field) for field in COUNTER_READING_FIELDS
+        )
+
+
+@receiver(post_save, sender=Counter)
+def mark_counter_change (
+    sender: type, 
+    instance: Counter, 
+    **kwargs: Any,
+) -> None:
+    
+    """
+    Mark the apartment dirty when the readings of a counter are updated.
+
+    The counter's readings are those of its latest `CounterHistory` row, so the month of
+    that reading (today for a counter without history) and the following month are marked.
+    """
+    
+    if not getattr(instance, '_readings_changed', True):
+        return
+    
+    reading_date = CounterHistory.objects.filter (
+        counter_id=instance.pk,
+    ).order_by('-date').values_list('date', flat=True).first() or timezone.localdate()
+    
+    ReadingChangeLog.mark (
+        [instance.flat_id], 
+        [reading_date, ReadingChangeLog.next_month(reading_date)],
+    )
+
+
+@receiver(post_save, sender=CounterHistory)
+@receiver(post_delete, sender=CounterHistory)
+def mark_counter_history_change (
+    sender: type, 
+    instance: CounterHistory, 
+    origin: Optional[Union[Model, QuerySet]] = None, 
+    **kwargs: Any,
+) -> None:
+    
+    """
+    Mark the apartment dirty when a counter reading is recorded, corrected or removed.
+
+    The consumption of a month is measured against the latest reading of the previous
+    month, so the month of the reading and the following month are marked. The apartment
+    is taken from the counter already loaded with the reading, or else looked up by id
+    without loading the counter.
+    """
+    
+    if _deleted_with_flat(origin):
+        return
+    
+    if CounterHistory.counter.is_cached(instance):
+        flat_id = instance.counter.flat_id
+    else:
+        flat_id = Counter.objects.filter (
+            pk=instance.counter_id,
+        ).values_list('flat_id', flat=True).first()
+    
+    if flat_id is None:
+        return
+    
+    ReadingChangeLog.mark (
+        [flat_id], 
+        [instance.date, ReadingChangeLog.next_month(instance.date)],
+    )
@@ -1,59 +1,174 @@
-from django.utils import timezone
+from uuid import uuid4
+
 from celery import Task, shared_task
 
-from base.models.flat import Flat
-from base.models.payment import Payment
-from base.controllers.payment_controllers.payment_calculator.payment_calculator import (
-    PaymentCalculator,
+from base.controllers.payment_controllers.billing_period.billing_period import (
+    BillingPeriod,
+)
+from base.controllers.payment_controllers.billing_profiler.billing_profiler import (
+    BillingProfiler,
+)
+from base.controllers.payment_controllers.billing_progress.billing_progress import (
+    BillingProgressReporter,
+    BillingProgressStore,
+)
+from base.controllers.payment_controllers.billing_scope.billing_scope import (
+    BillingScope,
+)
+from base.controllers.payment_controllers.payment_diff.payment_diff import (
+    PaymentDiff,
+)
+from base.controllers.payment_controllers.payment_processor.payment_processor import (
+    PaymentProcessor,
 )
 
 @shared_task(bind=True, name="calculate_payments", base=Task)
 class CalculatePaymentsTask(Task):
     
     """
-    Celery task to calculate and update payments for all flats for a given month.
+    Celery task to calculate and update payments for the flats of a billing scope for a given month.
+
+    The billing itself is delegated to `PaymentProcessor`, the same code path used by
+    the synchronous fast path of `PaymentCalculationView`. Progress is published to the
+    `BillingProgressStore` at a bounded rate rather than through the Celery result backend.
     """
 
     def run (
         self, 
         month,
+        scope=None,
+        profile=False,
+        dry_run=False,
     ) -> dict:
         
         """
         Executes the payment calculation for the provided month.
 
+        The task state, progress and result are recorded in the `BillingProgressStore` under
+        the task id, where `TaskStatusView` reads them.
+
         Args:
             month (str): A string in the format 'YYYY-MM-01' representing the start of the month.
+            scope (dict, optional): A serialized `BillingScope` restricting the run to buildings,
+                flats or changed flats. Defaults to all flats.
+            profile (bool): Whether to capture a cProfile of the run.
+            dry_run (bool): Whether to only report the payments that would change, without
+                writing anything.
 
         Returns:
             dict: A result dictionary containing the task status and the processed month.
+                  Profiled runs also include the 'profile_id' used to fetch the stats, and
+                  dry runs the report of `PaymentDiff.summarize`.
         """
         
+        task_id = getattr(getattr(self, 'request', None), 'id', None)
+        if task_id is None:
+            return self._run_profiled(month, scope, profile, dry_run=dry_run)
+
+        progress_store = BillingProgressStore()
+        progress_store.start(task_id)
+        
         try:
-            month_start = timezone.datetime.strptime(month, '%Y-%m-01')
-        except ValueError as exc:
-            raise ValueError('Invalid month format. Expected "YYYY-MM-01".') from exc
+            result = self._run_profiled (
+                month, 
+                scope, 
+                profile, 
+                dry_run=dry_run,
+                on_progress=BillingProgressReporter(progress_store, task_id),
+            )
+        except Exception as e:
+            progress_store.finish(task_id, 'FAILURE', {'error': str(e)})
+            raise
 
-        month_end = month_start + timezone.timedelta(days=31)
-        month_end = month_end.replace(day=1) - timezone.timedelta(days=1)
+        progress_store.finish(task_id, 'SUCCESS', result)
+        return result
 
-        flats = Flat.objects.all()
-        total_flats = flats.count()
-        calculator = PaymentCalculator()
+    def _run_profiled (
+        self, 
+        month,
+        scope=None,
+        profile=False,
+        dry_run=False,
+        on_progress=None,
+    ) -> dict:
+        
+        """
+        Runs the calculation, wrapped in cProfile if profiling is requested.
 
-        for i, flat in enumerate(flats, start=1):
-            payment_data = calculator.calculate_for_flat(flat)
+        When profiling is requested (or enabled through the `BILLING_PROFILE` setting),
+        the stats file is stored under the task id.
 
-            Payment.objects.update_or_create (
-                flat=flat,
-                month=month_start.date(), 
-                defaults=payment_data
-            )
+        Args:
+            month (str): A string in the format 'YYYY-MM-01' representing the start of the month.
+            scope (dict, optional): A serialized `BillingScope`.
+            profile (bool): Whether to capture a cProfile of the run.
+            dry_run (bool): Whether to only report the payments that would change.
+            on_progress (Callable, optional): The progress callback passed to `PaymentProcessor`.
 
-            self.update_state (
-                state='PROGRESS',
-                meta={'current': i, 'total': total_flats}
+        Returns:
+            dict: A result dictionary containing the task status and the processed month.
+        """
+        
+        if not BillingProfiler.is_enabled(profile):
+            return self._calculate(month, scope, on_progress, dry_run=dry_run)
+
+        profile_id = getattr(getattr(self, 'request', None), 'id', None) or uuid4().hex
+        with BillingProfiler().profile(profile_id):
+            result = self._calculate(month, scope, on_progress, dry_run=dry_run)
+
+        return {
+            **result,
+            'profile_id': profile_id,
+        }
+
+    def _calculate (
+        self, 
+        month,
+        scope=None,
+        on_progress=None,
+        dry_run=False,
+    ) -> dict:
+        
+        """
+        Calculates and stores payments for the flats in scope for the provided month.
+
+        Dry runs only compare the calculated payments with the stored ones and return
+        the differences.
+
+        Args:
+            month (str): A string in the format 'YYYY-MM-01' representing the start of the month.
+            scope (dict, optional): A serialized `BillingScope`.
+            on_progress (Callable, optional): The progress callback passed to `PaymentProcessor`.
+            dry_run (bool): Whether to only report the payments that would change.
+
+        Returns:
+            dict: A result dictionary containing the task status and the processed month.
+        """
+        
+        try:
+            period = BillingPeriod.parse(month)
+        except ValueError as exc:
+            raise ValueError('Invalid month format. Expected "YYYY-MM-01".') from exc
+
+        if dry_run:
+            changes = PaymentProcessor().diff_payments (
+                period, 
+                scope=BillingScope.from_data(scope),
+                on_progress=on_progress,
             )
+            
+            return {
+                'status': 'completed', 
+                'month': month,
+                'dry_run': True,
+                **PaymentDiff.summarize(changes),
+            }
+
+        PaymentProcessor().process_payments (
+            period, 
+            scope=BillingScope.from_data(scope),
+            on_progress=on_progress,
+        )
 
         return {
             'status': 'completed', 
@@ -0,0 +1,170 @@
+from datetime import date  
+from unittest.mock import patch  
+
+from django.contrib.admin import helpers  
+from django.contrib.auth import get_user_model  
+from django.test import TestCase, override_settings  
+from django.urls import reverse  
+
+from base.admin.paginators import EstimatedCountPaginator
+from base.models.balance_ledger_entry import BalanceLedgerEntry
+from base.models.building import Building
+from base.models.flat import Flat, FlatHcsBalance
+from base.models.payment import Payment
+
+class FlatAdminTest(TestCase):
+    
+    """
+    Test suite for the Flat admin changelist.
+    """
+
+    def setUp (
+        self,
+    ) -> None:
+        
+        """
+        Log in as a superuser and set up two flats.
+        """
+        
+        user = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(user)
+        
+        building = Building.objects.create(address='Main St 1')
+        Flat.objects.create(building=building, flat_number=12, flat_floor=1, square=50)
+        Flat.objects.create(building=building, flat_number=7, flat_floor=1, square=60)
+        self.url = reverse('admin:base_flat_changelist')
+
+    def test_changelist_queries_do_not_grow_with_rows (
+        self,
+    ) -> None:
+        
+        """
+        Test that buildings are joined into the changelist query instead of loaded per row.
+        """
+        
+        response = self.client.get(self.url)
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertIsInstance(response.context['cl'].paginator, EstimatedCountPaginator)
+        self.assertTrue(response.context['cl'].queryset.query.select_related)
+
+    def test_numeric_search_matches_flat_number (
+        self,
+    ) -> None:
+        
+        """
+        Test that a numeric search term looks flats up by number.
+        """
+        
+        response = self.client.get(self.url, {'q': '7'})
+        
+        self.assertEqual (
+            [flat.flat_number for flat in response.context['cl'].result_list], 
+            [7],
+        )
+
+
+class PaymentAdminTest(TestCase):
+    
+    """
+    Test suite for the Payment admin bulk actions.
+    """
+
+    def setUp (
+        self,
+    ) -> None:
+        
+        """
+        Log in as a superuser and set up charged payments for two months.
+        """
+        
+        user = get_user_model().objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.force_login(user)
+        
+        building = Building.objects.create(address='Main St 1')
+        self.flat = Flat.objects.create(building=building, flat_number=1, flat_floor=1, square=50)
+        FlatHcsBalance.objects.create(flat=self.flat, balance=-250)
+        
+        for month, total_fee in ((date(2024, 1, 1), 100), (date(2024, 2, 1), 150)):
+            Payment.objects.create(flat=self.flat, month=month, water_fee=0, common_area_fee=total_fee, total_fee=total_fee)
+            BalanceLedgerEntry.objects.create(flat=self.flat, month=month, amount=total_fee)
+        
+        self.url = reverse('admin:base_payment_changelist')
+
+    def post_action (
+        self, 
+        action: str,
+        payments,
+    ):
+        
+        """
+        Run an admin action on the given payments.
+        """
+        
+        return self.client.post (
+            self.url, 
+            {
+                'action': action, 
+                helpers.ACTION_CHECKBOX_NAME: [payment.pk for payment in payments],
+            },
+        )
+
+    @patch('base.admin.admin.CalculatePaymentsTask.delay')
+    def test_recalculate_enqueues_one_task_per_month (
+        self, 
+        mock_delay,
+    ) -> None:
+        
+        """
+        Test that recalculation enqueues a billing task per month, scoped to the selected flats.
+        """
+        
+        self.post_action('recalculate_payments', Payment.objects.all())
+        
+        self.assertEqual(mock_delay.call_count, 2)
+        mock_delay.assert_any_call (
+            '2024-02-01', 
+            scope={'building_ids': [], 'flat_ids': [self.flat.id], 'changed_only': False},
+        )
+
+    @override_settings(BILLING_RECALCULATION_BATCH_SIZE=2)
+    @patch('base.admin.admin.CalculatePaymentsTask.delay')
+    def test_recalculate_splits_flats_into_batches (
+        self, 
+        mock_delay,
+    ) -> None:
+        
+        """
+        Test that recalculating many flats enqueues tasks of at most the batch size.
+        """
+        
+        flats = [
+            Flat.objects.create(building=self.flat.building, flat_number=number, flat_floor=1, square=50)
+            for number in (2, 3)
+        ]
+        for flat in flats:
+            Payment.objects.create(flat=flat, month=date(2024, 2, 1), water_fee=0, common_area_fee=10, total_fee=10)
+        
+        self.post_action('recalculate_payments', Payment.objects.filter(month=date(2024, 2, 1)))
+        
+        self.assertEqual (
+            [call.kwargs['scope']['flat_ids'] for call in mock_delay.call_args_list], 
+            [[self.flat.id, flats[0].id], [flats[1].id]],
+        )
+
+    def test_void_reverses_charges (
+        self, 
+    ) -> None:
+        
+        """
+        Test that voiding deletes the payments and credits their charges back.
+        """
+        
+        self.post_action('void_payments', Payment.objects.filter(month=date(2024, 2, 1)))
+        
+        self.assertEqual(list(Payment.objects.values_list('month', flat=True)), [date(2024, 1, 1)])
+        self.assertEqual(FlatHcsBalance.objects.get(flat=self.flat).balance, -100)
+        self.assertEqual (
+            BalanceLedgerEntry.objects.get(kind=BalanceLedgerEntry.Kind.REVERSAL).amount, 
+            -150,
+        )
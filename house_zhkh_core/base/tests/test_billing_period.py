@@ -0,0 +1,94 @@
+from datetime import date, datetime
+
+from django.test import SimpleTestCase, TestCase
+
+from base.controllers.payment_controllers.billing_period.billing_period import BillingPeriod
+from base.controllers.payment_controllers.payment_processor.payment_processor import (
+    PaymentProcessor,
+)
+from base.models.building import Building
+from base.models.flat import Flat
+from base.models.payment import Payment
+from base.models.tariff import Tariff
+from base.models.water_meter import WaterMeter
+
+class BillingPeriodTest(SimpleTestCase):
+    
+    """
+    Test suite for the BillingPeriod class.
+    """
+
+    def test_month_keys (
+        self,
+    ) -> None:
+        
+        """
+        Test that a period resolves the first days of its, the previous and the next month.
+        """
+        
+        period = BillingPeriod(datetime(2024, 3, 31, 23, 59))
+        
+        self.assertEqual (
+            (period.previous_month, period.month, period.next_month), 
+            (date(2024, 2, 1), date(2024, 3, 1), date(2024, 4, 1)),
+        )
+        self.assertEqual(period.key, '2024-03-01')
+        self.assertEqual(period.reading_range, (date(2024, 2, 1), date(2024, 4, 1)))
+
+    def test_year_boundaries (
+        self,
+    ) -> None:
+        
+        """
+        Test that January and December periods cross into the adjacent years.
+        """
+        
+        self.assertEqual(BillingPeriod(date(2024, 1, 15)).previous_month, date(2023, 12, 1))
+        self.assertEqual(BillingPeriod(date(2024, 12, 15)).next_month, date(2025, 1, 1))
+
+    def test_parse (
+        self,
+    ) -> None:
+        
+        """
+        Test that both month formats parse to the same period, and anything else is rejected.
+        """
+        
+        period = BillingPeriod.parse('2024-02')
+        
+        self.assertEqual(period, BillingPeriod(date(2024, 2, 1)))
+        self.assertEqual(BillingPeriod.parse('2024-02-01'), period)
+        self.assertIs(BillingPeriod.of(period), period)
+        
+        for value in ('2024-02-15', 'february', ''):
+            with self.assertRaises(ValueError):
+                BillingPeriod.parse(value)
+
+
+class BillingPeriodProcessingTest(TestCase):
+    
+    """
+    Test suite for billing a month against the readings of its previous month.
+    """
+
+    def test_january_is_billed_against_december (
+        self,
+    ) -> None:
+        
+        """
+        Test that billing a month parsed from a request finds the previous year's readings.
+        """
+        
+        building = Building.objects.create(address='Main St 1')
+        flat = Flat.objects.create(building=building, flat_number=1, flat_floor=1, square=50)
+        Tariff.objects.create(tariff_type=Tariff.TariffType.WATER, rate=10.0, valid_from=date(2023, 1, 1))
+        WaterMeter.objects.create(flat=flat, month=date(2023, 12, 1), reading=100)
+        WaterMeter.objects.create(flat=flat, month=date(2024, 1, 1), reading=130)
+        
+        payments = PaymentProcessor().process_payments(BillingPeriod.parse('2024-01'))
+        
+        self.assertEqual(len(payments), 1)
+        self.assertEqual (
+            Payment.objects.values_list('month', 'water_fee').get(), 
+            (date(2024, 1, 1), 300),
+        )
@@ -0,0 +1,98 @@
+import tempfile  
+
+from django.test import TestCase  
+from django.urls import reverse  
+
+from base.controllers.payment_controllers.billing_profiler.billing_profiler import (
+    BillingProfiler,
+)
+
+class BillingProfilerTest(TestCase):
+    
+    """
+    Test suite for the BillingProfiler class.
+    """
+
+    def setUp (
+        self,
+    ) -> None:
+        
+        """
+        Set up a profiler writing into a temporary directory.
+        """
+        
+        self.profile_dir = tempfile.TemporaryDirectory()
+        self.profiler = BillingProfiler(self.profile_dir.name)
+
+    def tearDown (
+        self,
+    ) -> None:
+        
+        self.profile_dir.cleanup()
+
+    def test_profile_writes_stats_and_reports_top_functions (
+        self,
+    ) -> None:
+        
+        """
+        Test that a profiled block is stored under the run id and its functions are reported.
+        """
+        
+        def billing_workload():
+            return sum(i * i for i in range(10000))
+
+        with self.profiler.profile('task_123'):
+            billing_workload()
+
+        functions = self.profiler.top_functions('task_123', limit=50)
+        
+        self.assertTrue(self.profiler.stats_path('task_123').exists())
+        self.assertTrue (
+            any('billing_workload' in function['function'] for function in functions)
+        )
+        self.assertLessEqual(len(functions), 50)
+
+    def test_top_functions_missing_profile (
+        self,
+    ) -> None:
+        
+        """
+        Test that None is returned when no profile was captured for the run.
+        """
+        
+        self.assertIsNone(self.profiler.top_functions('unknown'))
+
+    def test_is_enabled (
+        self,
+    ) -> None:
+        
+        """
+        Test that profiling follows the request flag and the BILLING_PROFILE setting.
+        """
+        
+        with self.settings(BILLING_PROFILE=False):
+            self.assertTrue(BillingProfiler.is_enabled(True))
+            self.assertTrue(BillingProfiler.is_enabled('true'))
+            self.assertFalse(BillingProfiler.is_enabled('false'))
+            self.assertFalse(BillingProfiler.is_enabled(None))
+
+        with self.settings(BILLING_PROFILE=True):
+            self.assertTrue(BillingProfiler.is_enabled(None))
+
+    def test_profile_view_rejects_non_positive_limit (
+        self,
+    ) -> None:
+        
+        """
+        Test that the profile endpoint rejects a limit below 1 instead of slicing from the end.
+        """
+        
+        with self.profiler.profile('task_123'):
+            sum(range(100))
+
+        with self.settings(BILLING_PROFILE_DIR=self.profile_dir.name):
+            url = reverse('task_profile', kwargs={'task_id': 'task_123'})
+            
+            self.assertEqual(self.client.get(url, {'limit': 0}).status_code, 400)
+            self.assertEqual(self.client.get(url, {'limit': -5}).status_code, 400)
+            self.assertEqual(self.client.get(url, {'limit': 1}).status_code, 200)
@@ -0,0 +1,103 @@
+from unittest.mock import MagicMock, patch  
+
+from django.test import TestCase  
+
+from base.controllers.payment_controllers.billing_progress.billing_progress import (
+    BillingProgressReporter,
+    BillingProgressStore,
+)
+
+class BillingProgressStoreTest(TestCase):
+    
+    """
+    Test suite for the BillingProgressStore and BillingProgressReporter classes.
+    """
+
+    def setUp (
+        self,
+    ) -> None:
+        
+        """
+        Set up a store backed by a mocked Redis client.
+        """
+        
+        self.redis = MagicMock()
+        self.store = BillingProgressStore(client=self.redis)
+
+    def test_get_computes_throughput_and_eta (
+        self,
+    ) -> None:
+        
+        """
+        Test that progress is read with a single HGETALL and enriched with throughput and ETA.
+        """
+        
+        self.redis.hgetall.return_value = {
+            'state': 'PROGRESS',
+            'current': '500',
+            'total': '2000',
+            'started_at': '100.0',
+            'updated_at': '110.0',
+        }
+        
+        progress = self.store.get('task_123')
+        
+        self.redis.hgetall.assert_called_once_with('billing:progress:task_123')
+        self.assertEqual(progress['throughput'], 50.0)
+        self.assertEqual(progress['eta'], 30.0)
+        self.assertIsNone(progress['result'])
+
+    def test_get_finished_task (
+        self,
+    ) -> None:
+        
+        """
+        Test that the result of a finished task is decoded and no ETA is reported.
+        """
+        
+        self.redis.hgetall.return_value = {
+            'state': 'SUCCESS',
+            'current': '2',
+            'total': '2',
+            'started_at': '100.0',
+            'updated_at': '101.0',
+            'result': '{"status": "completed"}',
+        }
+        
+        progress = self.store.get('task_123')
+        
+        self.assertEqual(progress['result'], {'status': 'completed'})
+        self.assertIsNone(progress['eta'])
+
+    def test_get_unknown_task (
+        self,
+    ) -> None:
+        
+        """
+        Test that None is returned when nothing is recorded for the task.
+        """
+        
+        self.redis.hgetall.return_value = {}
+        
+        self.assertIsNone(self.store.get('unknown'))
+
+    def test_reporter_bounds_write_rate (
+        self,
+    ) -> None:
+        
+        """
+        Test that the reporter skips writes within the interval but always writes the last flat.
+        """
+        
+        store = MagicMock()
+        reporter = BillingProgressReporter(store, 'task_123', interval=60)
+        
+        with patch (
+            'base.controllers.payment_controllers.billing_progress.billing_progress.time.monotonic', 
+            return_value=1000.0,
+        ):
+            for current in range(1, 1001):
+                reporter(current, 1000)
+        
+        self.assertEqual(store.update.call_count, 2)
+        store.update.assert_called_with('task_123', 1000, 1000)
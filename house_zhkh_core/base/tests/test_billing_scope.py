@@ -0,0 +1,131 @@
+from datetime import date  
+
+from django.test import TestCase  
+from django.utils import timezone  
+
+from base.controllers.payment_controllers.billing_scope.billing_scope import (
+    BillingScope,
+)
+from base.models.billing_run import BillingRun
+from base.models.building import Building
+from base.models.flat import Flat
+from base.models.water_meter import WaterMeter
+
+class BillingScopeTest(TestCase):
+    
+    """
+    Test suite for the BillingScope class.
+    """
+
+    def setUp (
+        self,
+    ) -> None:
+        
+        """
+        Set up two buildings with one flat each.
+        """
+        
+        self.month = date(2024, 2, 1)
+        self.prev_month = date(2024, 1, 1)
+        
+        self.building_a = Building.objects.create(address='Main St 1')
+        self.building_b = Building.objects.create(address='Main St 2')
+        self.flat_a = Flat.objects.create(building=self.building_a, flat_number=1, flat_floor=1, square=50)
+        self.flat_b = Flat.objects.create(building=self.building_b, flat_number=2, flat_floor=1, square=60)
+
+    def test_from_data_parses_ids (
+        self,
+    ) -> None:
+        
+        """
+        Test that singular, plural and comma-separated ids are parsed and round-trip through to_dict.
+        """
+        
+        scope = BillingScope.from_data (
+            {'building_id': '3', 'flat_ids': '5,4', 'changed_only': 'true'}
+        )
+        
+        self.assertEqual (
+            scope.to_dict(), 
+            {'building_ids': [3], 'flat_ids': [4, 5], 'changed_only': True},
+        )
+        self.assertEqual (
+            BillingScope.from_data(scope.to_dict()).to_dict(), 
+            scope.to_dict(),
+        )
+
+    def test_from_data_invalid_id (
+        self,
+    ) -> None:
+        
+        """
+        Test that a non-numeric id raises a ValueError.
+        """
+        
+        with self.assertRaises(ValueError):
+            BillingScope.from_data({'flat_id': 'abc'})
+
+    def test_is_small (
+        self,
+    ) -> None:
+        
+        """
+        Test that only single-building and short flat-list scopes are billed synchronously.
+        """
+        
+        self.assertFalse(BillingScope().is_small())
+        self.assertFalse(BillingScope(changed_only=True).is_small())
+        self.assertTrue(BillingScope(building_ids=[1]).is_small())
+        self.assertFalse(BillingScope(building_ids=[1, 2]).is_small())
+        self.assertTrue(BillingScope(flat_ids=[1, 2, 3]).is_small())
+        
+        with self.settings(BILLING_SYNC_MAX_FLATS=2):
+            self.assertFalse(BillingScope(flat_ids=[1, 2, 3]).is_small())
+
+    def test_get_flats_by_building (
+        self,
+    ) -> None:
+        
+        """
+        Test that a building scope only returns the flats of that building.
+        """
+        
+        flats = BillingScope(building_ids=[self.building_a.id]).get_flats(self.month)
+        
+        self.assertEqual(list(flats), [self.flat_a])
+
+    def test_get_flats_changed_only (
+        self,
+    ) -> None:
+        
+        """
+        Test that changed-only scopes bill every flat until the month has been billed once,
+        and afterwards only the flats marked dirty in the reading change log.
+        """
+        
+        scope = BillingScope(changed_only=True)
+        self.assertEqual(set(scope.get_flats(self.month)), {self.flat_a, self.flat_b})
+
+        BillingRun.objects.create (
+            month=self.month, 
+            covers_portfolio=True, 
+            finished_at=timezone.now(),
+        )
+        WaterMeter.objects.create(flat=self.flat_b, month=self.prev_month, reading=100)
+        
+        self.assertEqual(list(scope.get_flats(self.month)), [self.flat_b])
+
+    def test_from_data_is_incremental_by_default (
+        self,
+    ) -> None:
+        
+        """
+        Test that portfolio scopes are incremental unless a full run is requested.
+        """
+        
+        self.assertTrue(BillingScope.from_data({}).changed_only)
+        self.assertFalse(BillingScope.from_data({'full': 'true'}).changed_only)
+        self.assertFalse(BillingScope.from_data({'building_id': 1}).changed_only)
+        
+        with self.settings(BILLING_INCREMENTAL=False):
+            self.assertFalse(BillingScope.from_data({}).changed_only)
@@ -1,9 +1,14 @@
-from unittest.mock import MagicMock, patch  
+from datetime import date  
+from unittest.mock import MagicMock, PropertyMock, patch  
 
+from django.conf import settings  
 from django.test import TestCase  
-from django.utils import timezone  
 
 from base.tasks import CalculatePaymentsTask  
+from base.controllers.payment_controllers.billing_period.billing_period import BillingPeriod
+from base.controllers.payment_controllers.payment_processor.payment_processor import (
+    PaymentProcessor,
+)
 
 class CalculatePaymentsTaskTest(TestCase):
     
@@ -16,27 +21,12 @@ class CalculatePaymentsTaskTest(TestCase):
     ) -> None:
         
         """
-        Test that the task successfully calculates payments for all flats and updates the Payment model.
+        Test that the task delegates billing of the month to the PaymentProcessor.
         """
         
         month = '2024-02-01'
         
-        flats = [MagicMock(id=1), MagicMock(id=2)]
-        calculator_mock = MagicMock()
-        calculator_mock.calculate_for_flat.side_effect = [
-            {'amount': 1000}, 
-            {'amount': 1200},
-        ]
-        
-        with patch('base.models.flat.Flat.objects.all', return_value=flats), \
-            patch (
-                'base.models.payment.Payment.objects.update_or_create',
-            ) as mock_update_or_create, \
-            patch (
-                'base.controller.payment_calculator.payment_calculator.PaymentCalculator', 
-                return_value=calculator_mock,
-            ):
-            
+        with patch.object(PaymentProcessor, 'process_payments') as mock_process_payments:
             task = CalculatePaymentsTask()
             result = task.run(month)
         
@@ -44,20 +34,12 @@ class CalculatePaymentsTaskTest(TestCase):
             result, 
             {'status': 'completed', 'month': month},
         )
-        self.assertEqual (
-            mock_update_or_create.call_count, 
-            2,
-        )
+        mock_process_payments.assert_called_once()
         
-        mock_update_or_create.assert_any_call (
-            flat=flats[0], 
-            month=timezone.datetime(2024, 2, 1).date(), 
-            defaults={'amount': 1000},
-        )
-        mock_update_or_create.assert_any_call (
-            flat=flats[1], 
-            month=timezone.datetime(2024, 2, 1).date(), 
-            defaults={'amount': 1200},
+        args, kwargs = mock_process_payments.call_args
+        self.assertEqual (
+            args, 
+            (BillingPeriod(date(2024, 2, 1)),),
         )
 
     def test_calculate_payments_invalid_month (
@@ -97,43 +79,110 @@ class CalculatePaymentsTaskTest(TestCase):
         )
         mock_update_or_create.assert_not_called()
 
+    def test_calculate_payments_dry_run (
+        self,
+    ) -> None:
+        
+        """
+        Test that a dry run reports the payment differences instead of storing payments.
+        """
+        
+        change = {'flat_id': 1, 'status': 'created', 'changes': {}}
+        
+        with patch.object(PaymentProcessor, 'process_payments') as mock_process_payments, \
+             patch.object(PaymentProcessor, 'diff_payments', return_value=[change, change]), \
+             self.settings(BILLING_DIFF_LIMIT=1):
+            
+            task = CalculatePaymentsTask()
+            result = task.run('2024-02-01', dry_run=True)
+        
+        self.assertEqual (
+            result, 
+            {
+                'status': 'completed', 
+                'month': '2024-02-01', 
+                'dry_run': True, 
+                'changed': 2, 
+                'diff': [change], 
+                'truncated': True,
+            },
+        )
+        mock_process_payments.assert_not_called()
+
     def test_calculate_payments_task_progress (
         self,
     ) -> None:
         
         """
-        Test that the task updates its state correctly as it processes flats.
+        Test that the task records its progress and result in the progress store.
         """
         
         month = '2024-02-01'
         
-        flats = [MagicMock(id=1), MagicMock(id=2)]
-        calculator_mock = MagicMock()
-        calculator_mock.calculate_for_flat.return_value = {'amount': 1000}
+        def process_payments(month_date, scope=None, on_progress=None):
+            on_progress(1, 2)
+            on_progress(2, 2)
+            return []
+        
+        task = CalculatePaymentsTask()
         
-        with patch('base.models.flat.Flat.objects.all', return_value=flats), \
-             patch('base.models.payment.Payment.objects.update_or_create'), \
-             patch('base.tasks.CalculatePaymentsTask', return_value=calculator_mock), \
-             patch.object(CalculatePaymentsTask, 'update_state') as mock_update_state:
+        with patch.object(PaymentProcessor, 'process_payments', side_effect=process_payments), \
+             patch.object(type(task), 'request', new_callable=PropertyMock, return_value=MagicMock(id='task_123')), \
+             patch('base.tasks.BillingProgressStore') as mock_store_class:
             
-            task = CalculatePaymentsTask()
             result = task.run(month)
         
+        store = mock_store_class.return_value
+        
         self.assertEqual (
             result, 
             {'status': 'completed', 'month': month},
         )
-        self.assertEqual (
-            mock_update_state.call_count, 
-            2,
-        )
+        store.start.assert_called_once_with('task_123')
+        store.update.assert_any_call('task_123', 2, 2)
+        store.finish.assert_called_once_with('task_123', 'SUCCESS', result)
+
+    def test_calculate_payments_task_failure (
+        self,
+    ) -> None:
         
-        mock_update_state.assert_any_call (
-            state='PROGRESS', 
-            meta={'current': 1, 'total': 2},
-        )
-        mock_update_state.assert_any_call (
-            state='PROGRESS', 
-            meta={'current': 2, 'total': 2},
+        """
+        Test that a failing run is recorded as FAILURE in the progress store.
+        """
+        
+        task = CalculatePaymentsTask()
+        
+        with patch.object(type(task), 'request', new_callable=PropertyMock, return_value=MagicMock(id='task_123')), \
+             patch('base.tasks.BillingProgressStore') as mock_store_class:
+            
+            with self.assertRaises(ValueError):
+                task.run('invalid-date')
+        
+        mock_store_class.return_value.finish.assert_called_once_with (
+            'task_123', 
+            'FAILURE', 
+            {'error': 'Invalid month format. Expected "YYYY-MM-01".'},
         )
 
+    def test_calculate_payments_billing_profile (
+        self,
+    ) -> None:
+        
+        """
+        Test that the task is routed to the billing queue with its time limits applied.
+        """
+        
+        from project.celery import app
+        
+        route = app.amqp.router.route({}, 'calculate_payments')
+        task = app.tasks['calculate_payments']
+        
+        self.assertEqual(route['queue'].name, 'billing')
+        self.assertEqual(task.soft_time_limit, settings.BILLING_TASK_SOFT_TIME_LIMIT)
+        self.assertEqual(task.time_limit, settings.BILLING_TASK_TIME_LIMIT)
+        self.assertTrue(task.ignore_result)
+        self.assertTrue(task.acks_late)
+        self.assertGreater (
+            settings.CELERY_BROKER_TRANSPORT_OPTIONS['visibility_timeout'], 
+            settings.BILLING_TASK_TIME_LIMIT,
+        )
@@ -0,0 +1,99 @@
+from datetime import date  
+
+from django.test import TestCase  
+
+from base.controllers.payment_controllers.consumption_recorder.consumption_recorder import (
+    ConsumptionRecorder,
+)
+from base.models.building import Building
+from base.models.counter import Counter, CounterHistory
+from base.models.flat import Flat
+from base.models.monthly_consumption import MonthlyConsumption
+from base.models.water_meter import WaterMeter
+
+class ConsumptionRecorderTest(TestCase):
+    
+    """
+    Test suite for the ConsumptionRecorder class and the reading signals feeding it.
+    """
+
+    def setUp (
+        self,
+    ) -> None:
+        
+        """
+        Set up a building with one flat.
+        """
+        
+        building = Building.objects.create(address='Main St 1')
+        self.flat = Flat.objects.create(building=building, flat_number=1, flat_floor=1, square=50)
+
+    def test_consecutive_readings_record_consumption (
+        self,
+    ) -> None:
+        
+        """
+        Test that a reading following the previous month's reading records the consumption.
+        """
+        
+        WaterMeter.objects.create(flat=self.flat, month=date(2024, 1, 1), reading=150)
+        WaterMeter.objects.create(flat=self.flat, month=date(2024, 2, 1), reading=200)
+        
+        consumption = MonthlyConsumption.objects.get()
+        
+        self.assertEqual(consumption.month, date(2024, 2, 1))
+        self.assertEqual(consumption.previous_reading, 150)
+        self.assertEqual(consumption.consumption, 50)
+
+    def test_late_previous_reading_records_consumption (
+        self,
+    ) -> None:
+        
+        """
+        Test that a previous month's reading entered late fills in the following month.
+        """
+        
+        WaterMeter.objects.create(flat=self.flat, month=date(2024, 2, 1), reading=200)
+        self.assertFalse(MonthlyConsumption.objects.exists())
+        
+        WaterMeter.objects.create(flat=self.flat, month=date(2024, 1, 1), reading=120)
+        
+        self.assertEqual (
+            ConsumptionRecorder.consumption_for([self.flat.id], date(2024, 2, 1)), 
+            {self.flat.id: 80},
+        )
+
+    def test_deleting_reading_removes_consumption (
+        self,
+    ) -> None:
+        
+        """
+        Test that removing a reading removes the consumption that depended on it.
+        """
+        
+        previous_reading = WaterMeter.objects.create(flat=self.flat, month=date(2024, 1, 1), reading=150)
+        WaterMeter.objects.create(flat=self.flat, month=date(2024, 2, 1), reading=200)
+        
+        previous_reading.delete()
+        
+        self.assertFalse(MonthlyConsumption.objects.exists())
+
+    def test_counter_consumption_for (
+        self,
+    ) -> None:
+        
+        """
+        Test that metered consumption compares the latest readings of the month and the previous month.
+        """
+        
+        heat = Counter.objects.create(flat=self.flat, counter_type=Counter.CounterType.HEAT, last_reading=0, current_reading=0)
+        
+        for reading_date, reading in ((date(2024, 1, 10), 10), (date(2024, 1, 31), 12), (date(2024, 2, 15), 20), (date(2024, 3, 1), 30)):
+            history = CounterHistory.objects.create(counter=heat, reading=reading)
+            CounterHistory.objects.filter(id=history.id).update(date=reading_date)
+        
+        self.assertEqual (
+            ConsumptionRecorder.counter_consumption_for([self.flat.id], date(2024, 2, 1)), 
+            {self.flat.id: {Counter.CounterType.HEAT: 8}},
+        )
+        self.assertEqual(ConsumptionRecorder.counter_consumption_for([self.flat.id], date(2024, 1, 1)), {})
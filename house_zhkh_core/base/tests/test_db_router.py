@@ -0,0 +1,145 @@
+from datetime import date
+from unittest.mock import patch
+
+from django.db import connections
+from django.test import SimpleTestCase, TransactionTestCase, override_settings
+
+from base.controllers.payment_controllers.billing_scope.billing_scope import BillingScope
+from base.controllers.payment_controllers.payment_calculator.payment_calculator import PaymentCalculator
+from base.controllers.payment_controllers.payment_processor.payment_processor import PaymentProcessor
+from base.controllers.payment_controllers.reading_change_log.reading_change_log import ReadingChangeLog
+from base.models.building import Building
+from base.models.building_billing_summary import BuildingBillingSummary
+from base.models.dirty_flat import DirtyFlat
+from base.models.flat import Flat
+from base.models.payment import Payment
+from base.models.water_meter import WaterMeter
+from project.db_router.db_router import ReplicaRouter
+
+@override_settings(DATABASE_REPLICAS=['replica'])
+class ReplicaRouterTest(SimpleTestCase):
+    
+    """
+    Test suite for the ReplicaRouter class.
+    """
+    
+    def setUp (
+        self,
+    ) -> None:
+        
+        """
+        Set up the router under test.
+        """
+        
+        self.router = ReplicaRouter()
+
+    def test_reporting_reads_go_to_replica (
+        self,
+    ) -> None:
+        
+        """
+        Test that reporting reads go to a replica and billing reads and all writes to the primary.
+        """
+        
+        self.assertEqual(self.router.db_for_read(BuildingBillingSummary), 'replica')
+        self.assertIsNone(self.router.db_for_read(Flat))
+        self.assertIsNone(self.router.db_for_read(WaterMeter))
+        self.assertIsNone(self.router.db_for_read(Payment))
+        self.assertEqual(self.router.db_for_write(BuildingBillingSummary), 'default')
+
+    def test_reads_in_primary_transaction_stay_on_primary (
+        self,
+    ) -> None:
+        
+        """
+        Test that reads inside a transaction on the primary are not sent to a replica.
+        """
+        
+        with patch.object(connections['default'], 'in_atomic_block', True):
+            self.assertIsNone(self.router.db_for_read(BuildingBillingSummary))
+
+    @override_settings(DATABASE_REPLICAS=[])
+    def test_no_replicas (
+        self,
+    ) -> None:
+        
+        """
+        Test that the router falls back to the primary without configured replicas.
+        """
+        
+        self.assertIsNone(self.router.db_for_read(BuildingBillingSummary))
+
+    def test_replicas_not_migrated (
+        self,
+    ) -> None:
+        
+        """
+        Test that migrations only run on the primary.
+        """
+        
+        self.assertFalse(self.router.allow_migrate('replica', 'base'))
+        self.assertIsNone(self.router.allow_migrate('default', 'base'))
+
+
+@override_settings(DATABASE_REPLICAS=['lagging_replica'])
+class LaggingReplicaTest(TransactionTestCase):
+    
+    """
+    Test billing against a replica that has not applied any of the primary's writes.
+
+    The `lagging_replica` alias is an independent, empty database, and the test runs outside
+    of a transaction so the router really sends replica reads to it.
+    """
+    
+    databases = {'default', 'lagging_replica'}
+
+    def setUp (
+        self,
+    ) -> None:
+        
+        """
+        Set up a flat with a pending reading change on the primary only.
+        """
+        
+        building = Building.objects.create(address='Main St 1')
+        self.flat = Flat.objects.create(building=building, flat_number=1, flat_floor=1, square=50)
+        ReadingChangeLog.mark([self.flat.id], [date(2024, 2, 1)])
+
+    def test_billing_reads_inputs_from_primary (
+        self,
+    ) -> None:
+        
+        """
+        Test that a changed-only run bills the flat the replica does not know about yet, and
+        only consumes the change log mark once the flat has been billed.
+        """
+        
+        fees = {
+            'water_fee': 100, 
+            'gas_fee': 0, 
+            'electricity_fee': 0, 
+            'heat_fee': 0, 
+            'common_area_fee': 50, 
+            'total_fee': 150,
+        }
+        with patch.object(PaymentCalculator, 'calculate_fees', return_value=fees):
+            payments = PaymentProcessor().process_payments (
+                date(2024, 2, 1), 
+                scope=BillingScope(changed_only=True),
+            )
+        
+        self.assertEqual([payment.flat_id for payment in payments], [self.flat.id])
+        self.assertFalse(DirtyFlat.objects.exists())
+
+    def test_reporting_reads_from_replica (
+        self,
+    ) -> None:
+        
+        """
+        Test that building summaries are read from the replica, which may lag behind.
+        """
+        
+        PaymentProcessor().process_payments(date(2024, 2, 1))
+        
+        self.assertTrue(BuildingBillingSummary.objects.using('default').exists())
+        self.assertFalse(BuildingBillingSummary.objects.exists())
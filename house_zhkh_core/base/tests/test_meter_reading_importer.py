@@ -0,0 +1,126 @@
+import io
+from datetime import date  
+
+from django.test import TestCase  
+
+from base.controllers.reading_controllers.meter_reading_importer.meter_reading_importer import (
+    MeterReadingImporter,
+)
+from base.models.building import Building
+from base.models.counter import Counter, CounterHistory
+from base.models.dirty_flat import DirtyFlat
+from base.models.flat import Flat
+
+class MeterReadingImporterTest(TestCase):
+    
+    """
+    Test suite for the MeterReadingImporter class.
+    """
+
+    def setUp (
+        self,
+    ) -> None:
+        
+        """
+        Set up a flat with a gas, a heat and a water counter.
+        """
+        
+        building = Building.objects.create(address='Main St 1')
+        self.flat = Flat.objects.create(building=building, flat_number=1, flat_floor=1, square=50)
+        self.gas = Counter.objects.create (
+            flat=self.flat, 
+            counter_type=Counter.CounterType.GAS, 
+            last_reading=100, 
+            current_reading=120,
+        )
+        self.heat = Counter.objects.create (
+            flat=self.flat, 
+            counter_type=Counter.CounterType.HEAT, 
+            last_reading=10, 
+            current_reading=15,
+        )
+        self.water = Counter.objects.create (
+            flat=self.flat, 
+            counter_type=Counter.CounterType.WATER, 
+            last_reading=1, 
+            current_reading=2,
+        )
+        DirtyFlat.objects.all().delete()
+
+    def test_import_rolls_readings_over (
+        self,
+    ) -> None:
+        
+        """
+        Test that imported readings are recorded and rolled into the counters.
+        """
+        
+        stream = io.StringIO(f'counter_id,reading\n{self.gas.id},135.5\n{self.heat.id},21\n')
+        
+        report = MeterReadingImporter(date(2024, 3, 1), chunk_size=1).import_file(stream)
+        
+        self.gas.refresh_from_db()
+        
+        self.assertEqual(report, {'imported': 2, 'skipped': 0, 'rejected': 0, 'errors': []})
+        self.assertEqual((self.gas.last_reading, self.gas.current_reading), (120, 135.5))
+        self.assertEqual (
+            set(CounterHistory.objects.values_list('counter_id', 'date', 'reading')), 
+            {(self.gas.id, date(2024, 3, 1), 135.5), (self.heat.id, date(2024, 3, 1), 21)},
+        )
+        self.assertEqual (
+            set(DirtyFlat.objects.values_list('flat_id', 'month')), 
+            {(self.flat.id, date(2024, 3, 1)), (self.flat.id, date(2024, 4, 1))},
+        )
+
+    def test_import_rejects_invalid_rows (
+        self,
+    ) -> None:
+        
+        """
+        Test that unknown and water counters, malformed readings and duplicates are rejected
+        and reported.
+        """
+        
+        stream = io.StringIO (
+            f'{self.gas.id},130\n'
+            f'999999,10\n'
+            f'{self.heat.id},abc\n'
+            f'{self.heat.id},-1\n'
+            f'{self.gas.id},140\n'
+            f'{self.water.id},3\n'
+        )
+        
+        report = MeterReadingImporter(date(2024, 3, 1)).import_file(stream)
+        
+        self.gas.refresh_from_db()
+        self.water.refresh_from_db()
+        
+        self.assertEqual(report['imported'], 1)
+        self.assertEqual(report['rejected'], 5)
+        self.assertEqual([line for line, _ in report['errors']], [2, 3, 4, 5, 6])
+        self.assertEqual(self.water.current_reading, 2)
+        self.assertFalse(CounterHistory.objects.filter(counter=self.water).exists())
+        self.assertEqual(self.gas.current_reading, 130)
+
+    def test_reimport_is_idempotent (
+        self,
+    ) -> None:
+        
+        """
+        Test that importing the same readings again, or resuming a partial import, neither
+        duplicates readings nor rolls the counters over twice.
+        """
+        
+        MeterReadingImporter(date(2024, 3, 1)).import_file(io.StringIO(f'{self.gas.id},135\n'))
+        
+        report = MeterReadingImporter(date(2024, 3, 1), chunk_size=1).import_file (
+            io.StringIO(f'{self.gas.id},135\n{self.heat.id},21\n'),
+        )
+        
+        self.gas.refresh_from_db()
+        self.heat.refresh_from_db()
+        
+        self.assertEqual(report, {'imported': 1, 'skipped': 1, 'rejected': 0, 'errors': []})
+        self.assertEqual((self.gas.last_reading, self.gas.current_reading), (120, 135))
+        self.assertEqual((self.heat.last_reading, self.heat.current_reading), (15, 21))
+        self.assertEqual(CounterHistory.objects.count(), 2)
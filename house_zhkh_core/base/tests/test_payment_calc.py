@@ -1,11 +1,14 @@
-from datetime import datetime  
-from unittest.mock import MagicMock, patch  
+from unittest.mock import MagicMock  
 
 from django.test import TestCase  
 
 from base.controllers.payment_controllers.payment_calculator.payment_calculator import (
     PaymentCalculator,
 )
+from base.controllers.payment_controllers.tariff_table.tariff_table import (
+    TariffTable,
+)
+from base.models.tariff import Tariff
 
 class PaymentCalculatorTest(TestCase):
     
@@ -21,34 +24,31 @@ class PaymentCalculatorTest(TestCase):
         Set up common test data for PaymentCalculator tests.
         """
         
-        self.water_rate = 10.0
-        self.common_area_rate = 5.0
-        self.calculator = PaymentCalculator(self.water_rate, self.common_area_rate)
-        self.apartment = MagicMock(square=50)
-        self.current_month = datetime(2024, 2, 1)
-        self.previous_month = datetime(2024, 1, 1)
+        self.tariffs = TariffTable ([
+            Tariff(tariff_type=Tariff.TariffType.WATER, rate=10.0),
+            Tariff(tariff_type=Tariff.TariffType.COMMON_AREA, rate=5.0),
+        ])
+        self.calculator = PaymentCalculator(self.tariffs)
+        self.apartment = MagicMock(square=50, building_id=1, building=MagicMock(region=''))
 
     def test_calculate_fees_success (
         self,
     ) -> None:
         
         """
-        Test fee calculation when water meter readings are available.
+        Test fee calculation when the monthly water consumption is available.
         """
         
-        current_reading = MagicMock(reading=200)
-        previous_reading = MagicMock(reading=150)
-        
-        with patch('base.models.water_meter.WaterMeter.objects.filter') as mock_filter:
-            mock_filter.side_effect = [[current_reading], [previous_reading]]
-            result = self.calculator.calculate_fees (
-                self.apartment, 
-                self.current_month, 
-                self.previous_month,
-            )
+        result = self.calculator.calculate_fees (
+            self.apartment, 
+            50,
+        )
         
         expected_result = {
             'water_fee': 500.0,
+            'gas_fee': 0,
+            'electricity_fee': 0,
+            'heat_fee': 0,
             'common_area_fee': 250.0,
             'total_fee': 750.0,
         }
@@ -62,16 +62,13 @@ class PaymentCalculatorTest(TestCase):
     ) -> None:
         
         """
-        Test that the method returns None if water meter readings are missing.
+        Test that the method returns None if the monthly water consumption is unknown.
         """
         
-        with patch('base.models.water_meter.WaterMeter.objects.filter') as mock_filter:
-            mock_filter.side_effect = [[], []]
-            result = self.calculator.calculate_fees (
-                self.apartment, 
-                self.current_month, 
-                self.previous_month,
-            )
+        result = self.calculator.calculate_fees (
+            self.apartment, 
+            None,
+        )
         
         self.assertIsNone(result)
 
@@ -83,23 +80,37 @@ class PaymentCalculatorTest(TestCase):
         Test that water fee is zero if no water was consumed.
         """
         
-        current_reading = MagicMock(reading=150)
-        previous_reading = MagicMock(reading=150)
+        result = self.calculator.calculate_fees (
+            self.apartment, 
+            0,
+        )
         
-        with patch('base.models.water_meter.WaterMeter.objects.filter') as mock_filter:
-            mock_filter.side_effect = [[current_reading], [previous_reading]]
-            result = self.calculator.calculate_fees (
-                self.apartment, 
-                self.current_month, 
-                self.previous_month,
-            )
+        self.assertEqual(result['water_fee'], 0)
+        self.assertEqual(result['total_fee'], 250.0)
+
+    def test_calculate_fees_counter_tariffs (
+        self,
+    ) -> None:
         
-        expected_result = {
-            'water_fee': 0.0,
-            'common_area_fee': 250.0,
-            'total_fee': 250.0,
-        }
-        self.assertEqual (
-            result, 
-            expected_result,
+        """
+        Test that metered utilities are billed with building-specific tariffs taking precedence.
+        """
+        
+        calculator = PaymentCalculator (
+            TariffTable ([
+                Tariff(tariff_type=Tariff.TariffType.HEAT, rate=2.0),
+                Tariff(tariff_type=Tariff.TariffType.HEAT, building_id=1, rate=3.0),
+                Tariff(tariff_type=Tariff.TariffType.GAS, region='north', rate=4.0),
+            ])
         )
+        
+        result = calculator.calculate_fees (
+            self.apartment, 
+            10,
+            {Tariff.TariffType.HEAT: 100, Tariff.TariffType.GAS: 20},
+        )
+        
+        self.assertEqual(result['heat_fee'], 300.0)
+        self.assertEqual(result['gas_fee'], 0)
+        self.assertEqual(result['water_fee'], 0)
+        self.assertEqual(result['total_fee'], 300.0)
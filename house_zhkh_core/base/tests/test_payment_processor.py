@@ -1,5 +1,5 @@
-from datetime import datetime  
-from unittest.mock import MagicMock, patch  
+from datetime import date  
+from unittest.mock import patch  
 
 from django.test import TestCase  
 
@@ -9,6 +9,12 @@ from base.controllers.payment_controllers.payment_calculator.payment_calculator
 from base.controllers.payment_controllers.payment_processor.payment_processor import (
     PaymentProcessor,
 )
+from base.models.balance_ledger_entry import BalanceLedgerEntry
+from base.models.billing_run import BillingRun
+from base.models.building import Building
+from base.models.building_billing_summary import BuildingBillingSummary
+from base.models.flat import Flat, FlatHcsBalance
+from base.models.payment import Payment
 
 class PaymentProcessorTest(TestCase):
     
@@ -16,33 +22,44 @@ class PaymentProcessorTest(TestCase):
     Test suite for the PaymentProcessor class.
     """
 
+    def setUp (
+        self,
+    ) -> None:
+        
+        """
+        Set up a building with two flats.
+        """
+        
+        building = Building.objects.create(address='Main St 1')
+        self.flats = [
+            Flat.objects.create(building=building, flat_number=number, flat_floor=1, square=50)
+            for number in (1, 2)
+        ]
+        self.fees = {
+            'water_fee': 100, 
+            'gas_fee': 0, 
+            'electricity_fee': 0, 
+            'heat_fee': 0, 
+            'common_area_fee': 50, 
+            'total_fee': 150,
+        }
+
     def test_process_payments (
         self,
     ) -> None:
         
         """
-        Test that payments are processed and created correctly.
-        """
-        
-        processor = PaymentProcessor(10.0, 5.0)
-        with patch (
-            'base.models.flat.Flat.objects.all', 
-            return_value=[MagicMock(), MagicMock()]
-        ), \
-            patch.object (
-                PaymentCalculator, 
-                'calculate_fees', 
-                return_value = {
-                    'water_fee': 100, 
-                    'common_area_fee': 50, 
-                    'total_fee': 150,
-                }
-            ), \
-            patch('base.models.payment.Payment.objects.create') as mock_create:
-            
+        Test that payments are processed and stored correctly, and charged to the balances.
+        """
+        
+        processor = PaymentProcessor()
+        with patch.object (
+            PaymentCalculator, 
+            'calculate_fees', 
+            return_value=self.fees,
+        ):
             result = processor.process_payments (
-                datetime(2024, 2, 1), 
-                datetime(2024, 1, 1),
+                date(2024, 2, 1), 
             )
         
         self.assertEqual (
@@ -50,6 +67,95 @@ class PaymentProcessorTest(TestCase):
             2,
         )
         self.assertEqual (
-            mock_create.call_count, 
+            Payment.objects.count(), 
             2,
-        )
\ No newline at end of file
+        )
+        self.assertEqual (
+            list(FlatHcsBalance.objects.order_by('flat_id').values_list('balance', flat=True)), 
+            [-150, -150],
+        )
+        
+        summary = BuildingBillingSummary.objects.get()
+        self.assertEqual((summary.flats_billed, summary.total_fee, summary.debt), (2, 300, 300))
+
+    def test_rebilling_posts_only_the_difference (
+        self,
+    ) -> None:
+        
+        """
+        Test that billing a month again updates the payments and posts only the changed charges.
+        """
+        
+        processor = PaymentProcessor()
+        with patch.object(PaymentCalculator, 'calculate_fees', return_value=self.fees):
+            processor.process_payments(date(2024, 2, 1))
+            processor.process_payments(date(2024, 2, 1))
+        
+        self.assertEqual(BalanceLedgerEntry.objects.count(), 2)
+        
+        with patch.object(PaymentCalculator, 'calculate_fees', return_value={**self.fees, 'total_fee': 170}):
+            processor.process_payments(date(2024, 2, 1))
+        
+        self.assertEqual(Payment.objects.count(), 2)
+        self.assertEqual (
+            sorted(BalanceLedgerEntry.objects.values_list('amount', flat=True)), 
+            [20, 20, 150, 150],
+        )
+        self.assertEqual(FlatHcsBalance.objects.get(flat=self.flats[0]).balance, -170)
+
+    def test_rebilling_stores_only_changed_payments (
+        self,
+    ) -> None:
+        
+        """
+        Test that billing a month again leaves the payments with unchanged fees untouched.
+        """
+        
+        processor = PaymentProcessor()
+        with patch.object(PaymentCalculator, 'calculate_fees', return_value=self.fees):
+            processor.process_payments(date(2024, 2, 1))
+        
+        fees = [self.fees, {**self.fees, 'water_fee': 120, 'total_fee': 170}]
+        with patch.object(PaymentCalculator, 'calculate_fees', side_effect=fees), \
+             patch.object(processor, '_store_payments', wraps=processor._store_payments) as mock_store:
+            result = processor.process_payments(date(2024, 2, 1))
+        
+        self.assertEqual([payment.flat_id for payment in result], [self.flats[1].id])
+        mock_store.assert_called_once()
+        self.assertEqual(Payment.objects.get(flat=self.flats[1]).total_fee, 170)
+
+    def test_diff_payments_writes_nothing (
+        self,
+    ) -> None:
+        
+        """
+        Test that a dry run reports the changed fees without storing payments or runs.
+        """
+        
+        processor = PaymentProcessor()
+        with patch.object(PaymentCalculator, 'calculate_fees', return_value=self.fees):
+            processor.process_payments(date(2024, 2, 1))
+        
+        payments = list(Payment.objects.order_by('id').values_list('id', 'total_fee'))
+        entries = BalanceLedgerEntry.objects.count()
+        
+        fees = [self.fees, {**self.fees, 'water_fee': 120, 'total_fee': 170}]
+        with patch.object(PaymentCalculator, 'calculate_fees', side_effect=fees):
+            changes = processor.diff_payments(date(2024, 2, 1))
+        
+        self.assertEqual (
+            changes, 
+            [
+                {
+                    'flat_id': self.flats[1].id,
+                    'status': 'updated',
+                    'changes': {
+                        'water_fee': {'old': 100, 'new': 120},
+                        'total_fee': {'old': 150, 'new': 170},
+                    },
+                },
+            ],
+        )
+        self.assertEqual(list(Payment.objects.order_by('id').values_list('id', 'total_fee')), payments)
+        self.assertEqual(BalanceLedgerEntry.objects.count(), entries)
+        self.assertEqual(BillingRun.objects.count(), 1)
@@ -0,0 +1,172 @@
+from datetime import date, timedelta  
+
+from django.test import TestCase  
+from django.utils import timezone  
+
+from base.controllers.payment_controllers.reading_change_log.reading_change_log import (
+    ReadingChangeLog,
+)
+from base.models.building import Building
+from base.models.counter import Counter, CounterHistory
+from base.models.dirty_flat import DirtyFlat
+from base.models.flat import Flat
+from base.models.water_meter import WaterMeter
+
+class ReadingChangeLogTest(TestCase):
+    
+    """
+    Test suite for the ReadingChangeLog class and the reading signals feeding it.
+    """
+
+    def setUp (
+        self,
+    ) -> None:
+        
+        """
+        Set up a building with one flat.
+        """
+        
+        building = Building.objects.create(address='Main St 1')
+        self.flat = Flat.objects.create(building=building, flat_number=1, flat_floor=1, square=50)
+
+    def test_water_meter_reading_marks_month_and_next_month (
+        self,
+    ) -> None:
+        
+        """
+        Test that saving a reading marks the flat dirty for its month and the following month.
+        """
+        
+        WaterMeter.objects.create(flat=self.flat, month=date(2024, 12, 1), reading=100)
+        
+        self.assertEqual (
+            set(DirtyFlat.objects.values_list('flat_id', 'month')), 
+            {(self.flat.id, date(2024, 12, 1)), (self.flat.id, date(2025, 1, 1))},
+        )
+
+    def test_counter_reading_marks_month_and_next_month (
+        self,
+    ) -> None:
+        
+        """
+        Test that a counter reading marks the flat dirty for its month and the following month.
+        """
+        
+        counter = Counter.objects.create (
+            flat=self.flat, 
+            counter_type=Counter.CounterType.GAS, 
+            last_reading=10, 
+            current_reading=15,
+        )
+        DirtyFlat.objects.all().delete()
+        
+        reading = CounterHistory.objects.create(counter=counter, reading=15)
+        
+        self.assertEqual (
+            set(DirtyFlat.objects.values_list('flat_id', 'month')), 
+            {
+                (self.flat.id, ReadingChangeLog.month_start(reading.date)), 
+                (self.flat.id, ReadingChangeLog.next_month(reading.date)),
+            },
+        )
+
+    def test_counter_reading_update_marks_reading_month (
+        self,
+    ) -> None:
+        
+        """
+        Test that updating the readings of a counter marks the month of its latest reading,
+        and that saves which leave the readings unchanged mark nothing.
+        """
+        
+        counter = Counter.objects.create (
+            flat=self.flat, 
+            counter_type=Counter.CounterType.GAS, 
+            last_reading=10, 
+            current_reading=15,
+        )
+        reading = CounterHistory.objects.create(counter=counter, reading=15)
+        CounterHistory.objects.filter(pk=reading.pk).update(date=date(2024, 1, 20))
+        DirtyFlat.objects.all().delete()
+        
+        counter.save()
+        counter.current_reading = 16
+        counter.save(update_fields=['counter_type'])
+        
+        self.assertFalse(DirtyFlat.objects.exists())
+        
+        counter.save()
+        
+        self.assertEqual (
+            set(DirtyFlat.objects.values_list('flat_id', 'month')), 
+            {(self.flat.id, date(2024, 1, 1)), (self.flat.id, date(2024, 2, 1))},
+        )
+
+    def test_counter_reading_deletion_marks_month_and_next_month (
+        self,
+    ) -> None:
+        
+        """
+        Test that deleting a counter reading marks the flat dirty for its month and the
+        following month, and that deleting the flat with its readings marks nothing.
+        """
+        
+        counter = Counter.objects.create (
+            flat=self.flat, 
+            counter_type=Counter.CounterType.GAS, 
+            last_reading=10, 
+            current_reading=15,
+        )
+        reading = CounterHistory.objects.create(counter=counter, reading=15)
+        DirtyFlat.objects.all().delete()
+        
+        CounterHistory.objects.get(pk=reading.pk).delete()
+        
+        self.assertEqual (
+            set(DirtyFlat.objects.values_list('flat_id', 'month')), 
+            {
+                (self.flat.id, ReadingChangeLog.month_start(reading.date)), 
+                (self.flat.id, ReadingChangeLog.next_month(reading.date)),
+            },
+        )
+        
+        CounterHistory.objects.create(counter=counter, reading=16)
+        WaterMeter.objects.create(flat=self.flat, month=date(2024, 12, 1), reading=100)
+        self.flat.delete()
+        
+        self.assertFalse(DirtyFlat.objects.exists())
+
+    def test_mark_refreshes_existing_marks (
+        self,
+    ) -> None:
+        
+        """
+        Test that marking an already dirty flat refreshes the mark instead of duplicating it.
+        """
+        
+        ReadingChangeLog.mark([self.flat.id], [date(2024, 2, 15)])
+        first_mark = DirtyFlat.objects.get().marked_at
+        ReadingChangeLog.mark([self.flat.id], [date(2024, 2, 1)])
+        
+        self.assertEqual(DirtyFlat.objects.count(), 1)
+        self.assertGreaterEqual(DirtyFlat.objects.get().marked_at, first_mark)
+
+    def test_clear_keeps_marks_made_after_the_run_started (
+        self,
+    ) -> None:
+        
+        """
+        Test that clearing only removes marks made before the billing run started.
+        """
+        
+        ReadingChangeLog.mark([self.flat.id], [date(2024, 2, 1)])
+        
+        self.assertEqual (
+            ReadingChangeLog.clear(date(2024, 2, 1), timezone.now() - timedelta(minutes=1)), 
+            0,
+        )
+        self.assertEqual (
+            ReadingChangeLog.clear(date(2024, 2, 1), timezone.now()), 
+            1,
+        )
+        self.assertFalse(ReadingChangeLog.dirty_flat_ids(date(2024, 2, 1)).exists())
@@ -0,0 +1,40 @@
+from unittest.mock import patch  
+
+from django.test import TestCase  
+
+from base.controllers.partition_controllers.reading_partitioner.reading_partitioner import (
+    ReadingPartitioner,
+)
+
+class ReadingPartitionerTest(TestCase):
+    
+    """
+    Test suite for the ReadingPartitioner class.
+    """
+
+    def test_partition_name (
+        self,
+    ) -> None:
+        
+        """
+        Test that yearly partitions are named after their table and year.
+        """
+        
+        self.assertEqual (
+            ReadingPartitioner.partition_name('base_watermeter', 2025), 
+            'base_watermeter_y2025',
+        )
+
+    def test_ensure_partitions_requires_postgresql (
+        self,
+    ) -> None:
+        
+        """
+        Test that partitions cannot be created on a database without native partitioning.
+        """
+        
+        with patch('base.controllers.partition_controllers.reading_partitioner.reading_partitioner.connection') as mock_connection:
+            mock_connection.vendor = 'sqlite'
+            
+            with self.assertRaises(ValueError):
+                ReadingPartitioner.ensure_partitions()
@@ -0,0 +1,51 @@
+from datetime import date  
+
+from django.test import TestCase  
+
+from base.controllers.payment_controllers.tariff_table.tariff_table import (
+    TariffTable,
+)
+from base.models.building import Building
+from base.models.tariff import Tariff
+
+class TariffTableTest(TestCase):
+    
+    """
+    Test suite for the TariffTable class.
+    """
+
+    def setUp (
+        self,
+    ) -> None:
+        
+        """
+        Set up a building in a region and a history of water tariffs.
+        """
+        
+        Tariff.objects.all().delete()
+        self.building = Building.objects.create(address='Main St 1', region='north')
+        
+        Tariff.objects.create(tariff_type=Tariff.TariffType.WATER, rate=10, valid_from=date(2023, 1, 1), valid_to=date(2023, 12, 31))
+        Tariff.objects.create(tariff_type=Tariff.TariffType.WATER, rate=12, valid_from=date(2024, 1, 1))
+        Tariff.objects.create(tariff_type=Tariff.TariffType.WATER, region='north', rate=11, valid_from=date(2024, 1, 1))
+        Tariff.objects.create(tariff_type=Tariff.TariffType.WATER, building=self.building, rate=9, valid_from=date(2024, 6, 1))
+
+    def test_load_resolves_tariffs_valid_for_month (
+        self,
+    ) -> None:
+        
+        """
+        Test that only tariffs valid for the month are loaded, most specific first.
+        """
+        
+        with self.assertNumQueries(1):
+            tariffs = TariffTable.load(date(2024, 3, 1))
+        
+        self.assertEqual(tariffs.rate(Tariff.TariffType.WATER, self.building.id, 'north'), 11)
+        self.assertEqual(tariffs.rate(Tariff.TariffType.WATER, None, 'south'), 12)
+        self.assertIsNone(tariffs.rate(Tariff.TariffType.GAS))
+        self.assertEqual (
+            TariffTable.load(date(2024, 6, 1)).rate(Tariff.TariffType.WATER, self.building.id, 'north'), 
+            9,
+        )
+        self.assertEqual(TariffTable.load(date(2023, 5, 1)).rate(Tariff.TariffType.WATER), 10)
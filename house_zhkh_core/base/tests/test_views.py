@@ -1,3 +1,5 @@
+from datetime import date  
+
 from django.test import TestCase  
 from django.urls import reverse  
 
@@ -5,6 +7,9 @@ from rest_framework.test import APIClient
 
 from unittest.mock import MagicMock, patch  
 
+from base.models.building import Building
+from base.models.building_billing_summary import BuildingBillingSummary
+
 class PaymentCalculationViewTest(TestCase):
     
     """
@@ -16,17 +21,52 @@ class PaymentCalculationViewTest(TestCase):
     ) -> None:
         
         self.client = APIClient()
-        self.url = reverse('calculate-payments')
+        self.url = reverse('calculate_payment')
     
-    @patch('base.views.views.PaymentCalculationView.post', return_value=[MagicMock(), MagicMock()])
-    def test_payment_calculation_success (
+    @patch('base.views.views.CalculatePaymentsTask.delay', return_value=MagicMock(id='task_123'))
+    def test_payment_calculation_enqueued (
         self, 
-        mock_process_payments,
+        mock_delay,
     ) -> None:
         
         response = self.client.post(self.url, {'month': '2024-02'})
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.data['TASK_ID'], 'task_123')
+        self.assertEqual(response.data['STATUS_URL'], reverse('task_status', kwargs={'task_id': 'task_123'}))
+        mock_delay.assert_called_once_with (
+            '2024-02-01', 
+            scope={'building_ids': [], 'flat_ids': [], 'changed_only': True}, 
+            profile=False,
+            dry_run=False,
+        )
+    
+    @patch('base.views.views.CalculatePaymentsTask.delay')
+    @patch('base.views.views.PaymentProcessor.process_payments', return_value=[MagicMock(), MagicMock()])
+    def test_payment_calculation_small_scope_is_synchronous (
+        self, 
+        mock_process_payments,
+        mock_delay,
+    ) -> None:
+        
+        response = self.client.post(self.url, {'month': '2024-02', 'building_id': 1})
         self.assertEqual(response.status_code, 201)
         self.assertEqual(response.data['CREATED_PAYMENTS'], 2)
+        mock_process_payments.assert_called_once()
+        mock_delay.assert_not_called()
+    
+    @patch('base.views.views.PaymentProcessor.process_payments')
+    @patch('base.views.views.PaymentProcessor.diff_payments', return_value=[{'flat_id': 1, 'status': 'created', 'changes': {}}])
+    def test_payment_calculation_dry_run (
+        self, 
+        mock_diff_payments,
+        mock_process_payments,
+    ) -> None:
+        
+        response = self.client.post(self.url, {'month': '2024-02', 'building_id': 1, 'dry_run': 'true'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['CHANGED_PAYMENTS'], 1)
+        self.assertEqual(response.data['DIFF'], mock_diff_payments.return_value)
+        mock_process_payments.assert_not_called()
     
     def test_missing_month_field (
         self,
@@ -35,6 +75,14 @@ class PaymentCalculationViewTest(TestCase):
         response = self.client.post(self.url, {})
         self.assertEqual(response.status_code, 400)
         self.assertIn('ERROR', response.data)
+    
+    def test_invalid_month_field (
+        self,
+    ) -> None:
+        
+        response = self.client.post(self.url, {'month': '2024/02'})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('ERROR', response.data)
 
 class CalculatePaymentsViewTest(TestCase):
     
@@ -47,17 +95,35 @@ class CalculatePaymentsViewTest(TestCase):
     ) -> None:
         
         self.client = APIClient()
-        self.url = reverse('trigger-payment-task')
+        self.url = reverse('calculate_payments')
     
-    @patch('base.views.views.CalculatePaymentsView.post', return_value=MagicMock(id='task_123'))
+    @patch('base.views.views.CalculatePaymentsTask.delay', return_value=MagicMock(id='task_123'))
     def test_task_triggered_successfully (
         self, 
-        mock_task
+        mock_delay,
     ) -> None:
         
         response = self.client.post(self.url, {'month': '2024-02'})
         self.assertEqual(response.status_code, 202)
         self.assertEqual(response.data['TASK_ID'], 'task_123')
+        mock_delay.assert_called_once_with (
+            '2024-02-01', 
+            scope={'building_ids': [], 'flat_ids': [], 'changed_only': True}, 
+            profile=False,
+            dry_run=False,
+        )
+    
+    @patch('base.views.views.CalculatePaymentsTask.delay')
+    def test_invalid_month_not_enqueued (
+        self, 
+        mock_delay,
+    ) -> None:
+        
+        for data in ({}, {'month': '2024/02'}):
+            response = self.client.post(self.url, data)
+            self.assertEqual(response.status_code, 400)
+            self.assertIn('ERROR', response.data)
+        mock_delay.assert_not_called()
 
 class TaskStatusViewTest(TestCase):
     
@@ -70,19 +136,86 @@ class TaskStatusViewTest(TestCase):
     ) -> None:
         
         self.client = APIClient()
-        self.url = reverse('task-status', kwargs={'task_id': 'task_123'})
+        self.url = reverse('task_status', kwargs={'task_id': 'task_123'})
     
-    @patch('base.views.views.TaskStatusView.get')
+    @patch('base.views.views.BillingProgressStore.get')
     def test_task_status_retrieval (
         self, 
-        mock_async_result,
+        mock_get_progress,
     ) -> None:
         
-        mock_async_result.return_value.state = 'SUCCESS'
-        mock_async_result.return_value.info = {'current': 1, 'total': 2}
-        mock_async_result.return_value.result = 'Completed'
+        mock_get_progress.return_value = {
+            'state': 'SUCCESS',
+            'current': 2,
+            'total': 2,
+            'result': 'Completed',
+            'throughput': 4.0,
+            'eta': None,
+        }
         
         response = self.client.get(self.url)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.data['STATE'], 'SUCCESS')
+        self.assertEqual(response.data['THROUGHPUT'], 4.0)
         self.assertEqual(response.data['RESULT'], 'Completed')
+        mock_get_progress.assert_called_once_with('task_123')
+    
+    @patch('base.views.views.BillingProgressStore.get', return_value=None)
+    def test_task_status_pending (
+        self, 
+        mock_get_progress,
+    ) -> None:
+        
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['STATE'], 'PENDING')
+        self.assertIsNone(response.data['RESULT'])
+
+
+class BuildingSummaryViewTest(TestCase):
+    
+    """
+    Test suite for the BuildingSummaryView API.
+    """
+
+    def setUp (
+        self,
+    ) -> None:
+        
+        self.client = APIClient()
+        self.building = Building.objects.create(address='Main St 1')
+        BuildingBillingSummary.objects.create (
+            building=self.building, 
+            month=date(2024, 2, 1), 
+            flats_billed=2, 
+            total_fee=300,
+            debt=120,
+        )
+    
+    def test_building_summary (
+        self,
+    ) -> None:
+        
+        response = self.client.get(reverse('building_summary', kwargs={'building_id': self.building.id, 'month': '2024-02'}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['FLATS_BILLED'], 2)
+        self.assertEqual(response.data['TOTAL_FEE'], 300)
+        self.assertEqual(response.data['DEBT'], 120)
+        
+        response = self.client.get(reverse('building_summary', kwargs={'building_id': self.building.id, 'month': '2024-02-01'}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['FLATS_BILLED'], 2)
+    
+    def test_building_summary_not_found (
+        self,
+    ) -> None:
+        
+        response = self.client.get(reverse('building_summary', kwargs={'building_id': self.building.id, 'month': '2024-03'}))
+        self.assertEqual(response.status_code, 404)
+    
+    def test_building_summary_invalid_month (
+        self,
+    ) -> None:
+        
+        response = self.client.get(reverse('building_summary', kwargs={'building_id': self.building.id, 'month': 'march'}))
+        self.assertEqual(response.status_code, 400)
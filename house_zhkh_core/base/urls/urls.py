@@ -1,8 +1,10 @@
 from django.urls import path
 
 from base.views.views import (
+    BuildingSummaryView,
     CalculatePaymentsView,
     TaskStatusView,
+    TaskProfileView,
     PaymentCalculationView,
 )
 
@@ -22,4 +24,14 @@ urlpatterns = [
         TaskStatusView.as_view(), 
         name='task_status',
     ),
+    path (
+        'task_profile/<str:task_id>/', 
+        TaskProfileView.as_view(), 
+        name='task_profile',
+    ),
+    path (
+        'building_summary/<int:building_id>/<str:month>/', 
+        BuildingSummaryView.as_view(), 
+        name='building_summary',
+    ),
 ]
\ No newline at end of file
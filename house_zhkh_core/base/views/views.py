@@ -1,23 +1,35 @@
-from datetime import datetime, timedelta
 from typing import Any, List, Dict
+from uuid import uuid4
 
-from celery.result import AsyncResult
+from django.urls import reverse
 from rest_framework import status
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from base.tasks import CalculatePaymentsTask
+from base.controllers.payment_controllers.billing_period.billing_period import BillingPeriod
+from base.controllers.payment_controllers.billing_profiler.billing_profiler import BillingProfiler
+from base.controllers.payment_controllers.billing_progress.billing_progress import BillingProgressStore
+from base.controllers.payment_controllers.billing_scope.billing_scope import BillingScope
+from base.controllers.payment_controllers.payment_diff.payment_diff import PaymentDiff
 from base.controllers.payment_controllers.payment_processor.payment_processor import PaymentProcessor
-from base.models.payment import Payment
+from base.controllers.payment_controllers.request_flag.request_flag import RequestFlag
+from base.models.building_billing_summary import BuildingBillingSummary
 
 class PaymentCalculationView(APIView):
     
     """
     API view to calculate payments for apartments based on water consumption.
     
-    This view expects a POST request with a 'month' field in the format 'YYYY-MM'. 
-    It calculates the payments for the provided month and returns the number of created payments.
+    This view expects a POST request with a 'month' field in the format 'YYYY-MM' and an
+    optional billing scope (see `BillingScope.from_data`). Small scopes (a single building
+    or a short list of flats) are billed synchronously and the number of created payments
+    is returned. Any larger run is enqueued as a `CalculatePaymentsTask` and the task id is
+    returned immediately, so the request never holds a worker for the duration of a full
+    billing run; its progress is available through `TaskStatusView`.
+    An optional 'profile' flag captures a cProfile of the run, retrievable via `TaskProfileView`.
+    An optional 'dry_run' flag only reports the payments that would change, without writing them.
     """
     
     def __init__ (
@@ -28,8 +40,7 @@ class PaymentCalculationView(APIView):
         """
         Initialize the PaymentCalculationView.
         
-        Sets default water and common area rates, and creates an instance of PaymentProcessor 
-        with those rates.
+        Creates an instance of PaymentProcessor, which bills with the rates of the `Tariff` table.
         
         Args:
             **kwargs: Additional keyword arguments passed to the base APIView.
@@ -37,12 +48,7 @@ class PaymentCalculationView(APIView):
         
         super().__init__(**kwargs)
         
-        self.water_rate: int = 10
-        self.common_area_rate: int = 5
-        self.payment_processor: PaymentProcessor = PaymentProcessor (
-            self.water_rate, 
-            self.common_area_rate
-        )
+        self.payment_processor: PaymentProcessor = PaymentProcessor()
 
     def post (
         self, 
@@ -55,8 +61,13 @@ class PaymentCalculationView(APIView):
         Calculate payments for a specified month.
         
         The view expects a JSON payload containing a "month" key with the value formatted as 'YYYY-MM'.
-        It parses the month, calculates the previous month's date, and processes payments via the
-        PaymentProcessor. The response includes the status, a success message, and the number of payments created.
+        The payload may also restrict the run with "building_id(s)", "flat_id(s)" or "changed_only".
+        Small scopes are billed synchronously via the PaymentProcessor. Otherwise the billing job
+        is enqueued and the response carries the task id and the URL to poll its progress.
+        If the payload contains a truthy "profile" key, the run is profiled and the response also
+        includes the 'PROFILE_ID' under which the stats were stored (for enqueued runs the task id
+        doubles as the profile id). If it contains a truthy "dry_run" key, the payments are only
+        compared with the stored ones and the differences are reported instead of written.
         
         Args:
             request (Request): The HTTP request object containing the 'month' data.
@@ -64,12 +75,23 @@ class PaymentCalculationView(APIView):
             **kwargs: Additional keyword arguments.
         
         Returns:
-            Response: A JSON response with:
+            Response: For synchronous runs, a 201 Created JSON response with:
                 - 'STATUS': A string indicating success.
                 - 'MESSAGE': A message indicating successful payment calculation.
-                - 'CREATED_PAYMENTS': An integer representing the number of payments created.
+                - 'CREATED_PAYMENTS': An integer representing the number of payments created or updated.
+                - 'PROFILE_ID': The profile identifier, only present for profiled runs.
+            For synchronous dry runs, a 200 OK JSON response with:
+                - 'STATUS', 'MESSAGE' and 'PROFILE_ID' as above.
+                - 'CHANGED_PAYMENTS': The number of payments that would be created or updated.
+                - 'DIFF': The differences, as reported by `PaymentDiff.changes`.
+                - 'TRUNCATED': Whether the differences were cut at `settings.BILLING_DIFF_LIMIT`.
+            For enqueued runs, a 202 Accepted JSON response with:
+                - 'STATUS': A string indicating the job was queued.
+                - 'MESSAGE': A message indicating the job was queued.
+                - 'TASK_ID': The id of the enqueued `CalculatePaymentsTask`.
+                - 'STATUS_URL': The `TaskStatusView` URL for the task.
                 
-            If the "month" field is missing, returns a 400 Bad Request.
+            If the "month" field is missing or malformed, or the scope is malformed, returns a 400 Bad Request.
             If an exception occurs during processing, returns a 500 Internal Server Error with an error message.
         """
         
@@ -83,20 +105,89 @@ class PaymentCalculationView(APIView):
             )
 
         try:
-            month_date = datetime.strptime(month, '%Y-%m')
-            prev_month_date = month_date - timedelta(days=month_date.day)
-
-            created_payments: List[Payment] = self.payment_processor.process_payments (
-                month_date, 
-                prev_month_date,
+            period = BillingPeriod.parse(month)
+        except ValueError:
+            return Response (
+                {
+                    'ERROR': 'Invalid month format. Expected "YYYY-MM".',
+                },
+                status=status.HTTP_400_BAD_REQUEST,
             )
 
+        try:
+            scope = BillingScope.from_data(request.data)
+        except ValueError as e:
             return Response (
                 {
+                    'ERROR': f'Invalid billing scope: {e}',
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        try:
+            profile = BillingProfiler.is_enabled(request.data.get('profile'))
+            dry_run = RequestFlag.parse(request.data.get('dry_run'))
+
+            if not scope.is_small():
+                task = CalculatePaymentsTask.delay (
+                    period.key, 
+                    scope=scope.to_dict(),
+                    profile=profile,
+                    dry_run=dry_run,
+                )
+                
+                return Response (
+                    {
+                        'STATUS': 'queued',
+                        'MESSAGE': 'Payment calculation has been queued.',
+                        'TASK_ID': task.id,
+                        'STATUS_URL': reverse('task_status', kwargs={'task_id': task.id}),
+                    },
+                    status=status.HTTP_202_ACCEPTED,
+                )
+
+            if dry_run:
+                calculate = self.payment_processor.diff_payments
+                response: Dict[str, Any] = {
+                    'STATUS': 'success',
+                    'MESSAGE': 'Payment changes calculated, nothing was stored.',
+                }
+            else:
+                calculate = self.payment_processor.process_payments
+                response = {
                     'STATUS': 'success',
                     'MESSAGE': 'Payments calculated successfully.',
-                    'CREATED_PAYMENTS': len(created_payments),
-                },
+                }
+
+            if profile:
+                profile_id = uuid4().hex
+                with BillingProfiler().profile(profile_id):
+                    results: List[Any] = calculate (
+                        period, 
+                        scope=scope,
+                    )
+                response['PROFILE_ID'] = profile_id
+            else:
+                results = calculate (
+                    period, 
+                    scope=scope,
+                )
+
+            if dry_run:
+                report = PaymentDiff.summarize(results)
+                response['CHANGED_PAYMENTS'] = report['changed']
+                response['DIFF'] = report['diff']
+                response['TRUNCATED'] = report['truncated']
+                
+                return Response (
+                    response,
+                    status=status.HTTP_200_OK,
+                )
+
+            response['CREATED_PAYMENTS'] = len(results)
+
+            return Response (
+                response,
                 status=status.HTTP_201_CREATED,
             )
 
@@ -114,9 +205,9 @@ class CalculatePaymentsView(APIView):
     """
     API view to trigger asynchronous calculation of payments for a given month.
 
-    This view accepts a POST request containing a 'month' parameter in the request body.
-    It then enqueues a Celery task to calculate the payments for that month and returns
-    the task's unique identifier for tracking purposes.
+    This view accepts a POST request containing a 'month' parameter in the request body,
+    optionally restricted to a billing scope. It then enqueues a Celery task to calculate
+    the payments for that month and returns the task's unique identifier for tracking purposes.
     """
     
     def post (
@@ -129,15 +220,43 @@ class CalculatePaymentsView(APIView):
 
         Expects:
             A POST request with a JSON payload containing:
-                - "month" (str): The month for which to calculate payments.
+                - "month" (str): The month for which to calculate payments, in 'YYYY-MM' format.
+                - "building_id(s)", "flat_id(s)", "changed_only" (optional): The billing scope.
+                - "profile" (bool, optional): Whether to capture a cProfile of the task run.
+                - "dry_run" (bool, optional): Whether to only report the payments that would change.
 
         Returns:
             Response: A JSON response with the key 'TASK_ID' containing the ID of the enqueued task,
             and an HTTP 202 Accepted status code.
+            If the "month" field is missing or malformed, or the scope is malformed, returns a 400 Bad Request.
         """
         
-        month: str = request.data.get('month')
-        task = CalculatePaymentsTask.delay(month)
+        try:
+            period = BillingPeriod.parse(request.data.get('month'))
+        except ValueError:
+            return Response (
+                {
+                    'ERROR': 'Invalid month format. Expected "YYYY-MM".',
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        
+        try:
+            scope = BillingScope.from_data(request.data)
+        except ValueError as e:
+            return Response (
+                {
+                    'ERROR': f'Invalid billing scope: {e}',
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        
+        task = CalculatePaymentsTask.delay (
+            period.key, 
+            scope=scope.to_dict(),
+            profile=BillingProfiler.is_enabled(request.data.get('profile')),
+            dry_run=RequestFlag.parse(request.data.get('dry_run')),
+        )
         
         return Response (
             {
@@ -150,10 +269,11 @@ class CalculatePaymentsView(APIView):
 class TaskStatusView(APIView):
     
     """
-    API view to check the status of an asynchronous Celery task.
+    API view to check the status of an asynchronous billing task.
 
     This view accepts a GET request with a task_id parameter and returns the current state,
-    progress, and result of the corresponding Celery task.
+    progress, throughput, ETA and result of the corresponding Celery task, as recorded in the
+    `BillingProgressStore` (a single Redis round trip per request).
     """
     
     def get (
@@ -171,23 +291,178 @@ class TaskStatusView(APIView):
 
         Returns:
             Response: A JSON response containing:
-                - "STATE": The current state of the task.
+                - "STATE": The current state of the task ('PENDING' if nothing is recorded yet).
                 - "CURRENT": The current progress count (if available; otherwise 0).
                 - "TOTAL": The total expected count (if available; otherwise 1).
+                - "THROUGHPUT": The processing rate in flats per second.
+                - "ETA": The estimated number of seconds until completion, or None if unknown.
                 - "RESULT": The task result if available, or None if pending.
         """
 
-        task_result = AsyncResult(task_id)
+        progress = BillingProgressStore().get(task_id)
 
-        response: Dict[str, Any] = {
-            'STATE': task_result.state,
-            'CURRENT': task_result.info.get('current', 0)
-            if task_result.state != 'PENDING'
-            else 0,
-            'TOTAL': task_result.info.get('total', 1)
-            if task_result.state != 'PENDING'
-            else 1,
-            'RESULT': task_result.result if task_result.state != 'PENDING' else None,
-        }
+        if progress is None:
+            response: Dict[str, Any] = {
+                'STATE': 'PENDING',
+                'CURRENT': 0,
+                'TOTAL': 1,
+                'THROUGHPUT': 0.0,
+                'ETA': None,
+                'RESULT': None,
+            }
+        else:
+            response = {
+                'STATE': progress['state'],
+                'CURRENT': progress['current'],
+                'TOTAL': progress['total'] or 1,
+                'THROUGHPUT': progress['throughput'],
+                'ETA': progress['eta'],
+                'RESULT': progress['result'],
+            }
 
         return Response(response)
+
+
+class TaskProfileView(APIView):
+    
+    """
+    API view to inspect the cProfile stats captured for a profiled billing run.
+
+    This view accepts a GET request with a task_id (or the PROFILE_ID returned by
+    `PaymentCalculationView`) and returns the most expensive functions of the run.
+    """
+    
+    def get (
+        self, 
+        request: Request, 
+        task_id: str,
+    ) -> Response:
+        
+        """
+        Retrieve the top functions of a profiled billing run.
+
+        Query parameters:
+            - "limit" (int, optional): The number of functions to return, at least 1. Defaults to 20.
+            - "sort" (str, optional): The `pstats` sort key. Defaults to 'cumulative'.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            task_id (str): The Celery task id or profile id of the run.
+
+        Returns:
+            Response: A JSON response containing:
+                - "TASK_ID": The requested identifier.
+                - "FUNCTIONS": The list of top functions with call counts and timings.
+                
+            If no profile exists for the identifier, returns a 404 Not Found.
+            If the query parameters are invalid, returns a 400 Bad Request.
+        """
+        
+        try:
+            limit = int(request.query_params.get('limit', 20))
+            if limit < 1:
+                raise ValueError('limit must be a positive integer')
+            functions = BillingProfiler().top_functions (
+                task_id, 
+                limit=limit, 
+                sort_by=request.query_params.get('sort', 'cumulative'),
+            )
+        except (KeyError, ValueError) as e:
+            return Response (
+                {
+                    'ERROR': str(e),
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        if functions is None:
+            return Response (
+                {
+                    'ERROR': 'Profile not found',
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response (
+            {
+                'TASK_ID': task_id,
+                'FUNCTIONS': functions,
+            }
+        )
+
+
+class BuildingSummaryView(APIView):
+    
+    """
+    API view to read the pre-aggregated billing totals of a building for a month.
+
+    Summaries are maintained in `BuildingBillingSummary` at the end of every billing run,
+    so a request costs a single indexed lookup regardless of the size of the building.
+    """
+    
+    def get (
+        self, 
+        request: Request, 
+        building_id: int, 
+        month: str,
+    ) -> Response:
+        
+        """
+        Retrieve the billing summary of a building.
+
+        Args:
+            request (Request): The incoming HTTP request.
+            building_id (int): The building to summarize.
+            month (str): The billing month in 'YYYY-MM' format.
+
+        Returns:
+            Response: A JSON response containing:
+                - "BUILDING_ID", "MONTH": The requested building and month.
+                - "FLATS_BILLED": The number of apartments billed for the month.
+                - "WATER_FEE", "GAS_FEE", "ELECTRICITY_FEE", "HEAT_FEE", "COMMON_AREA_FEE",
+                  "TOTAL_FEE": The fee totals of the building.
+                - "DEBT": The total debt of the building's apartments.
+                - "REFRESHED_AT": When the summary was last refreshed.
+                
+            If the month is malformed, returns a 400 Bad Request.
+            If the building has not been billed for the month, returns a 404 Not Found.
+        """
+        
+        try:
+            month_date = BillingPeriod.parse(month).month
+        except ValueError:
+            return Response (
+                {
+                    'ERROR': 'Invalid month format. Expected "YYYY-MM".',
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        summary = BuildingBillingSummary.objects.filter (
+            building_id=building_id, 
+            month=month_date,
+        ).first()
+
+        if summary is None:
+            return Response (
+                {
+                    'ERROR': 'Summary not found',
+                },
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        return Response (
+            {
+                'BUILDING_ID': building_id,
+                'MONTH': month,
+                'FLATS_BILLED': summary.flats_billed,
+                'WATER_FEE': summary.water_fee,
+                'GAS_FEE': summary.gas_fee,
+                'ELECTRICITY_FEE': summary.electricity_fee,
+                'HEAT_FEE': summary.heat_fee,
+                'COMMON_AREA_FEE': summary.common_area_fee,
+                'TOTAL_FEE': summary.total_fee,
+                'DEBT': summary.debt,
+                'REFRESHED_AT': summary.refreshed_at,
+            }
+        )
@@ -1,9 +1,33 @@
 import os
 
 from celery import Celery
+from celery.signals import worker_process_shutdown
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project.settings.settings')
 
 app = Celery('project')
 app.config_from_object('django.conf:settings', namespace='CELERY')
-app.autodiscover_tasks()
\ No newline at end of file
+app.autodiscover_tasks()
+
+@worker_process_shutdown.connect
+def close_database_connections (
+    **kwargs,
+) -> None:
+    
+    """
+    Close the database connections (and connection pools) of a worker process on exit.
+
+    Within a worker process Celery's Django fixup already closes unusable or expired
+    connections around every task, so with `CONN_MAX_AGE` a connection is reused by the
+    tasks of a process until it expires or fails its health check. This handler closes
+    whatever is left when the process exits, instead of leaving the server to time the
+    sessions out.
+    """
+    
+    from django.db import connections
+
+    for connection in connections.all(initialized_only=True):
+        connection.close()
+        close_pool = getattr(connection, 'close_pool', None)
+        if close_pool is not None:
+            close_pool()
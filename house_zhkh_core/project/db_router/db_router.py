@@ -0,0 +1,104 @@
+import random
+
+from typing import List, Optional
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Model
+
+class ReplicaRouter:
+    
+    """
+    Routes reporting reads to the read replicas listed in `settings.DATABASE_REPLICAS`.
+
+    Reads of the models in `REPLICA_MODELS` (the precomputed reporting summaries) go to a
+    randomly chosen replica; everything else, and every write, goes to the primary. Billing
+    inputs (flats, readings and the reading change log) are deliberately not listed: a
+    billing run consumes the change log marks made before it started, so reading its inputs
+    from a lagging replica would leave apartments billed from stale readings and never billed
+    again. Reads issued inside a transaction on the primary stay on the primary, so code that
+    reads its own writes never sees replication lag. Without configured replicas the router
+    is a no-op.
+    """
+    
+    REPLICA_MODELS = {
+        'base.buildingbillingsummary',
+    }
+
+    @staticmethod
+    def replicas () -> List[str]:
+        
+        """
+        Returns the aliases of the configured read replicas.
+        """
+        
+        return list(getattr(settings, 'DATABASE_REPLICAS', []))
+
+    def db_for_read (
+        self, 
+        model: type[Model], 
+        **hints,
+    ) -> Optional[str]:
+        
+        """
+        Picks a replica for reporting reads outside of primary transactions.
+
+        Returns:
+            str | None: A replica alias, or None to use the primary.
+        """
+        
+        if model._meta.label_lower not in self.REPLICA_MODELS:
+            return None
+
+        replicas = self.replicas()
+        if not replicas or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return None
+
+        return random.choice(replicas)
+
+    def db_for_write (
+        self, 
+        model: type[Model], 
+        **hints,
+    ) -> Optional[str]:
+        
+        """
+        Sends every write to the primary.
+        """
+        
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation (
+        self, 
+        obj1: Model, 
+        obj2: Model, 
+        **hints,
+    ) -> Optional[bool]:
+        
+        """
+        Allows relations between objects loaded from the primary and its replicas, which
+        hold the same data.
+        """
+        
+        databases = {DEFAULT_DB_ALIAS, *self.replicas()}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+
+        return None
+
+    def allow_migrate (
+        self, 
+        db: str, 
+        app_label: str, 
+        model_name: Optional[str] = None, 
+        **hints,
+    ) -> Optional[bool]:
+        
+        """
+        Never migrates a replica; replicas receive the schema through replication.
+        """
+        
+        if db in self.replicas():
+            return False
+
+        return None
@@ -1,6 +1,9 @@
+import importlib.util
 import os
 from pathlib import Path
 
+from django.core.exceptions import ImproperlyConfigured
+
 BASE_DIR = Path(__file__).resolve().parent.parent
 SECRET_KEY=os.getenv('SECRET_KEY')
 DEBUG=os.getenv('DEBUG')
@@ -38,7 +41,7 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-ROOT_URLCONF = 'base.urls.urls'
+ROOT_URLCONF = 'project.urls.urls'
 
 TEMPLATES = [
     {
@@ -69,9 +72,38 @@ DATABASES = {
         'PASSWORD': os.getenv('POSTGRES_PASSWORD'),
         'HOST': os.getenv('DB_HOST'),
         'PORT': os.getenv('DB_PORT'),
+        'CONN_MAX_AGE': int(os.getenv('DB_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': os.getenv('DB_CONN_HEALTH_CHECKS', 'True') == 'True',
     },
 }
 
+# Native connection pooling of the psycopg 3 backend (requires `psycopg[pool]`). A pool
+# replaces persistent connections, so `CONN_MAX_AGE` must be 0 when it is enabled.
+if os.getenv('DB_POOL', 'False') == 'True':
+    if importlib.util.find_spec('psycopg_pool') is None:
+        raise ImproperlyConfigured('DB_POOL requires psycopg 3 with its pool: pip install "psycopg[binary,pool]".')
+    DATABASES['default']['CONN_MAX_AGE'] = 0
+    DATABASES['default']['OPTIONS']['pool'] = {
+        'min_size': int(os.getenv('DB_POOL_MIN_SIZE', 2)),
+        'max_size': int(os.getenv('DB_POOL_MAX_SIZE', 10)),
+        'timeout': float(os.getenv('DB_POOL_TIMEOUT', 10)),
+    }
+
+# Read replicas, as a comma-separated list of hosts sharing the primary's credentials.
+# `ReplicaRouter` sends reporting reads to them; tests mirror them to `default`.
+DATABASE_REPLICAS = []
+for index, replica_host in enumerate(filter(None, os.getenv('DB_REPLICA_HOSTS', '').split(','))):
+    DATABASES[f'replica_{index}'] = {
+        **DATABASES['default'],
+        'HOST': replica_host.strip(),
+        'TEST': {
+            'MIRROR': 'default',
+        },
+    }
+    DATABASE_REPLICAS.append(f'replica_{index}')
+
+DATABASE_ROUTERS = ['project.db_router.db_router.ReplicaRouter']
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -97,4 +129,50 @@ STATIC_URL = 'static/'
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 CELERY_BROKER_URL = os.getenv('CELERY_BROKER_URL')
 CELERY_ACCEPT_CONTENT = ['json']
-CELERY_TASK_SERIALIZER = 'json'
\ No newline at end of file
+CELERY_TASK_SERIALIZER = 'json'
+
+BILLING_INCREMENTAL = os.getenv('BILLING_INCREMENTAL', 'True') == 'True'
+BILLING_SYNC_MAX_FLATS = int(os.getenv('BILLING_SYNC_MAX_FLATS', 100))
+BILLING_PROFILE = os.getenv('BILLING_PROFILE', 'False') == 'True'
+BILLING_PROFILE_DIR = os.getenv('BILLING_PROFILE_DIR', BASE_DIR / 'profiles')
+BILLING_PROGRESS_REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+BILLING_PROGRESS_INTERVAL = float(os.getenv('BILLING_PROGRESS_INTERVAL', 1.0))
+BILLING_PROGRESS_TTL = int(os.getenv('BILLING_PROGRESS_TTL', 60 * 60 * 24))
+BILLING_DIFF_LIMIT = int(os.getenv('BILLING_DIFF_LIMIT', 1000))
+BILLING_RECALCULATION_BATCH_SIZE = int(os.getenv('BILLING_RECALCULATION_BATCH_SIZE', 1000))
+BILLING_TASK_SOFT_TIME_LIMIT = int(os.getenv('BILLING_TASK_SOFT_TIME_LIMIT', 60 * 55))
+BILLING_TASK_TIME_LIMIT = int(os.getenv('BILLING_TASK_TIME_LIMIT', 60 * 60))
+
+# Billing runs are long and few, so they get a dedicated queue (served by the `celery_billing`
+# worker) where each worker process reserves one task at a time and acknowledges it only
+# once it is done. A run lost with its worker is redelivered; billing a month is idempotent.
+# The broker must not redeliver a run that is still going, so the visibility timeout
+# outlasts the hard time limit.
+CELERY_TASK_ROUTES = {
+    'calculate_payments': {
+        'queue': 'billing',
+    },
+}
+CELERY_TASK_ANNOTATIONS = {
+    'calculate_payments': {
+        'soft_time_limit': BILLING_TASK_SOFT_TIME_LIMIT,
+        'time_limit': BILLING_TASK_TIME_LIMIT,
+        # The outcome is kept in the `BillingProgressStore`, under its own TTL.
+        'ignore_result': True,
+    },
+}
+CELERY_WORKER_PREFETCH_MULTIPLIER = int(os.getenv('CELERY_WORKER_PREFETCH_MULTIPLIER', 1))
+CELERY_TASK_ACKS_LATE = True
+CELERY_TASK_REJECT_ON_WORKER_LOST = True
+CELERY_BROKER_TRANSPORT_OPTIONS = {
+    'visibility_timeout': BILLING_TASK_TIME_LIMIT + 60 * 5,
+}
+CELERY_RESULT_BACKEND = os.getenv('CELERY_RESULT_BACKEND')
+CELERY_RESULT_EXPIRES = int(os.getenv('CELERY_RESULT_EXPIRES', 60 * 60))
+# Messages stay JSON rather than msgpack. Billing messages carry a month and a scope; the only
+# large part is the flat id list (at most `BILLING_RECALCULATION_BATCH_SIZE` ids), which gzip
+# shrinks below its msgpack encoding, while JSON needs no extra dependency, keeps messages
+# readable in Flower and the broker, and avoids a mixed-serializer window during deploys.
+CELERY_RESULT_SERIALIZER = 'json'
+CELERY_TASK_COMPRESSION = 'gzip'
+CELERY_RESULT_COMPRESSION = 'gzip'
@@ -0,0 +1,39 @@
+"""
+Settings for running the test suite without external services.
+
+Two SQLite database aliases stand in for the primary and a read replica, with the replica
+mirroring the primary as a real replica would, so the `ReplicaRouter` configuration is
+exercised exactly as in production. A third, independent alias plays a replica that has
+not applied any of the primary's writes yet, for tests of replication lag. Celery tasks
+run eagerly.
+
+    python manage.py test base --settings=project.settings.test_settings
+"""
+
+import os
+
+os.environ.setdefault('SECRET_KEY', 'test-secret-key')
+os.environ.setdefault('ALLOWED_HOSTS', 'localhost,testserver')
+
+from project.settings.settings import *  # noqa: E402,F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'test_primary.sqlite3',
+    },
+    'replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'test_replica.sqlite3',
+        'TEST': {
+            'MIRROR': 'default',
+        },
+    },
+    'lagging_replica': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': BASE_DIR / 'test_lagging_replica.sqlite3',
+    },
+}
+DATABASE_REPLICAS = ['replica']
+
+CELERY_TASK_ALWAYS_EAGER = True
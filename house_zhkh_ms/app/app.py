@@ -1,18 +1,49 @@
 import os  
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI  
 from fastapi.middleware.cors import CORSMiddleware  
 
 from config.config import Config  
+from modules.database.database_pool.database_pool_controllers import DatabasePoolControllers  
+from routes.health_router import router as health_router  
 from routes.house_router import router as house_router  
 
+@asynccontextmanager
+async def lifespan (
+    app: FastAPI,
+) -> AsyncIterator[None]:
+    
+    """
+    Runs the application lifecycle of a worker process.
+
+    On startup the worker's database pool is connected and warmed up before the worker
+    accepts requests, and stored on `app.state`, from where `dependencies.get_db_pool`
+    shares it with every controller. If the database is unreachable the worker starts
+    anyway and reports 'NOT READY' on `/ready` until it can connect. On shutdown the pool is closed, after uvicorn has
+    drained the in-flight requests.
+
+    Args:
+        app (FastAPI): The application instance.
+    """
+    
+    db_pool = DatabasePoolControllers()
+    await db_pool.startup_event()
+    app.state.db_pool = db_pool
+
+    yield
+
+    await db_pool.shutdown_event()
+
 def create_app () -> FastAPI:
     
     """
     Factory function to create and configure the FastAPI application.
 
     This function initializes the FastAPI app with settings from the `Config` class, configures 
-    CORS middleware with environment variable settings, and includes the house router for the API.
+    CORS middleware with environment variable settings, and includes the health and house routers for the API.
 
     The function returns the configured FastAPI application instance.
 
@@ -24,6 +55,7 @@ def create_app () -> FastAPI:
         title=Config.TITLE,
         description=Config.DESCRIPTION,
         version=Config.VERSION,
+        lifespan=lifespan,
     )
 
     app.add_middleware (
@@ -34,6 +66,7 @@ def create_app () -> FastAPI:
         allow_headers=os.getenv('FASTAPI_ALLOW_HEADERS'),
     )
 
+    app.include_router(health_router)
     app.include_router(house_router)
 
     return app
@@ -0,0 +1,125 @@
+"""
+Benchmark of the house info query sent as plain text versus as a prepared statement.
+
+Run from the `house_zhkh_ms` directory against a migrated database (the `DB_*` environment
+variables are the ones used by the service):
+
+    python -m benchmarks.prepared_statements --house-street "Main St" --iterations 500
+
+The report lists the mean and p95 client latency of both modes, and the server-side
+planning time of a single execution taken from `EXPLAIN (ANALYZE)`. After the first few
+executions PostgreSQL switches the prepared statement to a generic plan, so its planning
+time drops to (almost) zero, while the plain query is planned on every request.
+"""
+
+import argparse
+import re
+import statistics
+import time
+
+from datetime import date
+from typing import Callable, Dict, List
+
+from modules.database.database.database import Database
+from modules.database.queries.house_queries import HOUSE_INFO, HouseInfoParams
+from modules.database.statement_cache.statement_cache import PreparedConnection
+
+PLANNING_TIME = re.compile(r'Planning Time: ([\d.]+) ms')
+
+def measure (
+    run: Callable[[], None], 
+    iterations: int,
+) -> Dict[str, float]:
+    
+    """
+    Times repeated calls of a function.
+
+    Args:
+        run (Callable[[], None]): The function to time.
+        iterations (int): The number of timed calls.
+
+    Returns:
+        Dict[str, float]: The mean and p95 latency in milliseconds.
+    """
+    
+    timings: List[float] = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return {
+        'mean_ms': statistics.mean(timings),
+        'p95_ms': statistics.quantiles(timings, n=20)[-1],
+    }
+
+def planning_time (
+    cursor, 
+    statement: str, 
+    params,
+) -> float:
+    
+    """
+    Returns the planning time PostgreSQL reports for one execution of a statement.
+    """
+    
+    cursor.execute(f'EXPLAIN (ANALYZE, FORMAT TEXT) {statement}', params)
+    plan = '\n'.join(row[0] for row in cursor.fetchall())
+    match = PLANNING_TIME.search(plan)
+
+    return float(match.group(1)) if match else 0.0
+
+def main () -> None:
+    
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--house-street', required=True)
+    parser.add_argument('--iterations', type=int, default=500)
+    parser.add_argument('--date-from', type=date.fromisoformat, default=date(date.today().year - 1, 1, 1))
+    args = parser.parse_args()
+
+    params = HouseInfoParams (
+        house_street=args.house_street, 
+        date_from=args.date_from, 
+        date_to=date.today(), 
+        history_limit=None,
+    )
+
+    db = Database()
+    connection: PreparedConnection = db.get_connection()
+
+    try:
+        cursor = connection.cursor()
+
+        def run_plain () -> None:
+            cursor.execute(HOUSE_INFO.sql, params)
+            cursor.fetchall()
+
+        def run_prepared () -> None:
+            connection.execute(cursor, HOUSE_INFO, params)
+            cursor.fetchall()
+
+        results = {
+            'plain': measure(run_plain, args.iterations),
+            'prepared': measure(run_prepared, args.iterations),
+        }
+        results['plain']['planning_ms'] = planning_time (
+            cursor, 
+            HOUSE_INFO.sql.strip().rstrip(';'), 
+            params,
+        )
+        results['prepared']['planning_ms'] = planning_time (
+            cursor, 
+            f"EXECUTE {HOUSE_INFO.name} ({', '.join(['%s'] * len(HOUSE_INFO.param_names))})", 
+            HOUSE_INFO.positional_params(params),
+        )
+        connection.rollback()
+    finally:
+        db.release_connection(connection)
+        db.close_all()
+
+    print(f'{"mode":<10}{"mean ms":>12}{"p95 ms":>12}{"planning ms":>14}')
+    for mode, result in results.items():
+        print(f'{mode:<10}{result["mean_ms"]:>12.3f}{result["p95_ms"]:>12.3f}{result["planning_ms"]:>14.3f}')
+
+if __name__ == '__main__':
+    main()
@@ -15,10 +15,32 @@ class Config:
         TITLE (str): The title of the API. Defaults to "House API".
         DESCRIPTION (str): A short description of the API. Defaults to "API for managing houses".
         VERSION (str): The version of the API. Defaults to "1.0.0".
+        HOUSE_HISTORY_MONTHS (int): How many months of counter history the house info returns
+            when the request does not specify a window. Bounding the history lets PostgreSQL
+            prune the yearly reading partitions. Defaults to 12.
+        WORKERS (int): The number of worker processes started by `main.launcher`. Each worker
+            owns its own database pool, so the service opens up to `WORKERS * DB_POOL_MAX`
+            connections. Defaults to the number of CPUs.
+        LOOP (str): The uvicorn event loop. "auto" uses uvloop when it is installed.
+        HTTP (str): The uvicorn HTTP protocol. "auto" uses httptools when it is installed.
+        GRACEFUL_TIMEOUT (int): Seconds a worker waits for in-flight requests on shutdown
+            before closing its database pool. Defaults to 30.
+        DB_POOL_MIN (int): The number of connections each worker's pool keeps open. Defaults to 1.
+        DB_POOL_MAX (int): The maximum number of connections of each worker's pool. Defaults to 20.
+        READY_CACHE_SECONDS (float): How long the result of the `/ready` database check is reused.
+            Defaults to 5.
     """
     
     HOST: str = os.getenv('FASTAPI_HOST', '127.0.0.1')
     PORT: int = int(os.getenv('FASTAPI_PORT', 8140))
     TITLE: str = os.getenv('TITLE', 'House API')
     DESCRIPTION: str = os.getenv('DESCRIPTION', 'API for managing houses')
-    VERSION: str = os.getenv('VERSION', '1.0.0')
\ No newline at end of file
+    VERSION: str = os.getenv('VERSION', '1.0.0')
+    HOUSE_HISTORY_MONTHS: int = int(os.getenv('HOUSE_HISTORY_MONTHS', 12))
+    WORKERS: int = int(os.getenv('FASTAPI_WORKERS', os.cpu_count() or 1))
+    LOOP: str = os.getenv('FASTAPI_LOOP', 'auto')
+    HTTP: str = os.getenv('FASTAPI_HTTP', 'auto')
+    GRACEFUL_TIMEOUT: int = int(os.getenv('FASTAPI_GRACEFUL_TIMEOUT', 30))
+    DB_POOL_MIN: int = int(os.getenv('DB_POOL_MIN', 1))
+    DB_POOL_MAX: int = int(os.getenv('DB_POOL_MAX', 20))
+    READY_CACHE_SECONDS: float = float(os.getenv('FASTAPI_READY_CACHE_SECONDS', 5))
@@ -0,0 +1,65 @@
+from fastapi.responses import JSONResponse
+
+from modules.database.database_pool.database_pool_controllers import DatabasePoolControllers
+
+class HealthController:
+    
+    """
+    Answers liveness and readiness probes.
+
+    Both probes are cheap enough to be polled under load: liveness performs no I/O and
+    readiness reuses the cached result of `DatabasePoolControllers.is_ready`.
+    """
+    
+    def __init__ (
+        self, 
+        db: DatabasePoolControllers,
+    ) -> None:
+        
+        """
+        Initializes the HealthController.
+
+        Args:
+            db (DatabasePoolControllers): The database pool shared by the controllers.
+        """
+        
+        self.db = db
+
+    async def health (
+        self,
+    ) -> JSONResponse:
+        
+        """
+        Reports that the process is alive and serving requests.
+
+        Returns:
+            JSONResponse: An 'ALIVE' status.
+        """
+        
+        return JSONResponse (
+            {
+                'STATUS': 'ALIVE',
+            }
+        )
+
+    def ready (
+        self,
+    ) -> JSONResponse:
+        
+        """
+        Reports whether the service can serve requests, together with the pool utilisation.
+
+        Returns:
+            JSONResponse: A 'READY' status with code 200, or 'NOT READY' with code 503 if the
+                          pool has no usable connection.
+        """
+        
+        ready = self.db.is_ready()
+
+        return JSONResponse (
+            {
+                'STATUS': 'READY' if ready else 'NOT READY',
+                'POOL': self.db.get_db().stats(),
+            }, 
+            status_code=200 if ready else 503,
+        )
@@ -1,78 +1,95 @@
-from fastapi.responses import JSONResponse
+from datetime import date
+from typing import Any, Dict, Optional
 
-from psycopg2 import (
-    DatabaseError, 
-    OperationalError, 
-    IntegrityError, 
-    InterfaceError, 
-    ProgrammingError, 
-    DataError,
-)
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 
+from config.config import Config  
 from controllers.base_controller.base_controller import BaseController  
-from house_zhkh_ms.house_factory.house_factory import HouseFactory  
-from house_zhkh_ms.modules.database.database_pool.database_pool_controllers import DatabasePoolControllers  
+from house_factory.house_factory import HouseFactory  
+from modules.database.database_pool.database_pool_controllers import DatabasePoolControllers  
+from modules.database.queries.house_queries import (
+    CREATE_HOUSE, 
+    HOUSE_INFO, 
+    CreateHouseParams, 
+    HouseInfoParams,
+)
 from modules.logger.logger import LoggerInitializer  
 
 class HouseController(BaseController):
     
     def __init__ (
-        self,
+        self, 
+        db: Optional[DatabasePoolControllers] = None,
     ) -> None:
         
+        """
+        Initializes the HouseController.
+
+        Args:
+            db (DatabasePoolControllers, optional): The database pool shared by the controllers
+                (see `dependencies.get_db_pool`). Defaults to a new pool controller.
+        """
+        
         super().__init__()
         
-        self.db = DatabasePoolControllers()
+        self.db = db or DatabasePoolControllers()
         self.house_factory = HouseFactory()
         
-        self.logger = LoggerInitializer.init_logger()
+        self.logger = LoggerInitializer().init_logger()
 
     async def get (
         self, 
         house_street: str,
+        history_months: Optional[int] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        latest_only: bool = False,
     ) -> JSONResponse:
         
         """
         Fetches house information based on the street name.
 
+        Counter history is bounded by a date window and fetched per counter through a
+        lateral join, so the window and the row limit are applied in SQL and the query
+        only scans the matching partitions of the reading tables. The query runs as a
+        prepared statement of the pooled connection, so it is not re-parsed per request.
+        Reading dates are returned in ISO format.
+
         Args:
             house_street (str): The street name to query.
+            history_months (int, optional): The size of the history window in months.
+                Defaults to `Config.HOUSE_HISTORY_MONTHS`. Ignored if `date_from` is given.
+            date_from (date, optional): The first day of the history window.
+            date_to (date, optional): The last day of the history window. Defaults to today.
+            latest_only (bool): Return only the latest reading of each counter in the window.
 
         Returns:
             JSONResponse: API response containing house data or an error message.
-        """
 
-        query = """
-            SELECT 
-                bb.id AS house_id, 
-                bf.id AS flat_id, bf.flat_number, bf.flat_floor, bf.square,
-                bc.id AS counter_id, bc.counter_type, bc.count,
-                bch.id AS counter_history_id, bch.date, bch.count AS counter_history_count,
-                bi.id AS inhabitant_id, bi.full_name, bi.age,
-                bfb.balance
-            FROM base_building AS bb
-            LEFT JOIN base_flat bf ON bf.building_id = bb.id
-            LEFT JOIN base_counter bc ON bc.corresponding_flat_id = bf.id
-            LEFT JOIN base_counterhistory bch ON bch.corresponding_counter_id = bc.id
-            LEFT JOIN base_inhabitant bi ON bi.living_at_flat_id = bf.id
-            LEFT JOIN base_flathcsbalance bfb ON bfb.flat_id = bf.id
-            WHERE bb.address = %s
-            GROUP BY 
-                bb.id, bf.id, bf.flat_number, bf.flat_floor, bf.square,
-                bc.id, bc.counter_type, bc.count,
-                bch.id, bch.date, bch.count,
-                bi.id, bi.full_name, bi.age,
-                bfb.balance;
+        Raises:
+            ValueError: If the history window is invalid.
         """
 
+        params = HouseInfoParams (
+            house_street=house_street,
+            **self._history_params (
+                history_months, 
+                date_from, 
+                date_to, 
+                latest_only,
+            ),
+        )
+
         try:
             with self.db.get_connection() as connection:
                 cursor = connection.cursor()
                 self.logger.info(f'Fetching house info for: {house_street}')
 
-                cursor.execute (
-                    query, 
-                    (house_street,),
+                connection.execute (
+                    cursor, 
+                    HOUSE_INFO, 
+                    params,
                 )
                 rows = cursor.fetchall()
 
@@ -90,21 +107,15 @@ class HouseController(BaseController):
                 connection.commit()
 
                 return JSONResponse (
-                    {
-                        'STATUS': 'SUCCESS', 
-                        'HOUSE INFO': response_data,
-                    }
+                    jsonable_encoder (
+                        {
+                            'STATUS': 'SUCCESS', 
+                            'HOUSE INFO': response_data,
+                        }
+                    )
                 )
 
-        except (
-            DatabaseError, 
-            OperationalError, 
-            IntegrityError, 
-            InterfaceError, 
-            ProgrammingError, 
-            DataError, 
-            Exception,
-        ) as e:
+        except Exception as e:
             
             self.logger.error(f"Database error for '{house_street}': {e}", exc_info=True)
             
@@ -115,6 +126,69 @@ class HouseController(BaseController):
                 }
             )
             
+    @classmethod
+    def _history_params (
+        cls, 
+        history_months: Optional[int], 
+        date_from: Optional[date], 
+        date_to: Optional[date], 
+        latest_only: bool,
+    ) -> Dict[str, Any]:
+        
+        """
+        Resolves the counter history window into query parameters.
+
+        Args:
+            history_months (int, optional): The size of the history window in months.
+            date_from (date, optional): The first day of the history window.
+            date_to (date, optional): The last day of the history window.
+            latest_only (bool): Whether to return only the latest reading of each counter.
+
+        Returns:
+            Dict[str, Any]: The 'date_from', 'date_to' and 'history_limit' query parameters.
+                            A None 'history_limit' means no row limit.
+
+        Raises:
+            ValueError: If `history_months` is not positive or the window is empty.
+        """
+        
+        if history_months is not None and history_months < 1:
+            raise ValueError('history_months must be a positive number of months.')
+
+        date_to = date_to or date.today()
+        date_from = date_from or cls._history_start (
+            history_months or Config.HOUSE_HISTORY_MONTHS,
+        )
+
+        if date_from > date_to:
+            raise ValueError('date_from must not be after date_to.')
+
+        return {
+            'date_from': date_from,
+            'date_to': date_to,
+            'history_limit': 1 if latest_only else None,
+        }
+
+    @staticmethod
+    def _history_start (
+        months: int,
+    ) -> date:
+        
+        """
+        Returns the first day of the month `months` months before the current one.
+
+        Args:
+            months (int): The size of the history window in months.
+
+        Returns:
+            date: The lower bound of the counter history window.
+        """
+        
+        today = date.today()
+        month_index = today.year * 12 + today.month - 1 - months
+        
+        return date(month_index // 12, month_index % 12 + 1, 1)
+            
     async def create (
         self, 
         house_street: str,
@@ -130,18 +204,13 @@ class HouseController(BaseController):
             JSONResponse: API response containing house data or an error message.
         """
         
-        query = """
-            INSERT INTO base_building (address) 
-            VALUES (%s) 
-            RETURNING id
-        """
-
         try:
             with self.db.get_connection() as connection:
                 cursor = connection.cursor()
-                cursor.execute (
-                    query, 
-                    (house_street,),
+                connection.execute (
+                    cursor, 
+                    CREATE_HOUSE, 
+                    CreateHouseParams(address=house_street),
                 )
                 house_id = cursor.fetchone()[0]  
                 connection.commit()
@@ -153,15 +222,7 @@ class HouseController(BaseController):
                 }
             )
 
-        except (
-            DatabaseError, 
-            OperationalError, 
-            IntegrityError, 
-            InterfaceError, 
-            ProgrammingError, 
-            DataError, 
-            Exception,
-        ) as e:
+        except Exception as e:
             
             self.logger.error(f'Database error occurred: {e}', exc_info=True)
             
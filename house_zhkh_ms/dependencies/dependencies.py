@@ -0,0 +1,53 @@
+from fastapi import Depends, Request
+
+from controllers.health_controller.health_controller import HealthController
+from controllers.house_controller.house_controller import HouseController
+from modules.database.database_pool.database_pool_controllers import DatabasePoolControllers
+
+def get_db_pool (
+    request: Request,
+) -> DatabasePoolControllers:
+    
+    """
+    Returns the database pool started by the application lifespan.
+
+    Args:
+        request (Request): The current request.
+
+    Returns:
+        DatabasePoolControllers: The pool shared by all controllers of the worker.
+    """
+    
+    return request.app.state.db_pool
+
+def get_house_controller (
+    db: DatabasePoolControllers = Depends(get_db_pool),
+) -> HouseController:
+    
+    """
+    Returns a HouseController bound to the shared database pool.
+
+    Args:
+        db (DatabasePoolControllers): The shared database pool.
+
+    Returns:
+        HouseController: The controller serving the house routes.
+    """
+    
+    return HouseController(db)
+
+def get_health_controller (
+    db: DatabasePoolControllers = Depends(get_db_pool),
+) -> HealthController:
+    
+    """
+    Returns a HealthController bound to the shared database pool.
+
+    Args:
+        db (DatabasePoolControllers): The shared database pool.
+
+    Returns:
+        HealthController: The controller answering the health probes.
+    """
+    
+    return HealthController(db)
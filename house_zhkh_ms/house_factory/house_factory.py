@@ -1,3 +1,5 @@
+import datetime
+
 from typing import (
     Dict, 
     Any, 
@@ -138,7 +140,7 @@ class HouseFactory:
     @staticmethod
     def _create_counter_history (
         counter_history_id: int, 
-        date: str, 
+        date: datetime.date, 
         count: float,
     ) -> Dict[str, Any]:
         
@@ -147,7 +149,7 @@ class HouseFactory:
 
         Args:
             counter_history_id (int): Counter history ID.
-            date (str): Date of reading.
+            date (datetime.date): Date of reading, serialized by the controller.
             count (float): Counter reading.
 
         Returns:
@@ -0,0 +1,30 @@
+import uvicorn
+
+from config.config import Config
+
+def run () -> None:
+    
+    """
+    Production entry point of the service.
+
+    Starts `Config.WORKERS` uvicorn worker processes serving `main.main:app`. The app is
+    passed as an import string, so every worker imports it (and creates its own database
+    pool) after it was spawned, and the supervisor process never opens a connection.
+    With the default "auto" settings uvicorn uses uvloop and httptools when they are
+    installed. On SIGTERM every worker stops accepting connections, waits up to
+    `Config.GRACEFUL_TIMEOUT` seconds for in-flight requests and then runs the app's
+    shutdown, which closes its pool through `DatabasePoolControllers.shutdown_event`.
+    """
+    
+    uvicorn.run (
+        'main.main:app', 
+        host=Config.HOST, 
+        port=Config.PORT, 
+        workers=Config.WORKERS, 
+        loop=Config.LOOP, 
+        http=Config.HTTP, 
+        timeout_graceful_shutdown=Config.GRACEFUL_TIMEOUT,
+    )
+
+if __name__ == '__main__':
+    run()
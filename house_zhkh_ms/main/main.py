@@ -1,11 +1,11 @@
-import uvicorn
-
 from app.app import create_app
 from config.config import Config
 
 app = create_app()
 
 if __name__ == '__main__':
+    import uvicorn
+
     uvicorn.run (
         app, 
         host=Config.HOST, 
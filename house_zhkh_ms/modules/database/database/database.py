@@ -1,9 +1,9 @@
 import os
+import threading
 
-from typing import Any, Optional
-
-import psycopg2
+from typing import Any, Dict, Optional
 
+from config.config import Config
 
 class Database:
     
@@ -16,7 +16,9 @@ class Database:
 
     Attributes:
         instance (Database, optional): The singleton instance of the class.
-        pool (psycopg2.pool.SimpleConnectionPool, optional): The connection pool for PostgreSQL connections.
+        pool (psycopg2.pool.ThreadedConnectionPool, optional): The connection pool for PostgreSQL connections.
+        pid (int, optional): The id of the process that created the pool.
+        lock (threading.Lock): Serializes the creation of the pool.
     """
 
     instance: Optional['Database'] = None
@@ -55,6 +57,8 @@ class Database:
         if cls.instance is None:
             cls.instance = super().__new__(cls)
             cls.instance.pool = None
+            cls.instance.pid = None
+            cls.instance.lock = threading.Lock()
             
         return cls.instance
     
@@ -65,18 +69,38 @@ class Database:
         """
         Establishes a connection pool to the PostgreSQL database if it does not already exist.
         
-        Uses `psycopg2`'s `SimpleConnectionPool` to create a pool with a minimum of 1 connection 
-        and a maximum of 20 connections.
+        Uses `psycopg2`'s `ThreadedConnectionPool` to create a pool with a minimum of 
+        `Config.DB_POOL_MIN` and a maximum of `Config.DB_POOL_MAX` connections. Pooled 
+        connections are `PreparedConnection`s, so hot queries are prepared once per connection 
+        and reused across requests. The pool is shared by the handlers running on the event 
+        loop and the synchronous ones FastAPI runs in its threadpool (such as the readiness 
+        probe), so it has to be the thread-safe variant.
+
+        The pool belongs to the process that created it. A worker process forked after the 
+        pool was created gets a pool of its own instead of sharing the parent's sockets; the 
+        inherited pool is dropped without closing, as closing it would terminate the parent's 
+        sessions.
+
+        `psycopg2` is imported here rather than at module level, so importing the application
+        does not load the driver before a connection is actually needed.
         """
         
-        if self.pool is None:
-            self.pool = psycopg2.pool.SimpleConnectionPool(
-                1, 20,  # minconn, maxconn
-                host=self.host,
-                user=self.db_user,
-                password=self.password,
-                database=self.database,
-            )
+        with self.lock:
+            if self.pool is None or self.pid != os.getpid():
+                import psycopg2.pool
+
+                from modules.database.statement_cache.statement_cache import PreparedConnection
+
+                self.pool = psycopg2.pool.ThreadedConnectionPool(
+                    Config.DB_POOL_MIN, 
+                    Config.DB_POOL_MAX,
+                    host=self.host,
+                    user=self.db_user,
+                    password=self.password,
+                    database=self.database,
+                    connection_factory=PreparedConnection,
+                )
+                self.pid = os.getpid()
     
     def get_connection (
         self,
@@ -85,7 +109,8 @@ class Database:
         """
         Retrieves a connection from the connection pool.
         
-        If the pool is not initialized, it will first establish a connection pool.
+        If the pool is not initialized (or was inherited from a parent process), it will first 
+        establish a connection pool.
         
         Returns:
             Any: A connection object from the PostgreSQL connection pool.
@@ -94,11 +119,38 @@ class Database:
             Exception: If the pool is not initialized and cannot be connected to.
         """
         
-        if self.pool is None:
+        if self.pool is None or self.pid != os.getpid():
             self.connect()
         
         return self.pool.getconn()
     
+    def stats (
+        self,
+    ) -> Dict[str, int]:
+        
+        """
+        Reports the utilisation of the connection pool without touching the database.
+
+        Returns:
+            Dict[str, int]: The 'min' and 'max' size of the pool, and the number of connections 
+                            currently borrowed ('in_use') and kept open for reuse ('idle').
+        """
+        
+        if self.pool is None or self.pool.closed or self.pid != os.getpid():
+            return {
+                'min': Config.DB_POOL_MIN,
+                'max': Config.DB_POOL_MAX,
+                'in_use': 0,
+                'idle': 0,
+            }
+
+        return {
+            'min': self.pool.minconn,
+            'max': self.pool.maxconn,
+            'in_use': len(self.pool._used),
+            'idle': len(self.pool._pool),
+        }
+    
     def release_connection (
         self, 
         connection
@@ -126,3 +178,4 @@ class Database:
         
         if self.pool:
             self.pool.closeall()
+            self.pool = None
@@ -1,6 +1,18 @@
-from house_zhkh_ms.modules.database.database.database import Database
+import threading
+import time
+
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple
+
+from config.config import Config
+from modules.database.database.database import Database
+from modules.database.queries.house_queries import HOUSE_QUERIES
+from modules.database.schema_checker.schema_checker import SchemaChecker
 from modules.logger.logger import LoggerInitializer
 
+if TYPE_CHECKING:
+    from modules.database.statement_cache.statement_cache import PreparedConnection
+
 class DatabasePoolControllers:
     
     """
@@ -18,10 +30,16 @@ class DatabasePoolControllers:
         Attributes:
             logger (Logger): The logger instance to log events and errors.
             db (Database, optional): The database instance, initially set to None until needed.
+            readiness (Tuple[float, bool], optional): The time and result of the last readiness check.
+            readiness_lock (threading.Lock): Serializes readiness checks across threadpool workers.
+            started (bool): Whether the schema was checked and the pool warmed up.
         """
         
-        self.logger = LoggerInitializer.init_logger()
+        self.logger = LoggerInitializer().init_logger()
         self.db = None
+        self.readiness: Optional[Tuple[float, bool]] = None
+        self.readiness_lock = threading.Lock()
+        self.started = False
 
     def get_db (
         self,
@@ -41,6 +59,73 @@ class DatabasePoolControllers:
             self.db = Database()  
         return self.db
 
+    @contextmanager
+    def get_connection (
+        self,
+    ) -> Iterator['PreparedConnection']:
+        
+        """
+        Borrows a connection from the pool for the duration of a `with` block.
+
+        The connection is rolled back if the block raises and is always returned to the pool,
+        keeping its prepared statements for the next request.
+
+        Yields:
+            PreparedConnection: A pooled database connection.
+        """
+        
+        db = self.get_db()
+        connection = db.get_connection()
+
+        try:
+            yield connection
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            db.release_connection(connection)
+
+    def is_ready (
+        self,
+    ) -> bool:
+        
+        """
+        Checks that the pool can hand out a working connection.
+
+        A connection is borrowed and probed with `SELECT 1`. The result is cached for 
+        `Config.READY_CACHE_SECONDS`, so frequent readiness probes cost at most one round trip 
+        per interval and worker. Probes run in FastAPI's threadpool, so checks are serialized 
+        by `readiness_lock`: concurrent probes wait for the running check and share its result.
+
+        If the database was unreachable at startup, the schema check and warm-up are run by 
+        the first check that reaches it, and the service only reports ready once they passed.
+
+        Returns:
+            bool: Whether a usable connection was available.
+        """
+        
+        with self.readiness_lock:
+            now = time.monotonic()
+            if self.readiness is not None and now - self.readiness[0] < Config.READY_CACHE_SECONDS:
+                return self.readiness[1]
+
+            try:
+                if not self.started:
+                    self.start(self.get_db())
+
+                with self.get_connection() as connection:
+                    with connection.cursor() as cursor:
+                        cursor.execute('SELECT 1')
+                    connection.rollback()
+                ready = True
+
+            except Exception as e:
+                self.logger.warning(f'Readiness check failed: {e}')
+                ready = False
+
+            self.readiness = (now, ready)
+            return ready
+
     async def startup_event (
         self,
     ) -> None:
@@ -48,27 +133,116 @@ class DatabasePoolControllers:
         """
         Handles the startup event for the application, initializing and connecting the database pool.
 
-        Logs the successful initialization of the database pool or logs a fatal error and raises an exception if the connection fails.
+        Once the pool is connected, the columns referenced by the service queries are checked
+        against the live schema, so a drift from the Django models stops the application at
+        startup instead of failing every request. The pool is then warmed up, so the first
+        requests do not pay for connection setup or statement preparation.
+
+        If the database cannot be reached, the application still starts: `/health` answers,
+        `/ready` reports 'NOT READY' and `is_ready` completes the startup once the database
+        is back.
 
         Raises:
-            Exception: If the database pool fails to start, the exception is raised and the application stops.
+            SchemaMismatchError: If a query references a column missing from the database.
+            Exception: If the schema check or the warm-up fails for another reason.
         """
         
         self.logger.info('Starting App')
+        db = self.get_db()
 
         try:
-            db = self.get_db()
             db.connect()
-            self.logger.info('Database Pool Started Successfully')
+
+        except Exception as e:
+            self.logger.error (
+                f'Database is unavailable at startup: {e}. '
+                'Serving as not ready until it can be reached.', 
+                exc_info=True
+            )
+            return
+
+        try:
+            self.start(db)
 
         except Exception as e:
             self.logger.fatal (
-                f'Failed to close the database pool: {e}. 
-                Application would be stopped. Full traceback below.', 
+                f'Failed to start the database pool: {e}. '
+                'Application would be stopped. Full traceback below.', 
                 exc_info=True
             )
             raise e
 
+    def start (
+        self, 
+        db: Database,
+    ) -> None:
+        
+        """
+        Checks the schema and warms up the pool of a reachable database.
+
+        Args:
+            db (Database): The database to start.
+
+        Raises:
+            SchemaMismatchError: If a query references a column missing from the database.
+        """
+        
+        self.check_schema(db)
+        self.warm_up(db)
+        self.started = True
+        self.logger.info('Database Pool Started Successfully')
+
+    def check_schema (
+        self, 
+        db: Database,
+    ) -> None:
+        
+        """
+        Verifies the service queries against the schema of the connected database.
+
+        Args:
+            db (Database): The connected database.
+
+        Raises:
+            SchemaMismatchError: If a query references a column missing from the database.
+        """
+        
+        checker = SchemaChecker(HOUSE_QUERIES)
+        connection = db.get_connection()
+
+        try:
+            checker.check(checker.database_schema(connection))
+        finally:
+            connection.rollback()
+            db.release_connection(connection)
+
+    def warm_up (
+        self, 
+        db: Database,
+    ) -> None:
+        
+        """
+        Prepares the service queries on the minimum number of pooled connections.
+
+        The connections are borrowed at the same time, so each of the `Config.DB_POOL_MIN`
+        connections the pool keeps open is set up, and then returned to the pool.
+
+        Args:
+            db (Database): The connected database.
+        """
+        
+        connections = [db.get_connection() for _ in range(Config.DB_POOL_MIN)]
+
+        try:
+            for connection in connections:
+                with connection.cursor() as cursor:
+                    for query in HOUSE_QUERIES:
+                        connection.statements.prepare(cursor, query)
+                connection.commit()
+        finally:
+            for connection in connections:
+                db.release_connection(connection)
+
     async def shutdown_event (
         self,
     ) -> None:
@@ -83,14 +257,15 @@ class DatabasePoolControllers:
         """
         
         try:
-            if self.db.pool:
+            db = self.get_db()
+            if db.pool:
+                db.close_all()
                 self.logger.info('Shutdown made successfully')
-                self.db.close_all()
 
         except Exception as e:
             self.logger.fatal (
-                f'Failed to close the database pool: {e}. 
-                Application would be stopped. Full traceback below.', 
+                f'Failed to close the database pool: {e}. '
+                'Application would be stopped. Full traceback below.', 
                 exc_info=True
             )
             raise e
@@ -0,0 +1,91 @@
+from datetime import date
+from typing import Optional, TypedDict
+
+from modules.database.queries.query import Query
+
+class HouseInfoParams(TypedDict):
+    
+    """
+    Parameters of the `HOUSE_INFO` query.
+
+    Attributes:
+        house_street (str): The address of the building.
+        date_from (date): The first day of the counter history window.
+        date_to (date): The last day of the counter history window.
+        history_limit (int, optional): The number of readings returned per counter,
+            or None for every reading in the window.
+    """
+    
+    house_street: str
+    date_from: date
+    date_to: date
+    history_limit: Optional[int]
+
+class CreateHouseParams(TypedDict):
+    
+    """
+    Parameters of the `CREATE_HOUSE` query.
+
+    Attributes:
+        address (str): The address of the new building.
+    """
+    
+    address: str
+
+HOUSE_INFO = Query (
+    name='house_info', 
+    sql="""
+        SELECT
+            bb.id AS house_id,
+            bf.id AS flat_id, bf.flat_number, bf.flat_floor, bf.square,
+            bc.id AS counter_id, bc.counter_type, bc.current_reading,
+            bch.id AS counter_history_id, bch.date, bch.reading AS counter_history_reading,
+            bi.id AS inhabitant_id, bi.full_name, bi.age,
+            bfb.balance
+        FROM base_building AS bb
+        LEFT JOIN base_flat bf ON bf.building_id = bb.id
+        LEFT JOIN base_counter bc ON bc.flat_id = bf.id
+        LEFT JOIN LATERAL (
+            SELECT h.id, h.date, h.reading
+            FROM base_counterhistory h
+            WHERE h.counter_id = bc.id
+                AND h.date BETWEEN %(date_from)s AND %(date_to)s
+            ORDER BY h.date DESC, h.id DESC
+            LIMIT %(history_limit)s
+        ) bch ON TRUE
+        LEFT JOIN base_inhabitant bi ON bi.flat_id = bf.id
+        LEFT JOIN base_flathcsbalance bfb ON bfb.flat_id = bf.id
+        WHERE bb.address = %(house_street)s
+        GROUP BY
+            bb.id, bf.id, bf.flat_number, bf.flat_floor, bf.square,
+            bc.id, bc.counter_type, bc.current_reading,
+            bch.id, bch.date, bch.reading,
+            bi.id, bi.full_name, bi.age,
+            bfb.balance;
+    """, 
+    columns={
+        'base_building': ('id', 'address'),
+        'base_flat': ('id', 'building_id', 'flat_number', 'flat_floor', 'square'),
+        'base_counter': ('id', 'flat_id', 'counter_type', 'current_reading'),
+        'base_counterhistory': ('id', 'counter_id', 'date', 'reading'),
+        'base_inhabitant': ('id', 'flat_id', 'full_name', 'age'),
+        'base_flathcsbalance': ('flat_id', 'balance'),
+    },
+)
+
+CREATE_HOUSE = Query (
+    name='create_house', 
+    sql="""
+        INSERT INTO base_building (address, region)
+        VALUES (%(address)s, '')
+        RETURNING id
+    """, 
+    columns={
+        'base_building': ('id', 'address', 'region'),
+    },
+)
+
+HOUSE_QUERIES = (
+    HOUSE_INFO, 
+    CREATE_HOUSE,
+)
@@ -0,0 +1,68 @@
+import re
+
+from typing import Any, Dict, Mapping, Tuple
+
+class Query:
+    
+    """
+    A named SQL statement together with the table columns it references.
+
+    The referenced columns are declared next to the SQL so `SchemaChecker` can verify them
+    against the schema produced by the Django migrations of `house_zhkh_core`, both in the
+    test suite and against the live database at startup. A renamed or removed column then
+    fails loudly instead of surfacing as a `ProgrammingError` on the first request.
+
+    The SQL is also translated to positional `$n` parameters so it can be prepared as a
+    server-side statement (see `StatementCache`).
+
+    Attributes:
+        name (str): A unique name of the statement, also used as the prepared statement name.
+        sql (str): The SQL text, using `psycopg2` named placeholders.
+        columns (Dict[str, Tuple[str, ...]]): The referenced columns, keyed by table name.
+        param_names (Tuple[str, ...]): The named parameters, in order of first use.
+        positional_sql (str): The SQL text with the named placeholders replaced by `$n`.
+    """
+    
+    PLACEHOLDER = re.compile(r'%\((\w+)\)s')
+
+    def __init__ (
+        self, 
+        name: str, 
+        sql: str, 
+        columns: Dict[str, Tuple[str, ...]],
+    ) -> None:
+        
+        self.name = name
+        self.sql = sql
+        self.columns = columns
+        self.param_names = tuple(dict.fromkeys(self.PLACEHOLDER.findall(sql)))
+        self.positional_sql = self.PLACEHOLDER.sub (
+            lambda match: f'${self.param_names.index(match.group(1)) + 1}', 
+            sql.strip().rstrip(';'),
+        )
+
+    def positional_params (
+        self, 
+        params: Mapping[str, Any],
+    ) -> Tuple[Any, ...]:
+        
+        """
+        Orders named parameters to match the `$n` placeholders of `positional_sql`.
+
+        Args:
+            params (Mapping[str, Any]): The query parameters, keyed by name.
+
+        Returns:
+            Tuple[Any, ...]: The parameter values in placeholder order.
+
+        Raises:
+            KeyError: If a parameter is missing.
+        """
+        
+        return tuple(params[name] for name in self.param_names)
+
+    def __repr__ (
+        self,
+    ) -> str:
+        
+        return f'Query({self.name!r})'
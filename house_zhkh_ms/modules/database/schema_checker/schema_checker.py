@@ -0,0 +1,174 @@
+import sys
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Set
+
+from modules.database.queries.query import Query
+
+class SchemaMismatchError(Exception):
+    
+    """
+    Raised when a query references columns that do not exist in the schema.
+    """
+
+class SchemaChecker:
+    
+    """
+    Verifies that the raw SQL of the service matches the schema owned by `house_zhkh_core`.
+
+    The schema is either derived from the Django migrations (in the test suite, without a
+    database) or read from `information_schema` of the live database (at startup). Every
+    column declared by the checked queries must exist in it.
+    """
+    
+    INSTALLED_APPS = [
+        'django.contrib.admin',
+        'django.contrib.auth',
+        'django.contrib.contenttypes',
+        'django.contrib.sessions',
+        'django.contrib.messages',
+        'base',
+    ]
+
+    def __init__ (
+        self, 
+        queries: Iterable[Query],
+    ) -> None:
+        
+        """
+        Initialize the SchemaChecker with the queries to verify.
+
+        Args:
+            queries (Iterable[Query]): The queries whose columns are checked.
+        """
+        
+        self.queries = list(queries)
+
+    @property
+    def tables (
+        self,
+    ) -> Set[str]:
+        
+        """
+        Returns the names of the tables referenced by the checked queries.
+        """
+        
+        return {table for query in self.queries for table in query.columns}
+
+    def missing_columns (
+        self, 
+        schema: Dict[str, Set[str]],
+    ) -> List[str]:
+        
+        """
+        Lists the referenced columns that are missing from a schema.
+
+        Args:
+            schema (Dict[str, Set[str]]): The column names of each table, keyed by table name.
+
+        Returns:
+            List[str]: The missing columns, as 'query: table.column'.
+        """
+        
+        missing = []
+        for query in self.queries:
+            for table, columns in query.columns.items():
+                for column in columns:
+                    if column not in schema.get(table, ()):
+                        missing.append(f'{query.name}: {table}.{column}')
+
+        return missing
+
+    def check (
+        self, 
+        schema: Dict[str, Set[str]],
+    ) -> None:
+        
+        """
+        Verifies the checked queries against a schema.
+
+        Args:
+            schema (Dict[str, Set[str]]): The column names of each table, keyed by table name.
+
+        Raises:
+            SchemaMismatchError: If any referenced column is missing.
+        """
+        
+        missing = self.missing_columns(schema)
+        if missing:
+            raise SchemaMismatchError (
+                'Queries reference unknown columns: ' + ', '.join(missing)
+            )
+
+    def database_schema (
+        self, 
+        connection: Any,
+    ) -> Dict[str, Set[str]]:
+        
+        """
+        Reads the columns of the referenced tables from the live database.
+
+        Args:
+            connection (Any): A `psycopg2` connection.
+
+        Returns:
+            Dict[str, Set[str]]: The column names of each table, keyed by table name.
+        """
+        
+        schema = {}
+        with connection.cursor() as cursor:
+            cursor.execute (
+                """
+                    SELECT table_name, column_name
+                    FROM information_schema.columns
+                    WHERE table_schema = current_schema()
+                        AND table_name = ANY(%s)
+                """, 
+                (sorted(self.tables),),
+            )
+            for table, column in cursor.fetchall():
+                schema.setdefault(table, set()).add(column)
+
+        return schema
+
+    @classmethod
+    def migration_schema (
+        cls, 
+        core_path: Path,
+    ) -> Dict[str, Set[str]]:
+        
+        """
+        Derives the schema from the Django migrations of `house_zhkh_core`.
+
+        The migration state is built from the migration files alone, so no database is needed.
+        Django is configured with the apps of the core project unless it is already set up.
+
+        Args:
+            core_path (Path): The root directory of the `house_zhkh_core` project.
+
+        Returns:
+            Dict[str, Set[str]]: The column names of each table, keyed by table name.
+        """
+        
+        import django
+        from django.conf import settings
+        from django.db.migrations.loader import MigrationLoader
+
+        if str(core_path) not in sys.path:
+            sys.path.insert(0, str(core_path))
+
+        if not settings.configured:
+            settings.configure (
+                INSTALLED_APPS=cls.INSTALLED_APPS, 
+                DEFAULT_AUTO_FIELD='django.db.models.BigAutoField',
+            )
+            django.setup()
+
+        state = MigrationLoader(None, ignore_no_migrations=True).project_state()
+
+        return {
+            model._meta.db_table: {
+                field.column for field in model._meta.concrete_fields
+            }
+            for model in state.apps.get_models()
+        }
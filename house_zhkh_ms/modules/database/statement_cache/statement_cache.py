@@ -0,0 +1,120 @@
+from typing import Any, Mapping, Set
+
+from psycopg2 import errors, extensions
+
+from modules.database.queries.query import Query
+
+class StatementCache:
+    
+    """
+    Tracks the server-side prepared statements of a single database session.
+
+    The first execution of a query on a connection sends `PREPARE`, so PostgreSQL parses
+    and analyzes the statement once; later executions only send `EXECUTE` with the
+    parameters. Once PostgreSQL switches the statement to a generic plan, planning is
+    skipped as well. Prepared statements live as long as the session and survive rollbacks,
+    which is what makes caching them per pooled connection safe.
+
+    Attributes:
+        prepared (Set[str]): The names of the statements prepared on the session.
+    """
+    
+    def __init__ (
+        self,
+    ) -> None:
+        
+        self.prepared: Set[str] = set()
+
+    def prepare (
+        self, 
+        cursor: Any, 
+        query: Query,
+    ) -> None:
+        
+        """
+        Prepares a query on the session unless it is already prepared.
+
+        Args:
+            cursor (Any): A cursor of the connection owning this cache.
+            query (Query): The query to prepare.
+        """
+        
+        if query.name not in self.prepared:
+            cursor.execute(f'PREPARE {query.name} AS {query.positional_sql}')
+            self.prepared.add(query.name)
+
+    def execute (
+        self, 
+        cursor: Any, 
+        query: Query, 
+        params: Mapping[str, Any],
+    ) -> None:
+        
+        """
+        Executes a query as a prepared statement, preparing it on first use.
+
+        Args:
+            cursor (Any): A cursor of the connection owning this cache.
+            query (Query): The query to execute.
+            params (Mapping[str, Any]): The query parameters, keyed by name.
+
+        Raises:
+            psycopg2.Error: If preparing or executing the statement fails.
+        """
+        
+        self.prepare (
+            cursor, 
+            query,
+        )
+
+        placeholders = ', '.join(['%s'] * len(query.param_names))
+        statement = f'EXECUTE {query.name} ({placeholders})' if placeholders else f'EXECUTE {query.name}'
+
+        try:
+            cursor.execute (
+                statement, 
+                query.positional_params(params),
+            )
+        except errors.InvalidSqlStatementName:
+            # The session was reset (e.g. by `DISCARD ALL`); prepare again on the next call.
+            self.prepared.clear()
+            raise
+
+class PreparedConnection(extensions.connection):
+    
+    """
+    A `psycopg2` connection carrying the prepared statement cache of its session.
+
+    Pass it as `connection_factory` when creating the pool.
+    """
+    
+    def __init__ (
+        self, 
+        *args, 
+        **kwargs,
+    ) -> None:
+        
+        super().__init__(*args, **kwargs)
+        self.statements = StatementCache()
+
+    def execute (
+        self, 
+        cursor: Any, 
+        query: Query, 
+        params: Mapping[str, Any],
+    ) -> None:
+        
+        """
+        Executes a query as a prepared statement of this session.
+
+        Args:
+            cursor (Any): A cursor of this connection.
+            query (Query): The query to execute.
+            params (Mapping[str, Any]): The query parameters, keyed by name.
+        """
+        
+        self.statements.execute (
+            cursor, 
+            query, 
+            params,
+        )
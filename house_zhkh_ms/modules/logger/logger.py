@@ -5,8 +5,6 @@ import socket
 
 from logging import Formatter, Logger, LogRecord  
 
-import logstash  
-
 class CustomLogstashFormatter(Formatter):
     
     """
@@ -86,7 +84,8 @@ class LoggerInitializer:
         then returns the logger instance.
 
         The logger is configured to send logs to the specified Logstash server in JSON format,
-        with relevant fields for tracking.
+        with relevant fields for tracking. `logstash` is only imported when the handler is
+        first attached, keeping it out of the application import.
 
         Returns:
             Logger: The configured logger.
@@ -96,6 +95,8 @@ class LoggerInitializer:
         logger.setLevel(self.level)
 
         if not logger.handlers:
+            import logstash
+
             logstash_handler = logstash.LogstashHandler(
                 host=self.logstash_host, 
                 port=self.logstash_port, 
@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+
+from fastapi_utils.cbv import cbv
+
+from controllers.health_controller.health_controller import HealthController
+from dependencies.dependencies import get_health_controller
+
+router = APIRouter (
+    tags=['Health']
+)
+
+@cbv(router)
+class HealthRouter:
+    controller: HealthController = Depends(get_health_controller)
+
+    @router.get('/health')
+    async def health(
+        self,
+    ) -> JSONResponse:
+        
+        """
+        Liveness probe. Performs no I/O.
+
+        Returns:
+            JSONResponse: An 'ALIVE' status.
+        """
+        
+        return await self.controller.health()
+
+    @router.get('/ready')
+    def ready(
+        self,
+    ) -> JSONResponse:
+        
+        """
+        Readiness probe. Checks the database pool at most once per `Config.READY_CACHE_SECONDS`.
+
+        Defined synchronously, so the occasional database round trip runs in the threadpool
+        instead of blocking the event loop; the connection pool and the cached check are
+        thread-safe.
+
+        Returns:
+            JSONResponse: The readiness status and pool utilisation.
+        """
+        
+        return self.controller.ready()
@@ -1,8 +1,12 @@
-from fastapi import APIRouter, HTTPException  
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query  
 
 from fastapi_utils.cbv import cbv  
 
 from controllers.house_controller.house_controller import HouseController  
+from dependencies.dependencies import get_house_controller  
 from schemas.house_schema import HouseInfo, NewHouseRequest  
 
 router = APIRouter (
@@ -12,19 +16,31 @@ router = APIRouter (
 
 @cbv(router)
 class HouseRouter:
-    controller: HouseController = HouseController()
+    controller: HouseController = Depends(get_house_controller)
 
     @router.get('/info', response_model=HouseInfo)
     async def get_house_info(
         self, 
         house_street: str,
+        history_months: Optional[int] = Query(None, ge=1),
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        latest_only: bool = False,
     ) -> HouseInfo:
         
         """
         Retrieve house information based on the provided street.
 
+        The counter history can be bounded either to the last `history_months` months or to
+        an explicit `date_from`/`date_to` range, and reduced to the latest reading of each
+        counter with `latest_only`.
+
         Args:
             house_street (str): The street name where the house is located.
+            history_months (int, optional): The size of the counter history window in months.
+            date_from (date, optional): The first day of the counter history window.
+            date_to (date, optional): The last day of the counter history window.
+            latest_only (bool): Return only the latest reading of each counter.
 
         Returns:
             HouseInfo: Information about the house located on the specified street.
@@ -35,7 +51,11 @@ class HouseRouter:
         
         try:
             return await self.controller.get (
-                house_street
+                house_street,
+                history_months=history_months,
+                date_from=date_from,
+                date_to=date_to,
+                latest_only=latest_only,
             )
         
         except Exception as e:
@@ -0,0 +1,60 @@
+import asyncio
+import unittest
+from unittest.mock import AsyncMock, patch
+
+from fastapi import Request
+
+from app.app import create_app
+from dependencies.dependencies import get_db_pool, get_house_controller
+from modules.database.database_pool.database_pool_controllers import DatabasePoolControllers
+
+class TestApp(unittest.TestCase):
+    
+    """
+    Unit tests for the application factory.
+
+    This test suite covers:
+    - Starting and closing the database pool through the lifespan.
+    - Sharing the lifespan pool with the controllers through dependency injection.
+    """
+    
+    def setUp (
+        self,
+    ) -> None:
+        
+        self.app = create_app()
+
+        startup = patch.object(DatabasePoolControllers, 'startup_event', AsyncMock())
+        shutdown = patch.object(DatabasePoolControllers, 'shutdown_event', AsyncMock())
+        self.startup_event = startup.start()
+        self.shutdown_event = shutdown.start()
+        self.addCleanup(patch.stopall)
+
+    def test_lifespan_manages_pool (
+        self,
+    ) -> None:
+        
+        async def run_lifespan ():
+            async with self.app.router.lifespan_context(self.app):
+                self.startup_event.assert_awaited_once()
+                self.shutdown_event.assert_not_awaited()
+                self.assertIsInstance(self.app.state.db_pool, DatabasePoolControllers)
+
+        asyncio.run(run_lifespan())
+        self.shutdown_event.assert_awaited_once()
+
+    def test_controllers_share_lifespan_pool (
+        self,
+    ) -> None:
+        
+        async def resolve_controllers ():
+            async with self.app.router.lifespan_context(self.app):
+                request = Request({'type': 'http', 'app': self.app})
+                return [get_house_controller(get_db_pool(request)) for _ in range(2)]
+
+        controllers = asyncio.run(resolve_controllers())
+        self.assertIs(controllers[0].db, self.app.state.db_pool)
+        self.assertIs(controllers[1].db, self.app.state.db_pool)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import asyncio
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from controllers.health_controller.health_controller import HealthController
+from modules.database.database_pool.database_pool_controllers import DatabasePoolControllers
+
+class TestHealthController(unittest.TestCase):
+    
+    """
+    Unit tests for the HealthController class.
+
+    This test suite covers:
+    - Answering the liveness probe without touching the database.
+    - Reporting readiness and pool utilisation.
+    - Caching the readiness check between probes.
+    - Reporting a pool without usable connections as not ready.
+    - Starting without a database and completing the startup once it is reachable.
+    """
+    
+    def setUp (
+        self,
+    ) -> None:
+        
+        self.db = DatabasePoolControllers()
+        self.db.logger = MagicMock()
+        self.db.started = True
+        self.controller = HealthController(self.db)
+
+    def test_health_without_io (
+        self,
+    ) -> None:
+        
+        controller = HealthController(MagicMock(spec=DatabasePoolControllers))
+
+        response = asyncio.run(controller.health())
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.body, b'{"STATUS":"ALIVE"}')
+        self.assertEqual(controller.db.method_calls, [])
+
+    @patch('controllers.health_controller.health_controller.DatabasePoolControllers.get_connection')
+    def test_ready_is_cached (
+        self, 
+        mock_get_connection,
+    ) -> None:
+        
+        first = self.controller.ready()
+        second = self.controller.ready()
+
+        self.assertEqual(first.status_code, 200)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(json.loads(first.body)['STATUS'], 'READY')
+        self.assertEqual(set(json.loads(first.body)['POOL']), {'min', 'max', 'in_use', 'idle'})
+        mock_get_connection.assert_called_once()
+
+    @patch('controllers.health_controller.health_controller.DatabasePoolControllers.get_connection')
+    def test_not_ready_without_connection (
+        self, 
+        mock_get_connection,
+    ) -> None:
+        
+        mock_get_connection.side_effect = Exception('connection pool exhausted')
+
+        response = self.controller.ready()
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(json.loads(response.body)['STATUS'], 'NOT READY')
+
+    @patch('modules.database.database.database.Database.connect')
+    def test_startup_without_database (
+        self, 
+        mock_connect,
+    ) -> None:
+        
+        self.db.started = False
+        mock_connect.side_effect = Exception('could not connect to server')
+
+        asyncio.run(self.db.startup_event())
+        response = self.controller.ready()
+
+        self.assertFalse(self.db.started)
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(json.loads(response.body)['STATUS'], 'NOT READY')
+
+    @patch('controllers.health_controller.health_controller.DatabasePoolControllers.get_connection')
+    @patch('controllers.health_controller.health_controller.DatabasePoolControllers.start')
+    def test_ready_completes_deferred_startup (
+        self, 
+        mock_start,
+        mock_get_connection,
+    ) -> None:
+        
+        self.db.started = False
+
+        response = self.controller.ready()
+
+        self.assertEqual(response.status_code, 200)
+        mock_start.assert_called_once_with(self.db.get_db())
+
+    @patch('controllers.health_controller.health_controller.DatabasePoolControllers.get_connection')
+    def test_concurrent_probes_share_one_check (
+        self, 
+        mock_get_connection,
+    ) -> None:
+        
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            responses = list(executor.map(lambda _: self.controller.ready(), range(32)))
+
+        self.assertEqual({response.status_code for response in responses}, {200})
+        mock_get_connection.assert_called_once()
+
+if __name__ == "__main__":
+    unittest.main()
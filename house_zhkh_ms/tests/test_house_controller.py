@@ -1,9 +1,12 @@
+import asyncio
+import json
 import unittest
+from datetime import date
 from unittest.mock import patch, MagicMock
 from fastapi.responses import JSONResponse
 
 from controllers.house_controller.house_controller import HouseController
-from house_zhkh_ms.modules.database.database_pool.database_pool_controllers import DatabasePoolControllers
+from modules.database.database_pool.database_pool_controllers import DatabasePoolControllers
 from house_factory.house_factory import HouseFactory
 
 class TestHouseController(unittest.TestCase):
@@ -22,8 +25,7 @@ class TestHouseController(unittest.TestCase):
         self,
     ) -> None:
         
-        self.controller = HouseController()
-        self.controller.db = MagicMock(spec=DatabasePoolControllers)
+        self.controller = HouseController(DatabasePoolControllers())
         self.controller.house_factory = MagicMock(spec=HouseFactory)
         self.controller.logger = MagicMock()
     
@@ -38,13 +40,14 @@ class TestHouseController(unittest.TestCase):
         mock_get_connection.return_value.__enter__.return_value = mock_conn
         mock_conn.cursor.return_value = mock_cursor
         
-        mock_cursor.fetchall.return_value = [(1, 2, '101', 2, 50.0, 3, 'Electric', 100, 4, '2024-01-01', 99, 5, 'John Doe', 30, 500.0)]
-        self.controller.house_factory.create_house.return_value = {'id': 1, 'street': 'Main St'}
+        mock_cursor.fetchall.return_value = [(1, 2, '101', 2, 50.0, 3, 'Electric', 100, 4, date(2024, 1, 1), 99, 5, 'John Doe', 30, 500.0)]
+        self.controller.house_factory = HouseFactory()
         
-        response = self.controller.get('Main St')
+        response = asyncio.run(self.controller.get('Main St'))
         self.assertIsInstance(response, JSONResponse)
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(response.body, b'{"STATUS":"SUCCESS","HOUSE INFO":{"id":1,"street":"Main St"}}')
+        self.assertEqual(json.loads(response.body)['STATUS'], 'SUCCESS')
+        self.assertIn(b'"date":"2024-01-01"', response.body)
     
     @patch('controllers.house_controller.house_controller.DatabasePoolControllers.get_connection')
     def test_get_house_not_found (
@@ -59,7 +62,7 @@ class TestHouseController(unittest.TestCase):
         
         mock_cursor.fetchall.return_value = []
         
-        response = self.controller.get('Unknown St')
+        response = asyncio.run(self.controller.get('Unknown St'))
         self.assertIsInstance(response, JSONResponse)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.body, b'{"STATUS":"FAILED","MESSAGE":"House not found"}')
@@ -77,7 +80,7 @@ class TestHouseController(unittest.TestCase):
         
         mock_cursor.fetchone.return_value = [1]
         
-        response = self.controller.create('New St')
+        response = asyncio.run(self.controller.create('New St'))
         self.assertIsInstance(response, JSONResponse)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.body, b'{"STATUS":"SUCCESS","HOUSE_ID":1}')
@@ -90,10 +93,24 @@ class TestHouseController(unittest.TestCase):
         
         mock_get_connection.side_effect = Exception('Database error')
         
-        response = self.controller.create('Error St')
+        response = asyncio.run(self.controller.create('Error St'))
         self.assertIsInstance(response, JSONResponse)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.body, b'{"STATUS":"FAILED","MESSAGE":"Internal Server Error"}')
+    
+    def test_history_params_latest_only (
+        self,
+    ) -> None:
+        
+        params = self.controller._history_params(None, date(2024, 1, 1), date(2024, 6, 30), True)
+        self.assertEqual(params, {'date_from': date(2024, 1, 1), 'date_to': date(2024, 6, 30), 'history_limit': 1})
+    
+    def test_history_params_invalid_window (
+        self,
+    ) -> None:
+        
+        with self.assertRaises(ValueError):
+            self.controller._history_params(None, date(2024, 6, 1), date(2024, 1, 1), False)
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,68 @@
+import os
+import re
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+SERVICE_PATH = Path(__file__).resolve().parents[1]
+IMPORT_TIME = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$')
+
+# Cumulative import time budget of `main.main`, in milliseconds. Most of it is FastAPI and
+# pydantic; raise it through the environment on slow CI runners rather than editing it here.
+IMPORT_TIME_BUDGET_MS = int(os.getenv('IMPORT_TIME_BUDGET_MS', 1500))
+
+# Modules that are only needed once the application serves requests or is launched.
+LAZY_MODULES = ('psycopg2', 'logstash', 'uvicorn', 'django')
+
+class TestImportTime(unittest.TestCase):
+    
+    """
+    Cold start regression test for the application import.
+
+    This test suite covers:
+    - The database driver, the Logstash handler and the server not being imported with the app.
+    - The cumulative import time of the app staying within budget.
+    """
+    
+    @classmethod
+    def setUpClass (
+        cls,
+    ) -> None:
+        
+        env = {
+            **os.environ,
+            'PYTHONPATH': str(SERVICE_PATH),
+        }
+        result = subprocess.run (
+            [sys.executable, '-X', 'importtime', '-c', 'import main.main'], 
+            cwd=SERVICE_PATH, 
+            env=env, 
+            capture_output=True, 
+            text=True, 
+            check=True,
+        )
+
+        cls.cumulative_us = {}
+        for line in result.stderr.splitlines():
+            match = IMPORT_TIME.match(line)
+            if match:
+                cls.cumulative_us[match.group(4)] = int(match.group(2))
+
+    def test_heavy_modules_imported_lazily (
+        self,
+    ) -> None:
+        
+        imported = sorted (
+            module for module in self.cumulative_us if module.split('.')[0] in LAZY_MODULES
+        )
+        self.assertEqual(imported, [])
+
+    def test_import_time_within_budget (
+        self,
+    ) -> None:
+        
+        self.assertLess(self.cumulative_us['main.main'] / 1000, IMPORT_TIME_BUDGET_MS)
+
+if __name__ == "__main__":
+    unittest.main()
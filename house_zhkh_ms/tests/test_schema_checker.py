@@ -0,0 +1,49 @@
+import unittest
+from pathlib import Path
+
+from modules.database.queries.house_queries import HOUSE_QUERIES
+from modules.database.queries.query import Query
+from modules.database.schema_checker.schema_checker import SchemaChecker, SchemaMismatchError
+
+CORE_PATH = Path(__file__).resolve().parents[2] / 'house_zhkh_core'
+
+class TestSchemaChecker(unittest.TestCase):
+    
+    """
+    Unit tests for the SchemaChecker class.
+
+    This test suite covers:
+    - The service queries matching the schema built from the Django migrations.
+    - Reporting columns that do not exist in the schema.
+    """
+    
+    @classmethod
+    def setUpClass (
+        cls,
+    ) -> None:
+        
+        cls.schema = SchemaChecker.migration_schema(CORE_PATH)
+
+    def test_house_queries_match_migrations (
+        self,
+    ) -> None:
+        
+        SchemaChecker(HOUSE_QUERIES).check(self.schema)
+
+    def test_missing_columns_reported (
+        self,
+    ) -> None:
+        
+        drifted = Query (
+            name='drifted', 
+            sql='SELECT count FROM base_counter WHERE corresponding_flat_id = %(flat_id)s', 
+            columns={'base_counter': ('count', 'corresponding_flat_id'), 'base_flat': ('id',)},
+        )
+        checker = SchemaChecker([drifted])
+
+        self.assertEqual(checker.missing_columns(self.schema), ['drifted: base_counter.count', 'drifted: base_counter.corresponding_flat_id'])
+        with self.assertRaises(SchemaMismatchError):
+            checker.check(self.schema)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+from datetime import date
+from unittest.mock import MagicMock, call
+
+from psycopg2 import errors
+
+from modules.database.queries.house_queries import HOUSE_INFO
+from modules.database.statement_cache.statement_cache import StatementCache
+
+class TestStatementCache(unittest.TestCase):
+    
+    """
+    Unit tests for the StatementCache class.
+
+    This test suite covers:
+    - Translating named placeholders to positional parameters.
+    - Preparing a statement once per session and executing it afterwards.
+    - Forgetting prepared statements once the session was reset.
+    """
+    
+    def setUp (
+        self,
+    ) -> None:
+        
+        self.cache = StatementCache()
+        self.cursor = MagicMock()
+        self.params = {
+            'house_street': 'Main St',
+            'date_from': date(2024, 1, 1),
+            'date_to': date(2024, 6, 30),
+            'history_limit': None,
+        }
+
+    def test_positional_params (
+        self,
+    ) -> None:
+        
+        self.assertNotIn('%(', HOUSE_INFO.positional_sql)
+        self.assertIn('WHERE bb.address = $4', HOUSE_INFO.positional_sql)
+        self.assertEqual(HOUSE_INFO.positional_params(self.params), (date(2024, 1, 1), date(2024, 6, 30), None, 'Main St'))
+
+    def test_prepares_once (
+        self,
+    ) -> None:
+        
+        self.cache.execute(self.cursor, HOUSE_INFO, self.params)
+        self.cache.execute(self.cursor, HOUSE_INFO, self.params)
+
+        execute = call('EXECUTE house_info (%s, %s, %s, %s)', (date(2024, 1, 1), date(2024, 6, 30), None, 'Main St'))
+        self.assertEqual(self.cursor.execute.call_args_list, [call(f'PREPARE house_info AS {HOUSE_INFO.positional_sql}'), execute, execute])
+
+    def test_reset_session_prepares_again (
+        self,
+    ) -> None:
+        
+        self.cache.execute(self.cursor, HOUSE_INFO, self.params)
+        self.cursor.execute.side_effect = errors.InvalidSqlStatementName
+
+        with self.assertRaises(errors.InvalidSqlStatementName):
+            self.cache.execute(self.cursor, HOUSE_INFO, self.params)
+
+        self.assertEqual(self.cache.prepared, set())
+
+if __name__ == "__main__":
+    unittest.main()